@@ -19,21 +19,48 @@
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 
+from typing import NamedTuple
 from cmk.agent_based.v2 import (
+    AgentSection,
     CheckPlugin,
     Metric,
+    render,
     Result,
     Service,
     State,
 )
 
+TOP_ENDPOINTS = 5
 
-def discovery_dell_storage_agent(section):
-    if len(section) > 0:
+
+class Endpoint(NamedTuple):
+    name: str
+    count: int
+    total: float
+    max: float
+    p95: float
+    size: int
+    decode: float
+
+
+def parse_dell_storage_agent_endpoints(string_table):
+    return {line[0]: Endpoint(line[0], int(line[1]), *map(float, line[2:5]), int(line[5]), float(line[6]))
+            for line in string_table}
+
+
+agent_section_dell_storage_agent_endpoints = AgentSection(
+    name='dell_storage_agent_endpoints',
+    parse_function=parse_dell_storage_agent_endpoints,
+)
+
+
+def discovery_dell_storage_agent(section_dell_storage_agent, section_dell_storage_agent_endpoints=None):
+    if section_dell_storage_agent:
         yield Service()
 
 
-def check_dell_storage_agent(section):
+def check_dell_storage_agent(section_dell_storage_agent, section_dell_storage_agent_endpoints=None):
+    section = section_dell_storage_agent
     state, provider, version, time, requests, exc = section[0]
 
     if state == '0':
@@ -44,10 +71,45 @@ def check_dell_storage_agent(section):
 
     yield Metric('time', float(time))
 
+    for line in section[1:]:
+        if line[0] == 'cache':
+            hits, misses = line[1:3]
+            yield Result(state=State.OK, notice=f'Cache hits: {hits}, misses: {misses}')
+            yield Metric('dell_storage_cache_hits', float(hits))
+            yield Metric('dell_storage_cache_misses', float(misses))
+        elif line[0] == 'connections':
+            new, reused = line[1:3]
+            yield Result(state=State.OK, notice=f'Connections new: {new}, reused: {reused}')
+            yield Metric('dell_storage_connections_new', float(new))
+            yield Metric('dell_storage_connections_reused', float(reused))
+        elif line[0] == 'duplicates':
+            yield Result(state=State.OK, notice=f'Duplicate objects: {line[1]}')
+            yield Metric('dell_storage_duplicates', float(line[1]))
+        elif line[0] == 'storage_center':
+            name, error = line[1], ';'.join(line[2:])
+            yield Result(state=State.WARN, summary=f'Storage Center {name} failed: {error}')
+        elif line[0] == 'skipped_sections':
+            sections = ', '.join(section.removeprefix('dell_storage_') for section in line[1:])
+            yield Result(state=State.OK, summary=f'Skipped sections: {sections}')
+        elif line[0] == 'partial':
+            yield Result(state=State.WARN, summary=f'Partial output, {line[1]} associations skipped after the deadline')
+
+    endpoints = sorted((section_dell_storage_agent_endpoints or {}).values(), key=lambda e: e.total, reverse=True)
+    # The metrics are kept by rank, the endpoint behind a rank is named in the details.
+    for rank, endpoint in enumerate(endpoints[:TOP_ENDPOINTS], 1):
+        yield Result(state=State.OK, notice=(
+            f'#{rank} {endpoint.name}: {endpoint.count} calls, total {render.timespan(endpoint.total)}, '
+            f'max {render.timespan(endpoint.max)}, p95 {render.timespan(endpoint.p95)}, '
+            f'{render.bytes(endpoint.size)}, decode {render.timespan(endpoint.decode)}'
+        ))
+        yield Metric(f'dell_storage_endpoint_top{rank}_time', endpoint.total)
+        yield Metric(f'dell_storage_endpoint_top{rank}_p95', endpoint.p95)
+
 
 check_plugin_dell_storage_agent = CheckPlugin(
     name='dell_storage_agent',
     service_name='Dell Storage API',
+    sections=['dell_storage_agent', 'dell_storage_agent_endpoints'],
     discovery_function=discovery_dell_storage_agent,
     check_function=check_dell_storage_agent,
 )
@@ -19,7 +19,7 @@
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 
-from typing import NamedTuple
+from typing import NamedTuple, Optional
 from cmk.agent_based.v2 import (
     AgentSection,
     check_levels,
@@ -31,7 +31,8 @@ from cmk.agent_based.v2 import (
     State,
 )
 from cmk_addons.plugins.dell_storage.lib.dell_storage import (
-    DSResult
+    DSResult,
+    DSSection,
 )
 
 
@@ -43,21 +44,21 @@ class StorageCenter(NamedTuple):
     version: str
     serviceTag: str
     serialNumber: str
-    numberOfControllers: int
-    numberOfDevicesInUse: int
-    numberOfDisks: int
-    numberOfLiveVolumes: int
-    numberOfReplays: int
-    numberOfReplications: int
-    numberOfServers: int
-    numberOfVolumes: int
-    spaceAvailable: int
-    spaceAllocated: int
-    spaceUsed: int
+    numberOfControllers: Optional[int]
+    numberOfDevicesInUse: Optional[int]
+    numberOfDisks: Optional[int]
+    numberOfLiveVolumes: Optional[int]
+    numberOfReplays: Optional[int]
+    numberOfReplications: Optional[int]
+    numberOfServers: Optional[int]
+    numberOfVolumes: Optional[int]
+    spaceAvailable: Optional[int]
+    spaceAllocated: Optional[int]
+    spaceUsed: Optional[int]
 
 
 def parse_dell_storage_center(string_table):
-    return [StorageCenter(*sc) for sc in string_table]
+    return DSSection(StorageCenter, string_table)
 
 
 agent_section_dell_storage_center = AgentSection(
@@ -67,54 +68,50 @@ agent_section_dell_storage_center = AgentSection(
 
 
 def discovery_dell_storage_center(section):
-    for sc in section:
-        yield Service(item=sc.name)
+    for item in section:
+        yield Service(item=item)
 
 
 def check_dell_storage_center(item, section):
-    for sc in section:
-        if not sc.name == item:
-            continue
+    sc = section.get(item)
+    if sc is None:
+        return
 
-        yield from DSResult(sc)
+    yield from DSResult(sc)
 
-        yield Result(state=State.OK, summary=f'Model: {sc.modelSeries} v{sc.version}')
-        yield Result(state=State.OK, summary=f'ST: {sc.serviceTag}')
-        yield Result(state=State.OK, summary=f'SN: {sc.serialNumber}')
-
-        yield from check_levels(
-            value=float(sc.spaceAvailable),
-            metric_name='space_available',
-            label='Available',
-            render_func=render.disksize
-        )
-
-        yield from check_levels(
-            value=float(sc.spaceUsed),
-            metric_name='space_used',
-            boundaries=(0, float(sc.spaceAllocated)),
-            label='Used',
-            render_func=render.disksize
-        )
+    yield Result(state=State.OK, summary=f'Model: {sc.modelSeries} v{sc.version}')
+    yield Result(state=State.OK, summary=f'ST: {sc.serviceTag}')
+    yield Result(state=State.OK, summary=f'SN: {sc.serialNumber}')
 
+    # The space and the object counts are missing if the DSM did not report
+    # the storage or object usage of the Storage Center.
+    for metric, label, value, maximum in (
+        ('space_available', 'Available', sc.spaceAvailable, None),
+        ('space_used', 'Used', sc.spaceUsed, sc.spaceAllocated),
+        ('space_allocated', 'Allocated', sc.spaceAllocated, sc.spaceAvailable),
+    ):
+        if value is None:
+            continue
         yield from check_levels(
-            value=float(sc.spaceAllocated),
-            metric_name='space_allocated',
-            boundaries=(0, float(sc.spaceAvailable)),
-            label='Allocated',
+            value=float(value),
+            metric_name=metric,
+            boundaries=None if maximum is None else (0, float(maximum)),
+            label=label,
             render_func=render.disksize
         )
 
-        yield Metric('controller', float(sc.numberOfControllers))
-        yield Metric('device', float(sc.numberOfDevicesInUse))
-        yield Metric('disk', float(sc.numberOfDisks))
-        yield Metric('live_volume', float(sc.numberOfLiveVolumes))
-        yield Metric('replay', float(sc.numberOfReplays))
-        yield Metric('replication', float(sc.numberOfReplications))
-        yield Metric('server', float(sc.numberOfServers))
-        yield Metric('volume', float(sc.numberOfVolumes))
-
-        return
+    for metric, value in (
+        ('controller', sc.numberOfControllers),
+        ('device', sc.numberOfDevicesInUse),
+        ('disk', sc.numberOfDisks),
+        ('live_volume', sc.numberOfLiveVolumes),
+        ('replay', sc.numberOfReplays),
+        ('replication', sc.numberOfReplications),
+        ('server', sc.numberOfServers),
+        ('volume', sc.numberOfVolumes),
+    ):
+        if value is not None:
+            yield Metric(metric, float(value))
 
 
 check_plugin_dell_storage_center = CheckPlugin(
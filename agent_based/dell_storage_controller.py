@@ -28,7 +28,8 @@ from cmk.agent_based.v2 import (
     State,
 )
 from cmk_addons.plugins.dell_storage.lib.dell_storage import (
-    DSResult
+    DSResult,
+    DSSection,
 )
 
 
@@ -46,7 +47,7 @@ class ScController(NamedTuple):
 
 
 def parse_dell_storage_controller(string_table):
-    return [ScController(*ctrl) for ctrl in string_table]
+    return DSSection(ScController, string_table)
 
 
 agent_section_dell_storage_controller = AgentSection(
@@ -56,22 +57,20 @@ agent_section_dell_storage_controller = AgentSection(
 
 
 def discovery_dell_storage_controller(section):
-    for sc in section:
-        yield Service(item=sc.name)
+    for item in section:
+        yield Service(item=item)
 
 
 def check_dell_storage_controller(item, section):
-    for ctrl in section:
-        if not ctrl.name == item:
-            continue
-
-        yield from DSResult(ctrl)
+    ctrl = section.get(item)
+    if ctrl is None:
+        return
 
-        yield Result(state=State.OK, summary=f'Model: {ctrl.modelSeries} v{ctrl.version}')
-        yield Result(state=State.OK, summary=f'ST: {ctrl.serviceTag}')
-        yield Result(state=State.OK, summary=f'SN: {ctrl.serialNumber}')
+    yield from DSResult(ctrl)
 
-        return
+    yield Result(state=State.OK, summary=f'Model: {ctrl.modelSeries} v{ctrl.version}')
+    yield Result(state=State.OK, summary=f'ST: {ctrl.serviceTag}')
+    yield Result(state=State.OK, summary=f'SN: {ctrl.serialNumber}')
 
 
 check_plugin_dell_storage_controller = CheckPlugin(
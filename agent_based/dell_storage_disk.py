@@ -20,7 +20,7 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 
 import time
-from typing import NamedTuple
+from typing import NamedTuple, Optional
 from cmk.agent_based.v2 import (
     AgentSection,
     CheckPlugin,
@@ -30,7 +30,10 @@ from cmk.agent_based.v2 import (
 )
 from cmk.plugins.lib import diskstat
 from cmk_addons.plugins.dell_storage.lib.dell_storage import (
-    DSResult
+    DSColumns,
+    DSIo,
+    DSLatencyPeak,
+    DSResult,
 )
 
 
@@ -38,18 +41,30 @@ class ScDisk(NamedTuple):
     name: str
     status: str
     statusMessage: str
-    allocatedSpace: str
-    totalSpace: str
-    readIops: str
-    readBps: str
-    readLatency: str
-    writeIops: str
-    writeBps: str
-    writeLatency: str
+    allocatedSpace: Optional[int]
+    totalSpace: Optional[int]
+    readIops: Optional[float]
+    readBps: Optional[float]
+    readLatency: Optional[float]
+    writeIops: Optional[float]
+    writeBps: Optional[float]
+    writeLatency: Optional[float]
+    readIopsMin: Optional[float] = None
+    readIopsMax: Optional[float] = None
+    readBpsMin: Optional[float] = None
+    readBpsMax: Optional[float] = None
+    readLatencyMin: Optional[float] = None
+    readLatencyMax: Optional[float] = None
+    writeIopsMin: Optional[float] = None
+    writeIopsMax: Optional[float] = None
+    writeBpsMin: Optional[float] = None
+    writeBpsMax: Optional[float] = None
+    writeLatencyMin: Optional[float] = None
+    writeLatencyMax: Optional[float] = None
 
 
 def parse_dell_storage_disk(string_table):
-    return [ScDisk(*disk) for disk in string_table]
+    return DSColumns(ScDisk, string_table)
 
 
 agent_section_dell_storage_disk = AgentSection(
@@ -59,40 +74,30 @@ agent_section_dell_storage_disk = AgentSection(
 
 
 def discovery_dell_storage_disk(section):
-    for disk in section:
-        yield Service(item=disk.name)
+    for item in section:
+        yield Service(item=item)
 
 
 def check_dell_storage_disk(item, params, section):
-    for disk in section:
-        if not disk.name == item:
-            continue
+    disk = section.get(item)
+    if disk is None:
+        return
 
-        yield from DSResult(disk)
+    yield from DSResult(disk)
 
+    if disk.allocatedSpace is not None:
         yield Metric('usage',
-                     int(disk.allocatedSpace),
-                     boundaries=(0, int(disk.totalSpace)))
-
-        value_store = get_value_store()
-        try:
-            yield from diskstat.check_diskstat_dict(
-                params=params,
-                disk={
-                    'read_ios': int(disk.readIops),
-                    'read_throughput': int(disk.readBps),
-                    'read_latency': float(disk.readLatency),
-                    'write_ios': int(disk.writeIops),
-                    'write_throughput': int(disk.writeBps),
-                    'write_latency': float(disk.writeLatency),
-                },
-                value_store=value_store,
-                this_time=time.time(),
-            )
-        except ValueError:
-            pass
+                     disk.allocatedSpace,
+                     boundaries=(0, disk.totalSpace))
 
-        return
+    iousage = DSIo(disk)
+    if iousage is not None:
+        yield from diskstat.check_diskstat_dict(
+            params=params,
+            disk=iousage,
+            value_store=get_value_store(),
+            this_time=time.time(),
+        )
 
 
 check_plugin_dell_storage_disk = CheckPlugin(
@@ -103,3 +108,28 @@ check_plugin_dell_storage_disk = CheckPlugin(
     check_ruleset_name='diskstat',
     check_default_parameters={},
 )
+
+
+def discovery_dell_storage_disk_latency_peak(section):
+    for item, disk in section.items():
+        if disk.readLatencyMax is not None or disk.writeLatencyMax is not None:
+            yield Service(item=item)
+
+
+def check_dell_storage_disk_latency_peak(item, params, section):
+    disk = section.get(item)
+    if disk is None:
+        return
+
+    yield from DSLatencyPeak(disk, params)
+
+
+check_plugin_dell_storage_disk_latency_peak = CheckPlugin(
+    name='dell_storage_disk_latency_peak',
+    sections=['dell_storage_disk'],
+    service_name='Disk %s Latency Peak',
+    discovery_function=discovery_dell_storage_disk_latency_peak,
+    check_function=check_dell_storage_disk_latency_peak,
+    check_ruleset_name='dell_storage_latency_peak',
+    check_default_parameters={},
+)
@@ -28,7 +28,8 @@ from cmk.agent_based.v2 import (
     State,
 )
 from cmk_addons.plugins.dell_storage.lib.dell_storage import (
-    DSResult
+    DSResult,
+    DSSection,
 )
 
 
@@ -45,7 +46,7 @@ class ScEnclosure(NamedTuple):
 
 
 def parse_dell_storage_enclosure(string_table):
-    return [ScEnclosure(*enc) for enc in string_table]
+    return DSSection(ScEnclosure, string_table)
 
 
 agent_section_dell_storage_enclosure = AgentSection(
@@ -55,24 +56,22 @@ agent_section_dell_storage_enclosure = AgentSection(
 
 
 def discovery_dell_storage_enclosure(section):
-    for enc in section:
-        yield Service(item=enc.name)
+    for item in section:
+        yield Service(item=item)
 
 
 def check_dell_storage_enclosure(item, section):
-    for enc in section:
-        if not enc.name == item:
-            continue
-
-        yield from DSResult(enc)
+    enc = section.get(item)
+    if enc is None:
+        return
 
-        yield Result(state=State.OK, summary=f'Model: {enc.modelSeries} v{enc.version}, Type{enc.encType}')
-        yield Result(state=State.OK, summary=f'Capacity: {enc.capacity}')
+    yield from DSResult(enc)
 
-        yield Result(state=State.OK, summary=f'ST: {enc.serviceTag}')
-        yield Result(state=State.OK, summary=f'ESC: {enc.expressServiceCode}')
+    yield Result(state=State.OK, summary=f'Model: {enc.modelSeries} v{enc.version}, Type{enc.encType}')
+    yield Result(state=State.OK, summary=f'Capacity: {enc.capacity}')
 
-        return
+    yield Result(state=State.OK, summary=f'ST: {enc.serviceTag}')
+    yield Result(state=State.OK, summary=f'ESC: {enc.expressServiceCode}')
 
 
 check_plugin_dell_storage_enclosure = CheckPlugin(
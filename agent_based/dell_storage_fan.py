@@ -29,7 +29,8 @@ from cmk.agent_based.v2 import (
 )
 from cmk.agent_based.v1 import check_levels
 from cmk_addons.plugins.dell_storage.lib.dell_storage import (
-    DSResult
+    DSResult,
+    DSSection,
 )
 
 
@@ -48,7 +49,7 @@ class ScFan(NamedTuple):
 
 
 def parse_dell_storage_fan(string_table):
-    return [ScFan(*fan) for fan in string_table]
+    return DSSection(ScFan, string_table)
 
 
 agent_section_dell_storage_fan = AgentSection(
@@ -58,30 +59,28 @@ agent_section_dell_storage_fan = AgentSection(
 
 
 def discovery_dell_storage_fan(section):
-    for fan in section:
-        yield Service(item=fan.name)
+    for item in section:
+        yield Service(item=item)
 
 
 def check_dell_storage_fan(item, params, section):
-    for fan in section:
-        if not fan.name == item:
-            continue
-
-        yield from DSResult(fan)
-        yield Result(state=State.OK, summary=fan.location)
-
-        if fan.currentRpm:
-            yield from check_levels(
-                value=int(fan.currentRpm),
-                metric_name='fan' if params.get('output_metrics', True) else None,
-                levels_lower=params.get('lower', (int(fan.lowerNormalThreshold), int(fan.lowerWarningThreshold))),
-                levels_upper=params.get('upper', (int(fan.upperNormalThreshold), int(fan.upperWarningThreshold))),
-                boundaries=(int(fan.lowerCriticalThreshold), int(fan.upperCriticalThreshold)),
-                label='Fan Speed',
-            )
-
+    fan = section.get(item)
+    if fan is None:
         return
 
+    yield from DSResult(fan)
+    yield Result(state=State.OK, summary=fan.location)
+
+    if fan.currentRpm is not None:
+        yield from check_levels(
+            value=fan.currentRpm,
+            metric_name='fan' if params.get('output_metrics', True) else None,
+            levels_lower=params.get('lower', (fan.lowerNormalThreshold, fan.lowerWarningThreshold)),
+            levels_upper=params.get('upper', (fan.upperNormalThreshold, fan.upperWarningThreshold)),
+            boundaries=(fan.lowerCriticalThreshold, fan.upperCriticalThreshold),
+            label='Fan Speed',
+        )
+
 
 check_plugin_dell_storage_fan = CheckPlugin(
     name='dell_storage_fan',
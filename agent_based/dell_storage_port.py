@@ -20,7 +20,7 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 
 import time
-from typing import NamedTuple
+from typing import NamedTuple, Optional
 from cmk.agent_based.v2 import (
     AgentSection,
     CheckPlugin,
@@ -31,7 +31,10 @@ from cmk.agent_based.v2 import (
 )
 from cmk.plugins.lib import diskstat
 from cmk_addons.plugins.dell_storage.lib.dell_storage import (
-    DSResult
+    DSColumns,
+    DSIo,
+    DSLatencyPeak,
+    DSResult,
 )
 
 
@@ -42,16 +45,28 @@ class ScPort(NamedTuple):
     cabled: str
     type: str
     wwn: str
-    readIops: str
-    readBps: str
-    readLatency: str
-    writeIops: str
-    writeBps: str
-    writeLatency: str
+    readIops: Optional[float]
+    readBps: Optional[float]
+    readLatency: Optional[float]
+    writeIops: Optional[float]
+    writeBps: Optional[float]
+    writeLatency: Optional[float]
+    readIopsMin: Optional[float] = None
+    readIopsMax: Optional[float] = None
+    readBpsMin: Optional[float] = None
+    readBpsMax: Optional[float] = None
+    readLatencyMin: Optional[float] = None
+    readLatencyMax: Optional[float] = None
+    writeIopsMin: Optional[float] = None
+    writeIopsMax: Optional[float] = None
+    writeBpsMin: Optional[float] = None
+    writeBpsMax: Optional[float] = None
+    writeLatencyMin: Optional[float] = None
+    writeLatencyMax: Optional[float] = None
 
 
 def parse_dell_storage_port(string_table):
-    return [ScPort(*port) for port in string_table]
+    return DSColumns(ScPort, string_table)
 
 
 agent_section_dell_storage_port = AgentSection(
@@ -61,41 +76,30 @@ agent_section_dell_storage_port = AgentSection(
 
 
 def discovery_dell_storage_port(section):
-    for port in section:
-        yield Service(item=port.name)
+    for item in section:
+        yield Service(item=item)
 
 
 def check_dell_storage_port(item, params, section):
-    for port in section:
-        if not port.name == item:
-            continue
-
-        yield from DSResult(port)
-
-        yield Result(state=State.OK, summary=f'Cabled: {port.cabled}')
-        yield Result(state=State.OK, summary=f'Type: {port.type}')
-        yield Result(state=State.OK, summary=f'WWN: {port.wwn}')
-
-        value_store = get_value_store()
-        try:
-            yield from diskstat.check_diskstat_dict(
-                params=params,
-                disk={
-                    'read_ios': int(port.readIops),
-                    'read_throughput': int(port.readBps),
-                    'read_latency': float(port.readLatency),
-                    'write_ios': int(port.writeIops),
-                    'write_throughput': int(port.writeBps),
-                    'write_latency': float(port.writeLatency),
-                },
-                value_store=value_store,
-                this_time=time.time(),
-            )
-        except ValueError:
-            pass
-
+    port = section.get(item)
+    if port is None:
         return
 
+    yield from DSResult(port)
+
+    yield Result(state=State.OK, summary=f'Cabled: {port.cabled}')
+    yield Result(state=State.OK, summary=f'Type: {port.type}')
+    yield Result(state=State.OK, summary=f'WWN: {port.wwn}')
+
+    iousage = DSIo(port)
+    if iousage is not None:
+        yield from diskstat.check_diskstat_dict(
+            params=params,
+            disk=iousage,
+            value_store=get_value_store(),
+            this_time=time.time(),
+        )
+
 
 check_plugin_dell_storage_port = CheckPlugin(
     name='dell_storage_port',
@@ -105,3 +109,28 @@ check_plugin_dell_storage_port = CheckPlugin(
     check_ruleset_name='diskstat',
     check_default_parameters={},
 )
+
+
+def discovery_dell_storage_port_latency_peak(section):
+    for item, port in section.items():
+        if port.readLatencyMax is not None or port.writeLatencyMax is not None:
+            yield Service(item=item)
+
+
+def check_dell_storage_port_latency_peak(item, params, section):
+    port = section.get(item)
+    if port is None:
+        return
+
+    yield from DSLatencyPeak(port, params)
+
+
+check_plugin_dell_storage_port_latency_peak = CheckPlugin(
+    name='dell_storage_port_latency_peak',
+    sections=['dell_storage_port'],
+    service_name='Port %s Latency Peak',
+    discovery_function=discovery_dell_storage_port_latency_peak,
+    check_function=check_dell_storage_port_latency_peak,
+    check_ruleset_name='dell_storage_latency_peak',
+    check_default_parameters={},
+)
@@ -28,7 +28,8 @@ from cmk.agent_based.v2 import (
     State,
 )
 from cmk_addons.plugins.dell_storage.lib.dell_storage import (
-    DSResult
+    DSResult,
+    DSSection,
 )
 
 
@@ -40,7 +41,7 @@ class ScPSU(NamedTuple):
 
 
 def parse_dell_storage_psu(string_table):
-    return [ScPSU(*psu) for psu in string_table]
+    return DSSection(ScPSU, string_table)
 
 
 agent_section_dell_storage_psu = AgentSection(
@@ -50,21 +51,19 @@ agent_section_dell_storage_psu = AgentSection(
 
 
 def discovery_dell_storage_psu(section):
-    for psu in section:
-        yield Service(item=psu.name)
+    for item in section:
+        yield Service(item=item)
 
 
 def check_dell_storage_psu(item, section):
-    for psu in section:
-        if not psu.name == item:
-            continue
-
-        yield from DSResult(psu)
-        if psu.location != 'None':
-            yield Result(state=State.OK, summary=psu.location)
-
+    psu = section.get(item)
+    if psu is None:
         return
 
+    yield from DSResult(psu)
+    if psu.location != 'None':
+        yield Result(state=State.OK, summary=psu.location)
+
 
 check_plugin_dell_storage_psu = CheckPlugin(
     name='dell_storage_psu',
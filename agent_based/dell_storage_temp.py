@@ -31,6 +31,7 @@ from cmk.agent_based.v2 import (
 from cmk.plugins.lib.temperature import check_temperature
 from cmk_addons.plugins.dell_storage.lib.dell_storage import (
     DSResult,
+    DSSection,
 )
 
 
@@ -49,7 +50,7 @@ class ScTemp(NamedTuple):
 
 
 def parse_dell_storage_temp(string_table):
-    return [ScTemp(*temp) for temp in string_table]
+    return DSSection(ScTemp, string_table)
 
 
 agent_section_dell_storage_temp = AgentSection(
@@ -59,30 +60,28 @@ agent_section_dell_storage_temp = AgentSection(
 
 
 def discovery_dell_storage_temp(section):
-    for temp in section:
-        yield Service(item=temp.name)
+    for item in section:
+        yield Service(item=item)
 
 
 def check_dell_storage_temp(item, params, section):
-    for temp in section:
-        if not temp.name == item:
-            continue
-
-        yield from DSResult(temp)
-        if temp.location != 'None':
-            yield Result(state=State.OK, summary=temp.location)
-
-        yield from check_temperature(
-            reading=int(temp.currentTemp),
-            params=params,
-            unique_name="dell_storage_temp.%s" % item,
-            value_store=get_value_store(),
-            dev_levels= (int(temp.upperNormalThreshold), int(temp.upperWarningThreshold)),
-            dev_levels_lower = (int(temp.lowerNormalThreshold), int(temp.lowerWarningThreshold)),
-        )
-
+    temp = section.get(item)
+    if temp is None:
         return
 
+    yield from DSResult(temp)
+    if temp.location != 'None':
+        yield Result(state=State.OK, summary=temp.location)
+
+    yield from check_temperature(
+        reading=temp.currentTemp,
+        params=params,
+        unique_name="dell_storage_temp.%s" % item,
+        value_store=get_value_store(),
+        dev_levels= (temp.upperNormalThreshold, temp.upperWarningThreshold),
+        dev_levels_lower = (temp.lowerNormalThreshold, temp.lowerWarningThreshold),
+    )
+
 
 check_plugin_dell_storage_temp = CheckPlugin(
     name='dell_storage_temp',
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- encoding: utf-8; py-indent-offset: 4 -*-
+#
+# checkmk_dell_storage - Checkmk extension for Dell Storage API
+#
+# Copyright (C) 2021-2024  Marius Rieder <marius.rieder@durchmesser.ch>
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+from cmk.agent_based.v2 import (
+    CheckPlugin,
+    Metric,
+    render,
+    Result,
+    Service,
+    State,
+)
+from cmk_addons.plugins.dell_storage.lib.dell_storage import (
+    DSTop,
+)
+
+CATEGORIES = {
+    'iops': ('operations', lambda value: f'{value:.2f}/s'),
+    'throughput': ('throughput', render.iobandwidth),
+    'latency': ('latency', render.timespan),
+}
+
+
+def discovery_dell_storage_top(section_dell_storage_volume, section_dell_storage_disk):
+    if section_dell_storage_volume or section_dell_storage_disk:
+        yield Service()
+
+
+def check_dell_storage_top(params, section_dell_storage_volume, section_dell_storage_disk):
+    for kind, section in (('volume', section_dell_storage_volume), ('disk', section_dell_storage_disk)):
+        if not section:
+            continue
+
+        for category, (share, rows) in DSTop(section, params['count']).items():
+            label, render_func = CATEGORIES[category]
+            if share is not None:
+                yield Result(state=State.OK, summary=f'Top {len(rows)} {kind}s: {render.percent(share * 100)} of {label}')
+                yield Metric(f'dell_storage_top_{kind}_{category}_share', share * 100, boundaries=(0, 100))
+            top = ', '.join(f'{name} {render_func(value)}' for name, value in rows)
+            yield Result(state=State.OK, notice=f'Top {kind}s by {label}: {top}')
+
+
+check_plugin_dell_storage_top = CheckPlugin(
+    name='dell_storage_top',
+    sections=['dell_storage_volume', 'dell_storage_disk'],
+    service_name='Top IO',
+    discovery_function=discovery_dell_storage_top,
+    check_function=check_dell_storage_top,
+    check_ruleset_name='dell_storage_top',
+    check_default_parameters={'count': 5},
+)
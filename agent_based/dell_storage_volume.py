@@ -20,17 +20,26 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 
 import time
-from typing import NamedTuple
+from typing import NamedTuple, Optional
 from cmk.agent_based.v2 import (
     AgentSection,
+    check_levels,
     CheckPlugin,
     get_value_store,
     Metric,
+    render,
+    Result,
     Service,
+    State,
 )
 from cmk.plugins.lib import diskstat
 from cmk_addons.plugins.dell_storage.lib.dell_storage import (
-    DSResult
+    DSColumns,
+    DSIo,
+    DSLatencyPeak,
+    DSIoTotal,
+    DSLatency,
+    DSResult,
 )
 
 
@@ -38,18 +47,30 @@ class ScVolume(NamedTuple):
     name: str
     status: str
     statusMessage: str
-    activeSpace: str
-    configuredSpace: str
-    readIops: str
-    readBps: str
-    readLatency: str
-    writeIops: str
-    writeBps: str
-    writeLatency: str
+    activeSpace: Optional[int]
+    configuredSpace: Optional[int]
+    readIops: Optional[float]
+    readBps: Optional[float]
+    readLatency: Optional[float]
+    writeIops: Optional[float]
+    writeBps: Optional[float]
+    writeLatency: Optional[float]
+    readIopsMin: Optional[float] = None
+    readIopsMax: Optional[float] = None
+    readBpsMin: Optional[float] = None
+    readBpsMax: Optional[float] = None
+    readLatencyMin: Optional[float] = None
+    readLatencyMax: Optional[float] = None
+    writeIopsMin: Optional[float] = None
+    writeIopsMax: Optional[float] = None
+    writeBpsMin: Optional[float] = None
+    writeBpsMax: Optional[float] = None
+    writeLatencyMin: Optional[float] = None
+    writeLatencyMax: Optional[float] = None
 
 
 def parse_dell_storage_volume(string_table):
-    return [ScVolume(*vol) for vol in string_table]
+    return DSColumns(ScVolume, string_table)
 
 
 agent_section_dell_storage_volume = AgentSection(
@@ -59,40 +80,30 @@ agent_section_dell_storage_volume = AgentSection(
 
 
 def discovery_dell_storage_volume(section):
-    for vol in section:
-        yield Service(item=vol.name)
+    for item in section:
+        yield Service(item=item)
 
 
 def check_dell_storage_volume(item, params, section):
-    for vol in section:
-        if not vol.name == item:
-            continue
+    vol = section.get(item)
+    if vol is None:
+        return
 
-        yield from DSResult(vol)
+    yield from DSResult(vol)
 
+    if vol.activeSpace is not None:
         yield Metric('usage',
-                     int(vol.activeSpace),
-                     boundaries=(0, int(vol.configuredSpace)))
-
-        value_store = get_value_store()
-        try:
-            yield from diskstat.check_diskstat_dict(
-                params=params,
-                disk={
-                    'read_ios': int(vol.readIops),
-                    'read_throughput': int(vol.readBps),
-                    'read_latency': float(vol.readLatency),
-                    'write_ios': int(vol.writeIops),
-                    'write_throughput': int(vol.writeBps),
-                    'write_latency': float(vol.writeLatency),
-                },
-                value_store=value_store,
-                this_time=time.time(),
-            )
-        except ValueError:
-            pass
+                     vol.activeSpace,
+                     boundaries=(0, vol.configuredSpace))
 
-        return
+    iousage = DSIo(vol)
+    if iousage is not None:
+        yield from diskstat.check_diskstat_dict(
+            params=params,
+            disk=iousage,
+            value_store=get_value_store(),
+            this_time=time.time(),
+        )
 
 
 check_plugin_dell_storage_volume = CheckPlugin(
@@ -103,3 +114,95 @@ check_plugin_dell_storage_volume = CheckPlugin(
     check_ruleset_name='diskstat',
     check_default_parameters={},
 )
+
+
+def discovery_dell_storage_volume_latency_peak(section):
+    for item, vol in section.items():
+        if vol.readLatencyMax is not None or vol.writeLatencyMax is not None:
+            yield Service(item=item)
+
+
+def check_dell_storage_volume_latency_peak(item, params, section):
+    vol = section.get(item)
+    if vol is None:
+        return
+
+    yield from DSLatencyPeak(vol, params)
+
+
+check_plugin_dell_storage_volume_latency_peak = CheckPlugin(
+    name='dell_storage_volume_latency_peak',
+    sections=['dell_storage_volume'],
+    service_name='Volume %s Latency Peak',
+    discovery_function=discovery_dell_storage_volume_latency_peak,
+    check_function=check_dell_storage_volume_latency_peak,
+    check_ruleset_name='dell_storage_latency_peak',
+    check_default_parameters={},
+)
+
+
+def discovery_dell_storage_center_io(section):
+    if section:
+        yield Service(item='SUMMARY')
+
+
+def check_dell_storage_center_io(item, params, section):
+    disk, count = DSIoTotal(section)
+    yield Result(state=State.OK, notice=f'Volumes with IO usage: {count} of {len(section)}')
+    if not count:
+        return
+
+    yield from diskstat.check_diskstat_dict(
+        params=params,
+        disk=disk,
+        value_store=get_value_store(),
+        this_time=time.time(),
+    )
+
+
+check_plugin_dell_storage_center_io = CheckPlugin(
+    name='dell_storage_center_io',
+    sections=['dell_storage_volume'],
+    service_name='StorageCenter IO %s',
+    discovery_function=discovery_dell_storage_center_io,
+    check_function=check_dell_storage_center_io,
+    check_ruleset_name='diskstat',
+    check_default_parameters={},
+)
+
+
+def discovery_dell_storage_center_latency(section):
+    if section:
+        yield Service()
+
+
+def check_dell_storage_center_latency(params, section):
+    for op in ('read', 'write'):
+        percentiles, worst = DSLatency(section, op)
+        if not percentiles:
+            yield Result(state=State.OK, notice=f'No volume with {op} operations')
+            continue
+
+        for key, value in percentiles.items():
+            yield from check_levels(
+                value,
+                levels_upper=params.get(f'{op}_{key}'),
+                metric_name=f'dell_storage_{op}_latency_{key}',
+                render_func=render.timespan,
+                label=f'{op.capitalize()} latency {key}',
+                notice_only=key != 'p99',
+            )
+
+        slowest = ', '.join(f'{name} {render.timespan(latency)}' for name, latency in worst)
+        yield Result(state=State.OK, notice=f'Slowest {op} volumes: {slowest}')
+
+
+check_plugin_dell_storage_center_latency = CheckPlugin(
+    name='dell_storage_center_latency',
+    sections=['dell_storage_volume'],
+    service_name='StorageCenter Latency',
+    discovery_function=discovery_dell_storage_center_latency,
+    check_function=check_dell_storage_center_latency,
+    check_ruleset_name='dell_storage_latency',
+    check_default_parameters={},
+)
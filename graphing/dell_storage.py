@@ -103,6 +103,209 @@ metric_dell_storage_volume_usage = metrics.Metric(
     color=metrics.Color.ORANGE,
 )
 
+metric_dell_storage_cache_hits = metrics.Metric(
+    name='dell_storage_cache_hits',
+    title=Title('Cache hits'),
+    unit=metrics.Unit(metrics.DecimalNotation("")),
+    color=metrics.Color.GREEN,
+)
+
+metric_dell_storage_cache_misses = metrics.Metric(
+    name='dell_storage_cache_misses',
+    title=Title('Cache misses'),
+    unit=metrics.Unit(metrics.DecimalNotation("")),
+    color=metrics.Color.ORANGE,
+)
+
+metric_dell_storage_connections_new = metrics.Metric(
+    name='dell_storage_connections_new',
+    title=Title('New connections'),
+    unit=metrics.Unit(metrics.DecimalNotation("")),
+    color=metrics.Color.ORANGE,
+)
+
+metric_dell_storage_connections_reused = metrics.Metric(
+    name='dell_storage_connections_reused',
+    title=Title('Reused connections'),
+    unit=metrics.Unit(metrics.DecimalNotation("")),
+    color=metrics.Color.GREEN,
+)
+
+metric_dell_storage_duplicates = metrics.Metric(
+    name='dell_storage_duplicates',
+    title=Title('Duplicate objects'),
+    unit=metrics.Unit(metrics.DecimalNotation("")),
+    color=metrics.Color.BLUE,
+)
+
+metric_dell_storage_endpoint_top1_time = metrics.Metric(
+    name='dell_storage_endpoint_top1_time',
+    title=Title('Slowest endpoint, total time'),
+    unit=metrics.Unit(metrics.TimeNotation()),
+    color=metrics.Color.RED,
+)
+
+metric_dell_storage_endpoint_top1_p95 = metrics.Metric(
+    name='dell_storage_endpoint_top1_p95',
+    title=Title('Slowest endpoint, 95th percentile'),
+    unit=metrics.Unit(metrics.TimeNotation()),
+    color=metrics.Color.LIGHT_RED,
+)
+
+metric_dell_storage_endpoint_top2_time = metrics.Metric(
+    name='dell_storage_endpoint_top2_time',
+    title=Title('2nd slowest endpoint, total time'),
+    unit=metrics.Unit(metrics.TimeNotation()),
+    color=metrics.Color.ORANGE,
+)
+
+metric_dell_storage_endpoint_top2_p95 = metrics.Metric(
+    name='dell_storage_endpoint_top2_p95',
+    title=Title('2nd slowest endpoint, 95th percentile'),
+    unit=metrics.Unit(metrics.TimeNotation()),
+    color=metrics.Color.LIGHT_ORANGE,
+)
+
+metric_dell_storage_endpoint_top3_time = metrics.Metric(
+    name='dell_storage_endpoint_top3_time',
+    title=Title('3rd slowest endpoint, total time'),
+    unit=metrics.Unit(metrics.TimeNotation()),
+    color=metrics.Color.YELLOW,
+)
+
+metric_dell_storage_endpoint_top3_p95 = metrics.Metric(
+    name='dell_storage_endpoint_top3_p95',
+    title=Title('3rd slowest endpoint, 95th percentile'),
+    unit=metrics.Unit(metrics.TimeNotation()),
+    color=metrics.Color.LIGHT_YELLOW,
+)
+
+metric_dell_storage_endpoint_top4_time = metrics.Metric(
+    name='dell_storage_endpoint_top4_time',
+    title=Title('4th slowest endpoint, total time'),
+    unit=metrics.Unit(metrics.TimeNotation()),
+    color=metrics.Color.GREEN,
+)
+
+metric_dell_storage_endpoint_top4_p95 = metrics.Metric(
+    name='dell_storage_endpoint_top4_p95',
+    title=Title('4th slowest endpoint, 95th percentile'),
+    unit=metrics.Unit(metrics.TimeNotation()),
+    color=metrics.Color.LIGHT_GREEN,
+)
+
+metric_dell_storage_endpoint_top5_time = metrics.Metric(
+    name='dell_storage_endpoint_top5_time',
+    title=Title('5th slowest endpoint, total time'),
+    unit=metrics.Unit(metrics.TimeNotation()),
+    color=metrics.Color.BLUE,
+)
+
+metric_dell_storage_endpoint_top5_p95 = metrics.Metric(
+    name='dell_storage_endpoint_top5_p95',
+    title=Title('5th slowest endpoint, 95th percentile'),
+    unit=metrics.Unit(metrics.TimeNotation()),
+    color=metrics.Color.LIGHT_BLUE,
+)
+
+metric_dell_storage_read_latency_p50 = metrics.Metric(
+    name='dell_storage_read_latency_p50',
+    title=Title('Read latency, 50th percentile'),
+    unit=metrics.Unit(metrics.TimeNotation()),
+    color=metrics.Color.LIGHT_GREEN,
+)
+
+metric_dell_storage_read_latency_p90 = metrics.Metric(
+    name='dell_storage_read_latency_p90',
+    title=Title('Read latency, 90th percentile'),
+    unit=metrics.Unit(metrics.TimeNotation()),
+    color=metrics.Color.YELLOW,
+)
+
+metric_dell_storage_read_latency_p99 = metrics.Metric(
+    name='dell_storage_read_latency_p99',
+    title=Title('Read latency, 99th percentile'),
+    unit=metrics.Unit(metrics.TimeNotation()),
+    color=metrics.Color.ORANGE,
+)
+
+metric_dell_storage_read_latency_max = metrics.Metric(
+    name='dell_storage_read_latency_max',
+    title=Title('Read latency, maximum'),
+    unit=metrics.Unit(metrics.TimeNotation()),
+    color=metrics.Color.RED,
+)
+
+metric_dell_storage_write_latency_p50 = metrics.Metric(
+    name='dell_storage_write_latency_p50',
+    title=Title('Write latency, 50th percentile'),
+    unit=metrics.Unit(metrics.TimeNotation()),
+    color=metrics.Color.LIGHT_GREEN,
+)
+
+metric_dell_storage_write_latency_p90 = metrics.Metric(
+    name='dell_storage_write_latency_p90',
+    title=Title('Write latency, 90th percentile'),
+    unit=metrics.Unit(metrics.TimeNotation()),
+    color=metrics.Color.YELLOW,
+)
+
+metric_dell_storage_write_latency_p99 = metrics.Metric(
+    name='dell_storage_write_latency_p99',
+    title=Title('Write latency, 99th percentile'),
+    unit=metrics.Unit(metrics.TimeNotation()),
+    color=metrics.Color.ORANGE,
+)
+
+metric_dell_storage_write_latency_max = metrics.Metric(
+    name='dell_storage_write_latency_max',
+    title=Title('Write latency, maximum'),
+    unit=metrics.Unit(metrics.TimeNotation()),
+    color=metrics.Color.RED,
+)
+
+metric_dell_storage_top_volume_iops_share = metrics.Metric(
+    name='dell_storage_top_volume_iops_share',
+    title=Title('Share of the top volumes in operations'),
+    unit=metrics.Unit(metrics.DecimalNotation('%')),
+    color=metrics.Color.BLUE,
+)
+
+metric_dell_storage_top_volume_throughput_share = metrics.Metric(
+    name='dell_storage_top_volume_throughput_share',
+    title=Title('Share of the top volumes in throughput'),
+    unit=metrics.Unit(metrics.DecimalNotation('%')),
+    color=metrics.Color.LIGHT_BLUE,
+)
+
+metric_dell_storage_top_disk_iops_share = metrics.Metric(
+    name='dell_storage_top_disk_iops_share',
+    title=Title('Share of the top disks in operations'),
+    unit=metrics.Unit(metrics.DecimalNotation('%')),
+    color=metrics.Color.PURPLE,
+)
+
+metric_dell_storage_top_disk_throughput_share = metrics.Metric(
+    name='dell_storage_top_disk_throughput_share',
+    title=Title('Share of the top disks in throughput'),
+    unit=metrics.Unit(metrics.DecimalNotation('%')),
+    color=metrics.Color.LIGHT_PURPLE,
+)
+
+metric_dell_storage_read_latency_peak = metrics.Metric(
+    name='dell_storage_read_latency_peak',
+    title=Title('Read latency, peak since the last run'),
+    unit=metrics.Unit(metrics.TimeNotation()),
+    color=metrics.Color.DARK_GREEN,
+)
+
+metric_dell_storage_write_latency_peak = metrics.Metric(
+    name='dell_storage_write_latency_peak',
+    title=Title('Write latency, peak since the last run'),
+    unit=metrics.Unit(metrics.TimeNotation()),
+    color=metrics.Color.DARK_BLUE,
+)
+
 graph_dell_storage_center_disk = graphs.Graph(
     name='dell_storage_center_disk',
     title=Title('Storage Center Disks'),
@@ -139,6 +342,70 @@ graph_dell_storage_volume_usage = graphs.Graph(
     compound_lines=['dell_storage_volume_usage'],
 )
 
+graph_dell_storage_cache = graphs.Graph(
+    name='dell_storage_cache',
+    title=Title('Dell Storage API cache'),
+    compound_lines=[
+        'dell_storage_cache_hits',
+        'dell_storage_cache_misses',
+    ],
+)
+
+graph_dell_storage_connections = graphs.Graph(
+    name='dell_storage_connections',
+    title=Title('Dell Storage API connections'),
+    compound_lines=[
+        'dell_storage_connections_reused',
+        'dell_storage_connections_new',
+    ],
+)
+
+graph_dell_storage_endpoint_time = graphs.Graph(
+    name='dell_storage_endpoint_time',
+    title=Title('Dell Storage API slowest endpoints, total time'),
+    simple_lines=[
+        'dell_storage_endpoint_top1_time',
+        'dell_storage_endpoint_top2_time',
+        'dell_storage_endpoint_top3_time',
+        'dell_storage_endpoint_top4_time',
+        'dell_storage_endpoint_top5_time',
+    ],
+)
+
+graph_dell_storage_endpoint_p95 = graphs.Graph(
+    name='dell_storage_endpoint_p95',
+    title=Title('Dell Storage API slowest endpoints, 95th percentile latency'),
+    simple_lines=[
+        'dell_storage_endpoint_top1_p95',
+        'dell_storage_endpoint_top2_p95',
+        'dell_storage_endpoint_top3_p95',
+        'dell_storage_endpoint_top4_p95',
+        'dell_storage_endpoint_top5_p95',
+    ],
+)
+
+graph_dell_storage_read_latency = graphs.Graph(
+    name='dell_storage_read_latency',
+    title=Title('Read latency percentiles'),
+    simple_lines=[
+        'dell_storage_read_latency_p50',
+        'dell_storage_read_latency_p90',
+        'dell_storage_read_latency_p99',
+        'dell_storage_read_latency_max',
+    ],
+)
+
+graph_dell_storage_write_latency = graphs.Graph(
+    name='dell_storage_write_latency',
+    title=Title('Write latency percentiles'),
+    simple_lines=[
+        'dell_storage_write_latency_p50',
+        'dell_storage_write_latency_p90',
+        'dell_storage_write_latency_p99',
+        'dell_storage_write_latency_max',
+    ],
+)
+
 perfometer_dell_storage_center = perfometers.Perfometer(
     name='dell_storage_center',
     focus_range=perfometers.FocusRange(
@@ -19,13 +19,26 @@
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 
+import argparse
 import re
+import sys
 from typing import Optional, Sequence
+import codecs
 import time
 import datetime
+import hashlib
+import io
+import json
+import keyword
 import logging
+import math
+import os
+import queue
+import threading
 import requests
-from functools import cached_property
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, wraps
+from operator import mul
 
 from cmk.special_agents.v0_unstable.agent_common import (
     ConditionalPiggybackSection,
@@ -36,6 +49,7 @@ from cmk.special_agents.v0_unstable.argument_parsing import (
     Args,
     create_default_argument_parser
 )
+from cmk.utils import paths
 
 import urllib3
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -51,6 +65,56 @@ class BytesString:
         return self.value
 
 
+def iter_json_array(chunks, encoding='utf-8'):
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder(encoding)()
+    chunks = iter(chunks)
+    buffer, pos, eof = '', 0, False
+
+    def read():
+        nonlocal buffer, pos, eof
+        chunk = next(chunks, None)
+        eof = chunk is None
+        buffer = buffer[pos:] + text.decode(chunk or b'', final=eof)
+        pos = 0
+
+    def skip():
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in ' \t\n\r':
+                pos += 1
+            if pos < len(buffer) or eof:
+                return buffer[pos:pos + 1]
+            read()
+
+    if skip() != '[':
+        raise json.JSONDecodeError('Expecting JSON array', buffer, pos)
+    pos += 1
+    if skip() == ']':
+        return
+
+    while True:
+        while True:
+            try:
+                obj, end = decoder.raw_decode(buffer, pos)
+                if end < len(buffer) or eof:
+                    break
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            read()
+        pos = end
+        yield obj
+
+        char = skip()
+        if char == ']':
+            return
+        if char != ',':
+            raise json.JSONDecodeError('Expecting \',\' delimiter', buffer, pos)
+        pos += 1
+        skip()
+
+
 class DellStorageApiParser:
     @staticmethod
     def temperature(value):
@@ -60,57 +124,595 @@ class DellStorageApiParser:
 
     @staticmethod
     def kbps(value):
-        return int(value) * 1024
+        return float(value) * 1024
 
     @staticmethod
     def latency(value):
-        return int(value) / 1000000.0
+        return float(value) / 1000000.0
 
     @staticmethod
     def space(value):
         return int(value.split(' ')[0])
 
 
-class DellStorageApi:
-    reqcnt = 0
+class EndpointStats:
+    """Latency and payload statistics of one endpoint class."""
 
-    HISTORICAL_FILTER = {
-        'HistoricalFilter': {
-            'UseCurrent': True,
-            'MaxCountReturn': 1,
-            'StartTime': (datetime.datetime.now() - datetime.timedelta(minutes=20)).isoformat(),
-        }
+    __slots__ = ('durations', 'size', 'decode')
+
+    def __init__(self):
+        self.durations = []
+        self.size = 0
+        self.decode = 0.0
+
+    @staticmethod
+    def endpoint(call):
+        segments = [segment for segment in call.strip('/').split('/') if not re.search(r'\d', segment)]
+        return '/'.join(segments[-2:])
+
+    def add(self, duration, size, decode):
+        self.durations.append(duration)
+        self.size += size
+        self.decode += decode
+
+    @property
+    def count(self):
+        return len(self.durations)
+
+    @property
+    def total(self):
+        return sum(self.durations)
+
+    @property
+    def max(self):
+        return max(self.durations, default=0.0)
+
+    @property
+    def p95(self):
+        if not self.durations:
+            return 0.0
+        return sorted(self.durations)[math.ceil(0.95 * len(self.durations)) - 1]
+
+    def __str__(self):
+        return f'{self.count};{self.total:.6f};{self.max:.6f};{self.p95:.6f};{self.size};{self.decode:.6f}'
+
+
+class DellStorageCache:
+    # Responses are cached as a whole. The controllers, enclosures, disks and
+    # volumes carry their status in the same objects as their static fields,
+    # so caching them would report a stale status. Only the chassis has no
+    # status of its own.
+    DEFAULT_TTL = {
+        'ScChassis': 86400,
+    }
+
+    def __init__(self, path, ttl):
+        self._path = path
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        try:
+            with open(path) as fd:
+                self._entries = json.load(fd)
+        except (OSError, ValueError):
+            self._entries = {}
+
+    @staticmethod
+    def _object_type(data):
+        if isinstance(data, list):
+            data = data[0] if data else {}
+        return data.get('objectType')
+
+    def _fresh(self, entry):
+        return time.time() - entry['time'] < self._ttl.get(self._object_type(entry['data']), 0)
+
+    def get(self, call):
+        entry = self._entries.get(call)
+        if entry and self._fresh(entry):
+            with self._lock:
+                self.hits += 1
+            return entry['data']
+        return None
+
+    def set(self, call, data):
+        if not isinstance(data, (list, dict)):
+            return self._collect(call, data)
+        if self._object_type(data) in self._ttl:
+            with self._lock:
+                self.misses += 1
+                self._entries[call] = dict(time=time.time(), data=data)
+        return data
+
+    def _collect(self, call, objs):
+        collected = None
+        for obj in objs:
+            if collected is None:
+                collected = [] if self._object_type(obj) in self._ttl else False
+            if collected is not False:
+                collected.append(obj)
+            yield obj
+        if collected:
+            self.set(call, collected)
+
+    def save(self):
+        entries = {call: entry for call, entry in self._entries.items() if self._fresh(entry)}
+        os.makedirs(os.path.dirname(self._path), exist_ok=True)
+        with open(f'{self._path}.new', 'w') as fd:
+            json.dump(entries, fd)
+        os.replace(f'{self._path}.new', self._path)
+
+
+class PollingScheduler:
+    """Persisted refresh state for tiered polling.
+
+    Object types with a refresh interval are only fetched once it is due.
+    In between, the rows last written for their sections are replayed with a
+    cached(ts,interval) header.
+    """
+
+    DEFAULT_INTERVAL = 3600
+    SENSOR_TYPES = (
+        'ScControllerFanSensor', 'ScControllerPowerSupply', 'ScControllerTemperatureSensor',
+        'ScEnclosureCoolingFanSensor', 'ScEnclosurePowerSupply', 'ScEnclosureTemperatureSensor',
+    )
+    # The storage usage shares its rows with the IO usage, so it can not be
+    # replayed per section and is kept in the response cache instead.
+    USAGE_TYPES = (
+        'StorageCenterStorageUsage', 'ScDiskStorageUsage', 'ScVolumeStorageUsage',
+    )
+
+    def __init__(self, path, intervals):
+        self._path = path
+        self._intervals = intervals
+        self._now = time.time()
+        self._lock = threading.Lock()
+
+        try:
+            with open(path) as fd:
+                state = json.load(fd)
+        except (OSError, ValueError):
+            state = {}
+        self._refreshed = state.get('refreshed', {})
+        self._sections = state.get('sections', {})
+        self._due = {otype for otype, interval in intervals.items()
+                     if self._now - self._refreshed.get(otype, 0) >= interval}
+        self._stored = set()
+
+    def interval(self, otype):
+        return self._intervals.get(otype)
+
+    def due(self, otype):
+        return otype not in self._intervals or otype in self._due
+
+    def store(self, key, otype, rows):
+        with self._lock:
+            self._sections[key] = dict(time=int(self._now), rows=rows)
+            self._stored.add(otype)
+
+    def replay(self, key):
+        return self._sections.get(key)
+
+    def save(self, complete=True):
+        """Persist the refresh state and the stored rows.
+
+        Only object types stored in this run count as refreshed, and none of
+        them if the run was not complete. A failed Storage Center or an
+        association skipped after the deadline would otherwise replay stale or
+        missing rows until the next refresh.
+        """
+        refreshed = dict(self._refreshed)
+        if complete:
+            refreshed.update(dict.fromkeys(self._stored, self._now))
+        keep = 2 * max(self._intervals.values(), default=0)
+        sections = {key: entry for key, entry in self._sections.items() if self._now - entry['time'] < keep}
+        os.makedirs(os.path.dirname(self._path), exist_ok=True)
+        with open(f'{self._path}.new', 'w') as fd:
+            json.dump(dict(refreshed=refreshed, sections=sections), fd)
+        os.replace(f'{self._path}.new', self._path)
+
+
+class DellStorageRecorder:
+    """Write every DSM response into DIR along its REST path, like the test fixtures."""
+
+    SCRUB = {
+        'userName': 'user',
+        'userId': 0,
+        'sessionKey': 0,
+        'secureString': '',
+        'connectionKey': '',
     }
+    TIMINGS = '.timings.json'
+
+    def __init__(self, directory):
+        self._directory = os.path.abspath(directory)
+        self._lock = threading.Lock()
+        self.timings = {}
+
+    def _path(self, call):
+        path = os.path.abspath(os.path.join(self._directory, call.strip('/')))
+        if os.path.commonpath([self._directory, path]) != self._directory:
+            raise ValueError(f'Call {call} leaves the record directory')
+        return path
+
+    @classmethod
+    def scrub(cls, data):
+        if isinstance(data, list):
+            return [cls.scrub(obj) for obj in data]
+        if isinstance(data, dict):
+            return {key: cls.SCRUB[key] if key in cls.SCRUB else cls.scrub(value) for key, value in data.items()}
+        return data
+
+    def record(self, call, content, duration):
+        path = self._path(call)
+        try:
+            content = json.dumps(self.scrub(json.loads(content)), indent=4).encode('utf-8')
+        except ValueError:
+            pass
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as fd:
+            fd.write(content)
+        with self._lock:
+            self.timings[call.strip('/')] = duration
+
+    def save(self):
+        os.makedirs(self._directory, exist_ok=True)
+        with open(os.path.join(self._directory, self.TIMINGS), 'w') as fd:
+            json.dump(self.timings, fd, indent=4, sort_keys=True)
+
+
+class DellStorageReplayAdapter(requests.adapters.BaseAdapter):
+    """Serve the responses recorded by DellStorageRecorder with their latency scaled by speed."""
+
+    def __init__(self, directory, url, speed=1.0):
+        super().__init__()
+        self._directory = os.path.abspath(directory)
+        self._prefix = urllib3.util.parse_url(url).path.rstrip('/') + '/'
+        self._speed = speed
+        try:
+            with open(os.path.join(self._directory, DellStorageRecorder.TIMINGS)) as fd:
+                self._timings = json.load(fd)
+        except (OSError, ValueError):
+            self._timings = {}
+
+    def send(self, request, **kwargs):
+        call = urllib3.util.parse_url(request.url).path.removeprefix(self._prefix).strip('/')
+        path = os.path.abspath(os.path.join(self._directory, call))
+        if os.path.commonpath([self._directory, path]) == self._directory and os.path.isfile(path):
+            with open(path, 'rb') as fd:
+                status, body = 200, fd.read()
+        else:
+            status, body = 404, b'404'
+        time.sleep(self._timings.get(call, 0) * self._speed)
+
+        resp = requests.Response()
+        resp.status_code = status
+        resp.reason = 'OK' if status == 200 else 'Not Found'
+        resp.headers['Content-Type'] = 'application/json'
+        resp.encoding = 'utf-8'
+        resp.raw = io.BytesIO(body)
+        resp.url = request.url
+        resp.request = request
+        return resp
+
+    def close(self):
+        pass
+
+
+# Counters of a historical IO usage. The agent writes their mean over all
+# samples since the last run, followed by their minimum and maximum.
+HISTORICAL_FIELDS = ('readIops', 'readKbPerSecond', 'readLatency', 'writeIops', 'writeKbPerSecond', 'writeLatency')
+HISTORICAL_EXTREMES = [f'iousage.{field}{extreme}' for field in HISTORICAL_FIELDS for extreme in ('Min', 'Max')]
+
+FORMATTERS = {
+    str: '{}',
+    BytesString: '{}.value',
+    DellStorageApiParser.kbps: 'str({})',
+    DellStorageApiParser.latency: 'repr({})',
+    DellStorageApiParser.space: 'str({})',
+    DellStorageApiParser.temperature: 'str({})',
+}
+
+
+class ApiObjectMeta(type):
+    def __new__(mcs, name, bases, namespace):
+        inherited = {slot for base in bases for cls in base.__mro__ for slot in getattr(cls, '__slots__', ())}
+        slots = [key for key in namespace.get('__annotations__', {}) if key not in inherited]
+        if '__dict__' not in inherited and any(isinstance(value, cached_property) for value in namespace.values()):
+            slots.append('__dict__')
+        namespace.setdefault('__slots__', tuple(slots))
+        for association in namespace.get('ASSOCIATIONS', []) + namespace.get('REFERENCES', []):
+            if isinstance(namespace.get(association), cached_property):
+                namespace[association] = cached_property(mcs._budgeted(association, namespace[association].func))
+
+        return super().__new__(mcs, name, bases, namespace)
+
+    @staticmethod
+    def _target(annotation):
+        return annotation.removeprefix('list[').removesuffix(']').rpartition('.')[2]
+
+    @staticmethod
+    def _budgeted(name, func):
+        annotation = func.__annotations__.get('return', '')
+        target = ApiObjectMeta._target(annotation)
+        empty = list if annotation.startswith('list[') else type(None)
+
+        @wraps(func)
+        def association(self):
+            if not self._api.wanted(type(self), name) or not self._api.due(target) or self._api.skip(type(self), name):
+                return empty()
+            try:
+                return func(self)
+            except (requests.Timeout, requests.ConnectionError):
+                # A request cut short by the deadline is skipped like the
+                # ones started after it.
+                if not self._api.skip(type(self), name):
+                    raise
+                return empty()
+        return association
+
+    def annotations(cls):
+        for klass in cls.__mro__:
+            if '__annotations__' in klass.__dict__:
+                return klass.__dict__['__annotations__']
+        return {}
+
+    def association_type(cls, name):
+        prop = getattr(cls, name, None)
+        if not isinstance(prop, cached_property):
+            return None, False
+        otype = prop.func.__annotations__.get('return', '')
+        return getattr(DellStorageApi, cls._target(otype), None), otype.startswith('list[')
+
+    def needed(cls, sections, parent=None):
+        section = parent if cls.SECTION is None else cls.SECTION
+        if section in sections:
+            return True
+        targets = (cls.association_type(name)[0] for name in cls.ASSOCIATIONS)
+        return any(target.needed(sections, section) for target in targets if target is not None)
+
+    def wants(cls, name, sections):
+        if sections is None or name in cls.REFERENCES:
+            return True
+        target, _ = cls.association_type(name)
+        return target is None or target.needed(sections, cls.SECTION)
+
+    def field_type(cls, field):
+        *path, name = field.split('.')
+        for association in path:
+            cls, many = cls.association_type(association)
+            if cls is None or many:
+                return None
+        return cls.annotations().get(name)
+
+    @property
+    def _serializer(cls):
+        if '_serialize' not in cls.__dict__:
+            cls._serialize = cls._compile_serializer()
+        return cls.__dict__['_serialize']
+
+    def _compile_serializer(cls):
+        code = ['def serialize(self, separator):']
+        values = []
+        for idx, field in enumerate(cls.AGENT_DEFAULT_FIELDS + cls.AGENT_FIELDS):
+            if not all(part.isidentifier() and not keyword.iskeyword(part) for part in field.split('.')):
+                values.append("''")
+                continue
+            formatter = FORMATTERS.get(cls.field_type(field), 'str({})')
+            code += [
+                '    try:',
+                f'        v{idx} = ' + formatter.format(f'self.{field}'),
+                '    except AttributeError:',
+                f"        v{idx} = ''",
+            ]
+            values.append(f'v{idx}')
+        code.append(f"    return separator.join([{', '.join(values)}])")
+
+        namespace = {}
+        exec('\n'.join(code), namespace)
+        return namespace['serialize']
+
 
-    def __init__(self, url, user, password, verify_cert):
-        LOGGING.info('Initialize DellStorageApi Clinet')
+class DellStorageApi:
+    reqcnt = 0
+    skipped = 0
+    duplicates = 0
+    DEADLINE_RESERVE = 0.25
+
+    def __init__(self, url, user, password, verify_cert, historical_window=10, historical_samples=None, cache=None, session_file=None,
+                 pool_size=10, timeout=(10, 60), stream=False, deadline=None, scheduler=None, sections=None,
+                 recorder=None, replay=None, historical_since=None):
+        LOGGING.info('Initialize {cls} Clinet'.format(cls=self.__class__.__name__))
         self._url = url
         self._verify_cert = verify_cert
+        self._pool_size = pool_size
+        self._timeout = timeout
+        self._stream = stream
+        self.cache = cache
+        self.scheduler = scheduler
+        self.recorder = recorder
+        self._replay = replay
+        self._sections = sections
+        self._wanted = {}
+        self._session_file = session_file
+        self._session_restored = False
+        self._historical_window = datetime.timedelta(minutes=historical_window)
+        self._historical_samples = historical_samples
+        self._historical_since = historical_since or {}
+        self._reqcnt_lock = threading.Lock()
+        self.endpoints = {}
+        self._login_lock = threading.Lock()
+        self._identities = {}
+        self._identity_lock = threading.Lock()
+        self._credentials = (user, password)
+        self._deadline = time.monotonic() + deadline if deadline else None
+        self._deadline_reserve = deadline * self.DEADLINE_RESERVE if deadline else 0
 
         self._login(user, password)
 
+    @cached_property
+    def _adapter(self):
+        return requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=self._pool_size, pool_block=True)
+
     @cached_property
     def _connection(self):
         conn = requests.Session()
+        adapter = self._replay or self._adapter
+        conn.mount('https://', adapter)
+        conn.mount('http://', adapter)
         conn.headers.update({
             'Content-Type': 'application/json; charset=utf-8',
             'Accept': 'application/json',
+            'Connection': 'keep-alive',
             'x-dell-api-version': '4.0',
         })
         return conn
 
+    def resize_pool(self, size):
+        if size <= self._pool_size:
+            return
+        self._pool_size = size
+        self._adapter.poolmanager.clear()
+        self._adapter.init_poolmanager(1, size, block=True)
+
+    def connection_stats(self):
+        pools = self._adapter.poolmanager.pools
+        pools = [pools[key] for key in pools.keys()]
+        new = sum(pool.num_connections for pool in pools)
+        return new, sum(pool.num_requests for pool in pools) - new
+
     def _login(self, user: str, password: str) -> None:
-        self._api = self._request('POST', '/ApiConnection/Login', auth=(user, password))
+        if not self._restore_session():
+            self._authenticate(user, password)
+
+    def _authenticate(self, user: str, password: str) -> None:
+        self._api = DellStorageApi._request(self, 'POST', '/ApiConnection/Login', auth=(user, password))
         LOGGING.info('Login to {provider} v{providerVersion}'.format(**self._api))
+        self._save_session()
+
+    def _restore_session(self) -> bool:
+        if not self._session_file:
+            return False
+
+        try:
+            with open(self._session_file) as fd:
+                session = json.load(fd)
+            cookies = requests.utils.cookiejar_from_dict(session['cookies'])
+            api = session['api']
+            LOGGING.info('Reuse session to {provider} v{providerVersion}'.format(**api))
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+
+        self._connection.cookies.update(cookies)
+        self._api = api
+        self._session_restored = True
+        return True
+
+    def _save_session(self) -> None:
+        if not self._session_file:
+            return
+
+        os.makedirs(os.path.dirname(self._session_file), exist_ok=True)
+        fd = os.open(f'{self._session_file}.new', os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as fd:
+            json.dump(dict(cookies=requests.utils.dict_from_cookiejar(self._connection.cookies), api=self._api), fd)
+        os.replace(f'{self._session_file}.new', self._session_file)
+
+    def _relogin(self, api) -> None:
+        with self._login_lock:
+            if self._api is api:
+                LOGGING.info('Session rejected, login again')
+                self._connection.cookies.clear()
+                self._session_restored = False
+                self._authenticate(*self._credentials)
+
+    def logout(self) -> None:
+        try:
+            self._connection.post(self.url('/ApiConnection/Logout'), verify=self._verify_cert, timeout=self._timeout)
+        except requests.RequestException as exc:
+            LOGGING.info('Logout failed: {exc}'.format(exc=exc))
 
     def _request(self, methode, call, payload=None, **kwargs) -> requests.Response:
         url = self.url(call)
+        api = getattr(self, '_api', None)
+        timeout = self._request_timeout()
         LOGGING.debug('>> {methode} {url}'.format(methode=methode, url=url))
-        resp = self._connection.request(methode, url, json=payload, verify=self._verify_cert, **kwargs)
+        start = time.monotonic()
+        resp = self._connection.request(methode, url, json=payload, verify=self._verify_cert, timeout=timeout, **kwargs)
+        duration = time.monotonic() - start
         LOGGING.debug('<< {status} {reason}'.format(status=resp.status_code, reason=resp.reason))
+        if resp.status_code == 401 and (self._session_restored or getattr(self, '_api', None) is not api):
+            self._relogin(api)
+            return DellStorageApi._request(self, methode, call, payload, **kwargs)
         resp.raise_for_status()
-        self.reqcnt += 1
-        return resp.json()
+        with self._reqcnt_lock:
+            self.reqcnt += 1
+        if kwargs.get('stream'):
+            return self._stream_json(resp, call, duration)
+        if self.recorder is not None:
+            self.recorder.record(call, resp.content, duration)
+        start = time.monotonic()
+        data = resp.json()
+        self._record(call, duration, len(resp.content), time.monotonic() - start)
+        return data
+
+    def _request_timeout(self):
+        if self._deadline is None:
+            return self._timeout
+
+        remaining = self._deadline - time.monotonic()
+        if remaining <= 0:
+            raise requests.Timeout('Deadline exceeded')
+        return tuple(min(timeout, remaining) for timeout in self._timeout)
+
+    def _stream_json(self, resp, call, duration):
+        # The body is only read while decoding, so the decode time of a
+        # streamed response includes its transfer.
+        # A recorded response is kept from its chunks until it is complete.
+        size = 0
+        body = [] if self.recorder is not None else None
+
+        def chunks():
+            nonlocal size
+            for chunk in resp.iter_content(65536):
+                size += len(chunk)
+                if body is not None:
+                    body.append(chunk)
+                yield chunk
+
+        start = time.monotonic()
+        with resp:
+            yield from iter_json_array(chunks(), resp.encoding or 'utf-8')
+        self._record(call, duration, size, time.monotonic() - start)
+        if body is not None:
+            self.recorder.record(call, b''.join(body), duration)
+
+    def wanted(self, cls, name):
+        if (cls, name) not in self._wanted:
+            self._wanted[cls, name] = cls.wants(name, self._sections)
+        return self._wanted[cls, name]
+
+    def due(self, otype):
+        return self.scheduler is None or self.scheduler.due(otype)
+
+    def skip(self, cls, name):
+        if self._deadline is None:
+            return False
+
+        remaining = self._deadline - time.monotonic()
+        if remaining > self._deadline_reserve or (remaining > 0 and name not in cls.LOW_PRIORITY):
+            return False
+
+        LOGGING.debug(f'Skip {cls.__name__}.{name}, {remaining:.3f}s left')
+        with self._reqcnt_lock:
+            self.skipped += 1
+        return True
+
+    def _record(self, call, duration, size, decode):
+        endpoint = EndpointStats.endpoint(call)
+        with self._reqcnt_lock:
+            self.endpoints.setdefault(endpoint, EndpointStats()).add(duration, size, decode)
 
     def url(self, call):
         return f'{self._url.rstrip("/")}/{call.strip("/")}'
@@ -120,12 +722,79 @@ class DellStorageApi:
         storage_centers = self.get('/ApiConnection/ApiConnection/{instanceId}/StorageCenterList'.format(**self._api))
         return [self.StorageCenter(self, **sc) for sc in storage_centers]
 
-    def get(self, call) -> requests.Response:
-        return self._request('GET', call)
+    def get(self, call, stream=False) -> requests.Response:
+        data = self.cache.get(call) if self.cache is not None else None
+        if data is None:
+            data = self._request('GET', call, stream=stream)
+            if self.cache is not None:
+                data = self.cache.set(call, data)
+        return data
 
     def post(self, call, payload={}) -> requests.Response:
         return self._request('POST', call, payload=payload)
 
+    def _get_association(self, url):
+        return self._instanciate(self.get(url))
+
+    def historical_filter(self, serial_number=None):
+        start = datetime.datetime.now() - self._historical_window
+        if (since := self._historical_since.get(serial_number)) is not None:
+            start = max(start, since)
+        historical_filter = {
+            'UseCurrent': True,
+            'StartTime': start.isoformat(),
+        }
+        if self._historical_samples:
+            historical_filter['MaxCountReturn'] = self._historical_samples
+        return {'HistoricalFilter': historical_filter}
+
+    @staticmethod
+    def _aggregate_historical(samples):
+        """Merge the samples of a historical IO usage into one with the mean,
+        the minimum and the maximum of every counter.
+
+        The mean latencies are weighted by the read and write operations, so
+        idle samples do not pull them down."""
+        usage = dict(samples[0])
+        values = {field: [float(sample.get(field) or 0) for sample in samples] for field in HISTORICAL_FIELDS}
+        for field in HISTORICAL_FIELDS:
+            usage[field] = math.fsum(values[field]) / len(samples)
+            usage[f'{field}Min'] = min(values[field])
+            usage[f'{field}Max'] = max(values[field])
+        for op in ('read', 'write'):
+            ios = math.fsum(values[f'{op}Iops'])
+            usage[f'{op}Latency'] = math.fsum(map(mul, values[f'{op}Iops'], values[f'{op}Latency'])) / ios if ios else 0.0
+        return usage
+
+    def _get_historical_association(self, url, serial_number=None):
+        assoc = self.post(url, payload=self.historical_filter(serial_number))
+        if len(assoc) > 0:
+            return self._instanciate(self._aggregate_historical(assoc))
+        return None
+
+    def _get_associations(self, url):
+        return self._instanciate_all(self.get(url, stream=self._stream))
+
+    def _instanciate_all(self, objs):
+        return [self._instanciate(obj) for obj in objs]
+
+    def _instanciate(self, obj):
+        otype = obj['objectType']
+        cls = getattr(DellStorageApi, otype, None)
+        if not cls:
+            return obj
+        # Only objects with associations are shared, the samples of a
+        # historical usage carry the instanceId of the object they belong to.
+        if not (cls.ASSOCIATIONS and 'instanceId' in obj):
+            return cls(self, **obj)
+
+        key = (otype, obj['instanceId'])
+        with self._identity_lock:
+            if key in self._identities:
+                self.duplicates += 1
+                return self._identities[key]
+            return self._identities.setdefault(key, cls(self, **obj))
+
     @property
     def provider(self):
         return getattr(self, '_api', {}).get('provider', 'UNKNOWN')
@@ -134,9 +803,15 @@ class DellStorageApi:
     def providerVersion(self):
         return getattr(self, '_api', {}).get('providerVersion', 'UNKNOWN')
 
-    class ApiObject(object):
+    class ApiObject(object, metaclass=ApiObjectMeta):
+        __slots__ = ('_api',)
+
         AGENT_DEFAULT_FIELDS = ['instanceName', 'status', 'statusMessage']
         AGENT_FIELDS = []
+        ASSOCIATIONS = []
+        REFERENCES = []
+        LOW_PRIORITY = []
+        SECTION = None
 
         def __init__(self, api, **kwargs):
             self._api = api
@@ -144,45 +819,30 @@ class DellStorageApi:
             for key, vtype in self.__annotations__.items():
                 self.__setattr__(key, vtype(kwargs.get(key, None)))
 
-        def __getattribute__(self, name):
-            if '.' in name:
-                name, subpath = name.split('.', 1)
-                return getattr(object.__getattribute__(self, name), subpath)
-            return object.__getattribute__(self, name)
-
         def __repr__(self):
             return f'<{self.__class__.__name__} {self.instanceName} {self.instanceId}>'
 
         def _get_association(self, url):
-            return self._instanciate(self._api.get(url))
+            return self._api._get_association(url)
 
         def _get_historical_association(self, url):
-            assoc = self._api.post(url, payload=DellStorageApi.HISTORICAL_FILTER)
-            if len(assoc) > 0:
-                return self._instanciate(assoc[0])
-            return None
+            return self._api._get_historical_association(url, getattr(self, 'scSerialNumber', None))
 
         def _get_associations(self, url):
-            return [self._instanciate(obj) for obj in self._api.get(url)]
-
-        def _instanciate(self, obj):
-            otype = obj['objectType']
-            cls = getattr(DellStorageApi, otype, None)
-            if cls:
-                return cls(self._api, **obj)
-            return obj
+            return self._api._get_associations(url)
 
         def _fields(self):
             return self.AGENT_DEFAULT_FIELDS + self.AGENT_FIELDS
 
         def __str__(self, separator=';'):
-            return separator.join([str(getattr(self, field, '')) for field in self._fields()])
+            return type(self)._serializer(self, separator)
 
         @property
         def safeInstanceName(self):
             return re.sub(r"[^a-zA-Z0-9-_]", "", getattr(self, 'instanceName'))
 
     class StorageCenter(ApiObject):
+        SECTION = 'dell_storage_center'
         AGENT_FIELDS = [
             'modelSeries', 'version',
             'serviceTag', 'serialNumber',
@@ -192,6 +852,10 @@ class DellStorageApi:
             'objectCount.numberOfServers', 'objectCount.numberOfVolumes',
             'storageUsage.availableSpace', 'storageUsage.allocatedSpace', 'storageUsage.usedSpace'
         ]
+        ASSOCIATIONS = [
+            'objectCount', 'storageUsage', 'chassi',
+            'controllers', 'enclosures', 'volumes', 'activeAlerts',
+        ]
 
         instanceId: str
         instanceName: str
@@ -204,51 +868,58 @@ class DellStorageApi:
         chassisPresent: bool
 
         @cached_property
-        def chassi(self):
+        def chassi(self) -> 'DellStorageApi.ScChassis':
+            if not self.chassisPresent:
+                return None
             return self._get_association(f'/StorageCenter/StorageCenter/{self.instanceId}/Chassis')
 
         @cached_property
-        def objectCount(self):
+        def objectCount(self) -> 'DellStorageApi.ScObjectCount':
             return self._get_association(f'/StorageCenter/StorageCenter/{self.instanceId}/ObjectCount')
 
         @cached_property
-        def storageUsage(self):
+        def storageUsage(self) -> 'DellStorageApi.StorageCenterStorageUsage':
             return self._get_association(f'/StorageCenter/StorageCenter/{self.instanceId}/StorageUsage')
 
         @cached_property
-        def controllers(self):
+        def controllers(self) -> 'list[DellStorageApi.ScController]':
             return self._get_associations(f'/StorageCenter/StorageCenter/{self.instanceId}/ControllerList')
 
         @cached_property
-        def enclosures(self):
+        def enclosures(self) -> 'list[DellStorageApi.ScEnclosure]':
             return self._get_associations(f'/StorageCenter/StorageCenter/{self.instanceId}/EnclosureList')
 
         @cached_property
-        def volumes(self):
+        def volumes(self) -> 'list[DellStorageApi.ScVolume]':
             return self._get_associations(f'/StorageCenter/StorageCenter/{self.instanceId}/VolumeList')
 
         @cached_property
-        def activeAlerts(self):
+        def activeAlerts(self) -> 'list[DellStorageApi.ScAlert]':
             return self._get_associations(f'/StorageCenter/StorageCenter/{self.instanceId}/ActiveAlertList')
 
     class ScChassis(ApiObject):
+        # Only a container for its sensors, it has no rows of its own.
+        SECTION = ''
+        ASSOCIATIONS = ['fans', 'powersupplies', 'temperatures']
+        REFERENCES = ['enclosure']
+
         instanceId: str
         instanceName: str
 
         @cached_property
-        def enclosure(self):
+        def enclosure(self) -> 'DellStorageApi.ScEnclosure':
             return self._get_association(f'/StorageCenter/ScChassis/{self.instanceId}/Enclosure')
 
         @cached_property
-        def fans(self):
+        def fans(self) -> 'list[DellStorageApi.ScControllerFanSensor]':
             return self._get_associations(f'/StorageCenter/ScChassis/{self.instanceId}/FanSensorList')
 
         @cached_property
-        def powersupplies(self):
+        def powersupplies(self) -> 'list[DellStorageApi.ScControllerPowerSupply]':
             return self._get_associations(f'/StorageCenter/ScChassis/{self.instanceId}/PowerSupplyList')
 
         @cached_property
-        def temperatures(self):
+        def temperatures(self) -> 'list[DellStorageApi.ScControllerTemperatureSensor]':
             return self._get_associations(f'/StorageCenter/ScChassis/{self.instanceId}/TemperatureSensorList')
 
     class ScObjectCount(ApiObject):
@@ -267,11 +938,13 @@ class DellStorageApi:
         usedSpace: BytesString
 
     class ScController(ApiObject):
+        SECTION = 'dell_storage_controller'
         AGENT_FIELDS = [
             'lastBootTime', 'leader',
             'model', 'version',
             'serviceTag', 'expressServiceCode', 'hardwareSerialNumber',
         ]
+        ASSOCIATIONS = ['ports', 'fans', 'powersupplies', 'temperatures']
 
         instanceId: str
         instanceName: str
@@ -286,27 +959,31 @@ class DellStorageApi:
         hardwareSerialNumber: str
 
         @cached_property
-        def ports(self):
+        def ports(self) -> 'list[DellStorageApi.ScControllerPort]':
             return self._get_associations(f'/StorageCenter/ScController/{self.instanceId}/PhysicalControllerPortList')
 
         @cached_property
-        def fans(self):
+        def fans(self) -> 'list[DellStorageApi.ScControllerFanSensor]':
             return self._get_associations(f'/StorageCenter/ScController/{self.instanceId}/FanSensorList')
 
         @cached_property
-        def powersupplies(self):
+        def powersupplies(self) -> 'list[DellStorageApi.ScControllerPowerSupply]':
             return self._get_associations(f'/StorageCenter/ScController/{self.instanceId}/PowerSupplyList')
 
         @cached_property
-        def temperatures(self):
+        def temperatures(self) -> 'list[DellStorageApi.ScControllerTemperatureSensor]':
             return self._get_associations(f'/StorageCenter/ScController/{self.instanceId}/TemperatureSensorList')
 
     class ScControllerPort(ApiObject):
+        SECTION = 'dell_storage_port'
         AGENT_FIELDS = [
             'cabled', 'transportType', 'wwn',
             'iousage.readIops', 'iousage.readKbPerSecond', 'iousage.readLatency',
             'iousage.writeIops', 'iousage.writeKbPerSecond', 'iousage.writeLatency',
+            *HISTORICAL_EXTREMES,
         ]
+        ASSOCIATIONS = ['iousage']
+        LOW_PRIORITY = ['iousage']
 
         instanceId: str
         instanceName: str
@@ -315,20 +992,34 @@ class DellStorageApi:
         cabled: bool
         transportType: str
         wwn: str
+        scSerialNumber: str
 
         @cached_property
-        def iousage(self):
+        def iousage(self) -> 'DellStorageApi.ScControllerPortIoUsage':
             return self._get_historical_association(f'/StorageCenter/ScControllerPort/{self.instanceId}/GetHistoricalIoUsage')
 
     class ScControllerPortIoUsage(ApiObject):
-        readIops: int
+        readIops: float
         readKbPerSecond: DellStorageApiParser.kbps
         readLatency: DellStorageApiParser.latency
-        writeIops: int
+        writeIops: float
         writeKbPerSecond: DellStorageApiParser.kbps
         writeLatency: DellStorageApiParser.latency
+        readIopsMin: float
+        readIopsMax: float
+        readKbPerSecondMin: DellStorageApiParser.kbps
+        readKbPerSecondMax: DellStorageApiParser.kbps
+        readLatencyMin: DellStorageApiParser.latency
+        readLatencyMax: DellStorageApiParser.latency
+        writeIopsMin: float
+        writeIopsMax: float
+        writeKbPerSecondMin: DellStorageApiParser.kbps
+        writeKbPerSecondMax: DellStorageApiParser.kbps
+        writeLatencyMin: DellStorageApiParser.latency
+        writeLatencyMax: DellStorageApiParser.latency
 
     class ScControllerFanSensor(ApiObject):
+        SECTION = 'dell_storage_fan'
         AGENT_FIELDS = [
             'location',
             'currentRpm',
@@ -350,6 +1041,7 @@ class DellStorageApi:
         upperCriticalThreshold: str
 
     class ScControllerPowerSupply(ApiObject):
+        SECTION = 'dell_storage_psu'
         AGENT_FIELDS = ['location']
 
         instanceId: str
@@ -359,6 +1051,7 @@ class DellStorageApi:
         location: str
 
     class ScControllerTemperatureSensor(ApiObject):
+        SECTION = 'dell_storage_temp'
         AGENT_FIELDS = [
             'location',
             'currentTemperature',
@@ -380,10 +1073,12 @@ class DellStorageApi:
         upperCriticalThreshold: DellStorageApiParser.temperature
 
     class ScEnclosure(ApiObject):
+        SECTION = 'dell_storage_enclosure'
         AGENT_FIELDS = [
             'model', 'revision', 'type', 'enclosureCapacity',
             'serviceTag', 'expressServiceCode'
         ]
+        ASSOCIATIONS = ['fans', 'disks', 'powersupplies', 'temperatures']
 
         instanceId: str
         instanceName: str
@@ -397,22 +1092,23 @@ class DellStorageApi:
         expressServiceCode: str
 
         @cached_property
-        def fans(self):
+        def fans(self) -> 'list[DellStorageApi.ScEnclosureCoolingFanSensor]':
             return self._get_associations(f'/StorageCenter/ScEnclosure/{self.instanceId}/CoolingFanSensorList')
 
         @cached_property
-        def disks(self):
+        def disks(self) -> 'list[DellStorageApi.ScDisk]':
             return self._get_associations(f'/StorageCenter/ScEnclosure/{self.instanceId}/DiskList')
 
         @cached_property
-        def powersupplies(self):
+        def powersupplies(self) -> 'list[DellStorageApi.ScEnclosurePowerSupply]':
             return self._get_associations(f'/StorageCenter/ScEnclosure/{self.instanceId}/PowerSupplyList')
 
         @cached_property
-        def temperatures(self):
+        def temperatures(self) -> 'list[DellStorageApi.ScEnclosureTemperatureSensor]':
             return self._get_associations(f'/StorageCenter/ScEnclosure/{self.instanceId}/TemperatureSensorList')
 
     class ScEnclosureCoolingFanSensor(ApiObject):
+        SECTION = 'dell_storage_fan'
         AGENT_FIELDS = ['location']
 
         instanceId: str
@@ -422,23 +1118,28 @@ class DellStorageApi:
         location: str
 
     class ScDisk(ApiObject):
+        SECTION = 'dell_storage_disk'
         AGENT_FIELDS = [
             'usage.allocatedSpace', 'usage.totalSpace',
             'iousage.readIops', 'iousage.readKbPerSecond', 'iousage.readLatency',
             'iousage.writeIops', 'iousage.writeKbPerSecond', 'iousage.writeLatency',
+            *HISTORICAL_EXTREMES,
         ]
+        ASSOCIATIONS = ['usage', 'iousage']
+        LOW_PRIORITY = ['iousage']
 
         instanceId: str
         instanceName: str
         status: str
         statusMessage: str
+        scSerialNumber: str
 
         @cached_property
-        def usage(self):
+        def usage(self) -> 'DellStorageApi.ScDiskStorageUsage':
             return self._get_association(f'/StorageCenter/ScDisk/{self.instanceId}/StorageUsage')
 
         @cached_property
-        def iousage(self):
+        def iousage(self) -> 'DellStorageApi.ScDiskIoUsage':
             return self._get_historical_association(f'/StorageCenter/ScDisk/{self.instanceId}/GetHistoricalIoUsage')
 
     class ScDiskIoUsage(ScControllerPortIoUsage):
@@ -460,24 +1161,28 @@ class DellStorageApi:
         pass
 
     class ScVolume(ApiObject):
+        SECTION = 'dell_storage_volume'
         AGENT_FIELDS = [
             'usage.activeSpace', 'usage.configuredSpace',
             'iousage.readIops', 'iousage.readKbPerSecond', 'iousage.readLatency',
             'iousage.writeIops', 'iousage.writeKbPerSecond', 'iousage.writeLatency',
+            *HISTORICAL_EXTREMES,
         ]
+        ASSOCIATIONS = ['usage', 'iousage']
 
         instanceId: str
         instanceName: str
         status: str
         statusMessage: str
         active: bool
+        scSerialNumber: str
 
         @cached_property
-        def usage(self):
+        def usage(self) -> 'DellStorageApi.ScVolumeStorageUsage':
             return self._get_association(f'/StorageCenter/ScVolume/{self.instanceId}/StorageUsage')
 
         @cached_property
-        def iousage(self):
+        def iousage(self) -> 'DellStorageApi.ScVolumeIoUsage':
             return self._get_historical_association(f'/StorageCenter/ScVolume/{self.instanceId}/GetHistoricalIoUsage')
 
     class ScVolumeIoUsage(ScControllerPortIoUsage):
@@ -488,6 +1193,7 @@ class DellStorageApi:
         configuredSpace: DellStorageApiParser.space
 
     class ScAlert(ApiObject):
+        SECTION = 'dell_storage_alert'
         AGENT_DEFAULT_FIELDS = []
         AGENT_FIELDS = [
             'alertDefinition',
@@ -502,6 +1208,114 @@ class DellStorageApi:
         supportUrl: str
 
 
+SECTIONS = (
+    'dell_storage_center', 'dell_storage_controller', 'dell_storage_port',
+    'dell_storage_enclosure', 'dell_storage_disk', 'dell_storage_volume',
+    'dell_storage_alert', 'dell_storage_fan', 'dell_storage_psu', 'dell_storage_temp',
+)
+
+
+def section_list(value):
+    sections = [f'dell_storage_{section.removeprefix("dell_storage_")}' for section in value.split(',') if section]
+    for section in sections:
+        if section not in SECTIONS:
+            raise argparse.ArgumentTypeError(f'unknown section {section!r}')
+    return sections
+
+
+def cache_ttl(value):
+    otype, ttl = value.split('=', 1)
+    return otype, int(ttl)
+
+
+def object_count(value):
+    otype, count = value.split('=', 1)
+    return otype, int(count)
+
+
+class PrefetchPlanner:
+    """Resolve the ApiObject tree along its static association graph.
+
+    Every association is submitted as soon as the object it belongs to is
+    known, so the run takes about depth times the slowest call instead of
+    the sum of all calls.
+    """
+
+    def __init__(self, executor):
+        self._executor = executor
+        self.requests = 0
+        self.depth = 0
+        self.slowest = 0.0
+
+    @staticmethod
+    def children(values):
+        children = []
+        for value in values:
+            if isinstance(value, list):
+                children += [obj for obj in value if isinstance(obj, DellStorageApi.ApiObject)]
+            elif isinstance(value, DellStorageApi.ApiObject):
+                children.append(value)
+        return children
+
+    @staticmethod
+    def plan(topology, root=None, sections=None):
+        """Return the expected requests per depth.
+
+        The topology maps an object type to the number of objects per parent,
+        unknown types count as one. Depth 0 is the StorageCenter list.
+        Associations not needed for the sections are left out, like the
+        agent does when it collects them.
+        """
+        levels = [1]
+        stack = [(root or DellStorageApi.StorageCenter, topology.get('StorageCenter', 1), 1)]
+        while stack:
+            cls, count, depth = stack.pop()
+            if count <= 0:
+                continue
+            if len(levels) <= depth:
+                levels.append(0)
+            for name in cls.ASSOCIATIONS + cls.REFERENCES:
+                if not cls.wants(name, sections):
+                    continue
+                levels[depth] += count
+                target, many = cls.association_type(name)
+                if name in cls.ASSOCIATIONS and target is not None:
+                    stack.append((target, count * topology.get(target.__name__, 1) if many else count, depth + 1))
+        while levels[-1] == 0:
+            levels.pop()
+        return levels
+
+    def _timed(self, obj, name):
+        start = time.monotonic()
+        value = getattr(obj, name)
+        return value, time.monotonic() - start
+
+    def run(self, objects):
+        pending = {}
+        done = queue.SimpleQueue()
+
+        def submit(obj, depth):
+            for name in obj.ASSOCIATIONS + obj.REFERENCES:
+                future = self._executor.submit(self._timed, obj, name)
+                pending[future] = (obj, name, depth)
+                future.add_done_callback(done.put)
+
+        for obj in objects:
+            submit(obj, 1)
+        while pending:
+            # Done callbacks also fire for futures cancelled by an executor
+            # shutdown, futures.wait() would block on them forever.
+            future = done.get()
+            obj, name, depth = pending.pop(future)
+            value, duration = future.result()
+            self.requests += 1
+            self.depth = max(self.depth, depth)
+            self.slowest = max(self.slowest, duration)
+            if name in obj.ASSOCIATIONS:
+                for child in self.children([value]):
+                    submit(child, depth + 1)
+
+
 class AgentDellStorage:
     def run(self):
         special_agent_main(self.parse_arguments, self.main)
@@ -517,84 +1331,311 @@ class AgentDellStorage:
                             help='URL of the DSM RESt API. (Example https://host:3033/api/rest/)')
         parser.add_argument('--ignore-cert', dest='verify_cert', action='store_false',
                             help='Do not verify the SSL cert from the REST andpoint.')
+        parser.add_argument('--workers', dest='workers', type=int, default=1,
+                            help='Number of parallel requests to the DSM. (Default: 1)')
+        parser.add_argument('--deadline', dest='deadline', type=float, default=None,
+                            help='Time budget in seconds for the whole run including the login. No request waits longer '
+                                 'than the budget left. Low priority associations are skipped once less than a quarter of '
+                                 'it is left, all associations once it is used up.')
+        parser.add_argument('--storage-center-timeout', dest='storage_center_timeout', type=float, default=120,
+                            help='Timeout in seconds to collect a single storage center. (Default: 120)')
+        parser.add_argument('--connect-timeout', dest='connect_timeout', type=float, default=10,
+                            help='Timeout in seconds to connect to the DSM. (Default: 10)')
+        parser.add_argument('--read-timeout', dest='read_timeout', type=float, default=60,
+                            help='Timeout in seconds to wait for a DSM response. (Default: 60)')
+        parser.add_argument('--stream-json', dest='stream_json', action='store_true',
+                            help='Decode list responses one object at a time to keep the memory usage flat.')
+        parser.add_argument('--historical-window', dest='historical_window', type=int, default=10,
+                            help='Minutes of historical IO usage to query at most. (Default: 10)')
+        parser.add_argument('--historical-samples', dest='historical_samples', type=int, default=None,
+                            help='Maximal number of historical IO usage samples to query. (Default: all)')
+        parser.add_argument('--no-historical-state', dest='historical_state', action='store_false',
+                            help='Always query the whole historical window instead of the IO usage since the last '
+                                 'complete run of each Storage Center.')
+        parser.add_argument('--no-cache', dest='cache', action='store_false',
+                            help='Do not cache slow changing objects between runs.')
+        parser.add_argument('--cache-ttl', dest='cache_ttl', type=cache_ttl, action='append', default=[],
+                            metavar='OBJECTTYPE=SECONDS',
+                            help='Cache responses of this object type for SECONDS. Objects with a status are '
+                                 'reported with the cached status. (Default: ScChassis=86400)')
+        parser.add_argument('--tiered-polling', dest='tiered_polling', type=int, nargs='?', default=None,
+                            const=PollingScheduler.DEFAULT_INTERVAL, metavar='SECONDS',
+                            help='Refresh sensors and storage usage only every SECONDS and replay their last sections '
+                                 'in between. (Default: 3600)')
+        parser.add_argument('--refresh-interval', dest='refresh_interval', type=cache_ttl, action='append', default=[],
+                            metavar='OBJECTTYPE=SECONDS',
+                            help='Refresh interval of a sensor object type with --tiered-polling.')
+        parser.add_argument('--no-session-reuse', dest='session_reuse', action='store_false',
+                            help='Do not reuse the DSM session between runs and logout at the end.')
+        parser.add_argument('--sections', dest='sections', type=section_list, default=None, metavar='SECTION,...',
+                            help='Only collect these sections, e.g. volume,alert. Associations only needed by other '
+                                 'sections are not fetched. (Default: all)')
+        parser.add_argument('--exclude-sections', dest='exclude_sections', type=section_list, default=[],
+                            metavar='SECTION,...', help='Do not collect these sections.')
+        parser.add_argument('--record', dest='record', metavar='DIR', default=None,
+                            help='Write every DSM response with its latency into DIR, laid out like the test fixtures. '
+                                 'Credentials and session keys are scrubbed. Streamed responses are kept in memory until decoded.')
+        parser.add_argument('--replay', dest='replay', metavar='DIR', default=None,
+                            help='Serve the DSM responses recorded in DIR instead of querying the DSM.')
+        parser.add_argument('--replay-speed', dest='replay_speed', type=float, default=1.0, metavar='FACTOR',
+                            help='Scale the recorded latencies by FACTOR in --replay, 0 disables them. (Default: 1.0)')
+        parser.add_argument('--plan', dest='plan', action='store_true',
+                            help='Do not query the DSM, print the expected requests for the --topology.')
+        parser.add_argument('--topology', dest='topology', type=object_count, action='append', default=[],
+                            metavar='OBJECTTYPE=COUNT',
+                            help='Number of objects of this type per parent for --plan. (Default: 1)')
 
         return parser.parse_args(argv)
 
-    def main(self, args: Args):
-        self.args = args
+    def _state_file(self, key, suffix):
+        key = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return os.path.join(paths.tmp_dir, 'agents', 'agent_dell_storage', f'{key}.{suffix}')
 
-        start = time.time()
-
-        try:
-            self._api = DellStorageApi(args.url, args.user, args.password, args.verify_cert)
-            for storageCenter in self._api.storage_centers:
-                with ConditionalPiggybackSection(storageCenter.safeInstanceName):
-                    with SectionWriter('dell_storage_center', separator=';') as writer:
-                        writer.append(storageCenter)
-
-                    with SectionWriter('dell_storage_controller', separator=';') as writer:
-                        writer.append(c for c in storageCenter.controllers)
-
-                    with SectionWriter('dell_storage_enclosure', separator=';') as writer:
-                        writer.append(e for e in storageCenter.enclosures)
+    def _cache(self):
+        if not self.args.cache:
+            return None
 
-                    with SectionWriter('dell_storage_volume', separator=';') as writer:
-                        writer.append(v for v in storageCenter.volumes)
+        ttl = dict(DellStorageCache.DEFAULT_TTL)
+        if self.args.tiered_polling:
+            ttl.update(dict.fromkeys(PollingScheduler.USAGE_TYPES, self.args.tiered_polling))
+        path = self._state_file(self.args.url, 'json')
+        return DellStorageCache(path, dict(ttl, **dict(self.args.cache_ttl)))
 
-                    with SectionWriter('dell_storage_alert', separator=';') as writer:
-                        writer.append(a for a in storageCenter.activeAlerts)
+    def _scheduler(self):
+        if not self.args.tiered_polling:
+            return None
 
-                if storageCenter.chassisPresent:
-                    with ConditionalPiggybackSection(f'{storageCenter.safeInstanceName}-{storageCenter.chassi.enclosure.safeInstanceName}'):
-                        with SectionWriter('dell_storage_fan', separator=';') as writer:
-                            writer.append(f for f in storageCenter.chassi.fans)
+        path = self._state_file(self.args.url, 'schedule')
+        intervals = dict.fromkeys(PollingScheduler.SENSOR_TYPES, self.args.tiered_polling)
+        return PollingScheduler(path, dict(intervals, **dict(self.args.refresh_interval)))
 
-                        with SectionWriter('dell_storage_psu', separator=';') as writer:
-                            writer.append(p for p in storageCenter.chassi.powersupplies)
+    def _historical_file(self):
+        if not self.args.historical_state:
+            return None
 
-                        with SectionWriter('dell_storage_temp', separator=';') as writer:
-                            writer.append(t for t in storageCenter.chassi.temperatures)
+        return self._state_file(self.args.url, 'historical')
 
-                for controller in storageCenter.controllers:
-                    with ConditionalPiggybackSection(f'{storageCenter.safeInstanceName}-{controller.safeInstanceName}'):
-                        with SectionWriter('dell_storage_controller', separator=';') as writer:
-                            writer.append(controller)
+    def _historical_state(self):
+        path = self._historical_file()
+        if path is None:
+            return {}
 
-                        with SectionWriter('dell_storage_port', separator=';') as writer:
-                            writer.append(p for p in controller.ports)
+        try:
+            with open(path) as fd:
+                state = json.load(fd)
+        except (OSError, ValueError):
+            return {}
+        return state if isinstance(state, dict) else {}
+
+    def _historical_since(self):
+        return {serial_number: datetime.datetime.fromtimestamp(start)
+                for serial_number, start in self._historical_state().items() if isinstance(start, (int, float))}
+
+    def _save_historical_since(self, start, storage_centers):
+        """Advance the start of the next historical IO window for the
+        Storage Centers whose samples were all collected in this run."""
+        path = self._historical_file()
+        if path is None or not storage_centers:
+            return
+
+        state = dict(self._historical_state(), **{sc.serialNumber: start for sc in storage_centers})
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(f'{path}.new', 'w') as fd:
+            json.dump(state, fd)
+        os.replace(f'{path}.new', path)
+
+    def _session_file(self):
+        if not self.args.session_reuse:
+            return None
 
-                        with SectionWriter('dell_storage_fan', separator=';') as writer:
-                            writer.append(f for f in controller.fans)
+        return self._state_file(f'{self.args.user}@{self.args.url}', 'session')
+
+    def _error(self, exc):
+        if isinstance(exc, TimeoutError):
+            return f'Timeout after {self.args.storage_center_timeout}s'
+        return str(exc) or type(exc).__name__
+
+    def _prefetch(self, executor, storageCenter):
+        start = time.monotonic()
+        planner = PrefetchPlanner(executor)
+        planner.run([storageCenter])
+        LOGGING.info('Prefetched {requests} associations of {sc} in {elapsed:.3f}s, critical path {depth} calls, '
+                     'slowest call {slowest:.3f}s'.format(requests=planner.requests, sc=storageCenter.instanceName,
+                                                          elapsed=time.monotonic() - start,
+                                                          depth=planner.depth, slowest=planner.slowest))
+
+    def _collect_storage_centers(self, storage_centers):
+        failed = {}
+        if not storage_centers:
+            return failed
+
+        LOGGING.info('Collect {count} storage centers with {workers} workers each'.format(
+            count=len(storage_centers), workers=self.args.workers))
+        # Every storage center gets its own workers and connections, a hung
+        # one can not starve the others.
+        workers = max(self.args.workers, 1)
+        self._api.resize_pool(workers * len(storage_centers))
+        executors = [ThreadPoolExecutor(max_workers=workers) for _ in storage_centers]
+        sc_executor = ThreadPoolExecutor(max_workers=len(storage_centers))
+        try:
+            futures = [sc_executor.submit(self._prefetch, executor, sc) for executor, sc in zip(executors, storage_centers)]
+            deadline = time.monotonic() + self.args.storage_center_timeout
+            for storageCenter, future in zip(storage_centers, futures):
+                try:
+                    future.result(timeout=max(deadline - time.monotonic(), 0))
+                except Exception as exc:
+                    if self.args.debug:
+                        raise
+                    LOGGING.warning(f'Failed to collect storage center {storageCenter.instanceName}: {exc!r}')
+                    failed[storageCenter] = self._error(exc)
+        finally:
+            sc_executor.shutdown(wait=False, cancel_futures=True)
+            for executor in executors:
+                executor.shutdown(wait=False, cancel_futures=True)
+        return failed
+
+    def _write(self, section, values):
+        if section not in self._sections:
+            return
+
+        with SectionWriter(section, separator=';') as writer:
+            writer.append(values)
+
+    def _write_association(self, host, section, obj, name):
+        if section not in self._sections:
+            return
+
+        scheduler = self._api.scheduler
+        otype = type(obj).association_type(name)[0].__name__
+        interval = scheduler.interval(otype) if scheduler is not None else None
+        if interval is None:
+            self._write(section, (o for o in getattr(obj, name)))
+            return
+
+        key = f'{host}/{section}/{type(obj).__name__}'
+        if scheduler.due(otype):
+            rows = [str(o) for o in getattr(obj, name)]
+            scheduler.store(key, otype, rows)
+            with SectionWriter(section, separator=';') as writer:
+                writer.append(rows)
+        elif (entry := scheduler.replay(key)) is not None:
+            with SectionWriter(f'{section}:cached({entry["time"]},{interval})', separator=';') as writer:
+                writer.append(entry['rows'])
+
+    def _write_endpoints(self):
+        if not hasattr(self, '_api'):
+            return
+
+        with SectionWriter('dell_storage_agent_endpoints', separator=';') as writer:
+            writer.append(f'{endpoint};{stats}' for endpoint, stats in sorted(self._api.endpoints.items()))
+
+    def _section_filter(self):
+        return self._sections if self._sections != set(SECTIONS) else None
+
+    def _plan(self):
+        levels = PrefetchPlanner.plan(dict(self.args.topology), sections=self._section_filter())
+        sys.stdout.write('Login: 1 request\n')
+        for depth, count in enumerate(levels):
+            sys.stdout.write(f'Depth {depth}: {count} requests\n')
+        sys.stdout.write(f'Total: {1 + sum(levels)} requests\n')
+        sys.stdout.write(f'Critical path: {1 + len(levels)} requests\n')
 
-                        with SectionWriter('dell_storage_psu', separator=';') as writer:
-                            writer.append(p for p in controller.powersupplies)
+    def main(self, args: Args):
+        self.args = args
+        self._sections = set(args.sections or SECTIONS) - set(args.exclude_sections)
 
-                        with SectionWriter('dell_storage_temp', separator=';') as writer:
-                            writer.append(t for t in controller.temperatures)
+        if args.plan:
+            self._plan()
+            return
 
-                for enclosure in storageCenter.enclosures:
-                    with ConditionalPiggybackSection(f'{storageCenter.safeInstanceName}-{enclosure.safeInstanceName}'):
-                        with SectionWriter('dell_storage_enclosure', separator=';') as writer:
-                            writer.append(enclosure)
+        start = time.time()
 
-                        with SectionWriter('dell_storage_fan', separator=';') as writer:
-                            writer.append(f for f in enclosure.fans)
+        try:
+            options = dict(
+                historical_window=args.historical_window,
+                historical_samples=args.historical_samples,
+                historical_since=self._historical_since(),
+                cache=self._cache(),
+                session_file=self._session_file(),
+                pool_size=max(args.workers, 1),
+                timeout=(args.connect_timeout, args.read_timeout),
+                stream=args.stream_json,
+                deadline=args.deadline,
+                scheduler=self._scheduler(),
+                sections=self._section_filter(),
+                recorder=DellStorageRecorder(args.record) if args.record else None,
+                replay=DellStorageReplayAdapter(args.replay, args.url, args.replay_speed) if args.replay else None,
+            )
+            self._api = DellStorageApi(args.url, args.user, args.password, args.verify_cert, **options)
+            failed = self._collect_storage_centers(self._api.storage_centers)
+            for storageCenter in self._api.storage_centers:
+                if storageCenter in failed:
+                    continue
 
-                        with SectionWriter('dell_storage_disk', separator=';') as writer:
-                            writer.append(d for d in enclosure.disks)
+                with ConditionalPiggybackSection(storageCenter.safeInstanceName):
+                    self._write('dell_storage_center', storageCenter)
+                    self._write('dell_storage_controller', (c for c in storageCenter.controllers))
+                    self._write('dell_storage_enclosure', (e for e in storageCenter.enclosures))
+                    self._write('dell_storage_volume', (v for v in storageCenter.volumes))
+                    self._write('dell_storage_alert', (a for a in storageCenter.activeAlerts))
+
+                # The enclosure names the piggyback host, without it (skipped
+                # after the deadline) the chassis sensors can not be placed.
+                enclosure = storageCenter.chassi.enclosure if storageCenter.chassi is not None else None
+                if enclosure is not None:
+                    host = f'{storageCenter.safeInstanceName}-{enclosure.safeInstanceName}'
+                    with ConditionalPiggybackSection(host):
+                        self._write_association(host, 'dell_storage_fan', storageCenter.chassi, 'fans')
+                        self._write_association(host, 'dell_storage_psu', storageCenter.chassi, 'powersupplies')
+                        self._write_association(host, 'dell_storage_temp', storageCenter.chassi, 'temperatures')
 
-                        with SectionWriter('dell_storage_psu', separator=';') as writer:
-                            writer.append(p for p in enclosure.powersupplies)
+                for controller in storageCenter.controllers:
+                    host = f'{storageCenter.safeInstanceName}-{controller.safeInstanceName}'
+                    with ConditionalPiggybackSection(host):
+                        self._write('dell_storage_controller', controller)
+                        self._write('dell_storage_port', (p for p in controller.ports))
+                        self._write_association(host, 'dell_storage_fan', controller, 'fans')
+                        self._write_association(host, 'dell_storage_psu', controller, 'powersupplies')
+                        self._write_association(host, 'dell_storage_temp', controller, 'temperatures')
 
-                        with SectionWriter('dell_storage_temp', separator=';') as writer:
-                            writer.append(t for t in enclosure.temperatures)
+                for enclosure in storageCenter.enclosures:
+                    host = f'{storageCenter.safeInstanceName}-{enclosure.safeInstanceName}'
+                    with ConditionalPiggybackSection(host):
+                        self._write('dell_storage_enclosure', enclosure)
+                        self._write_association(host, 'dell_storage_fan', enclosure, 'fans')
+                        self._write('dell_storage_disk', (d for d in enclosure.disks))
+                        self._write_association(host, 'dell_storage_psu', enclosure, 'powersupplies')
+                        self._write_association(host, 'dell_storage_temp', enclosure, 'temperatures')
         except Exception as exc:
             if args.debug:
                 raise
             end = time.time()
             with SectionWriter('dell_storage_agent', separator=';') as writer:
                 writer.append(f'1;;;{end - start};;{exc}')
+            self._write_endpoints()
         else:
+            if self._api.cache is not None:
+                self._api.cache.save()
+            if self._api.scheduler is not None:
+                self._api.scheduler.save(complete=not failed and not self._api.skipped)
+            if not self._api.skipped:
+                self._save_historical_since(start, [sc for sc in self._api.storage_centers if sc not in failed])
             end = time.time()
             with SectionWriter('dell_storage_agent', separator=';') as writer:
                 writer.append(f'0;{self._api.provider};{self._api.providerVersion};{end - start};{self._api.reqcnt};')
+                if self._api.cache is not None:
+                    writer.append(f'cache;{self._api.cache.hits};{self._api.cache.misses}')
+                writer.append('connections;{};{}'.format(*self._api.connection_stats()))
+                writer.append(f'duplicates;{self._api.duplicates}')
+                for storageCenter, error in failed.items():
+                    writer.append(f'storage_center;{storageCenter.instanceName};{error}')
+                if self._api.skipped:
+                    writer.append(f'partial;{self._api.skipped}')
+                if skipped := [section for section in SECTIONS if section not in self._sections]:
+                    writer.append(';'.join(['skipped_sections'] + skipped))
+            self._write_endpoints()
+        finally:
+            if not args.session_reuse and hasattr(self, '_api'):
+                self._api.logout()
+            if hasattr(self, '_api') and self._api.recorder is not None:
+                self._api.recorder.save()
@@ -19,11 +19,34 @@
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 
+import math
+import sys
+from array import array
+from heapq import nlargest
+from itertools import compress
+from operator import add, mul
+from collections.abc import Mapping
+from typing import get_args, get_type_hints
 from cmk.agent_based.v2 import (
+    check_levels,
+    render,
     State,
     Result,
 )
 
+MISSING = ('', 'None')
+
+PERCENTILES = (50, 90, 99)
+
+IO_FIELDS = {
+    'read_ios': 'readIops',
+    'read_throughput': 'readBps',
+    'read_latency': 'readLatency',
+    'write_ios': 'writeIops',
+    'write_throughput': 'writeBps',
+    'write_latency': 'writeLatency',
+}
+
 
 def DSStatus(value):
     return {
@@ -39,3 +62,267 @@ def DSResult(dsobject):
         yield Result(state=DSStatus(dsobject.status), summary=f'{dsobject.status}: {dsobject.statusMessage}')
     else:
         yield Result(state=DSStatus(dsobject.status), summary=dsobject.status)
+
+
+def DSColumn(annotation):
+    """Return the converter for one agent column of the given type.
+
+    int and float columns are converted, every other type is kept as the
+    agent wrote it. Optional columns map an empty or 'None' value to None,
+    everything else has to be a valid number.
+    """
+    types = [arg for arg in get_args(annotation) if arg is not type(None)]
+    optional = len(types) < len(get_args(annotation))
+    kind = types[0] if optional else annotation
+    if kind not in (int, float):
+        return str
+
+    def convert(value):
+        if optional and value in MISSING:
+            return None
+        return kind(value)
+    return convert
+
+
+def DSParser(cls):
+    """Return a function building a cls instance from an agent row.
+
+    Rows shorter than cls keep the defaults of the missing fields.
+    """
+    columns = [DSColumn(annotation) for annotation in get_type_hints(cls).values()]
+
+    def parse(row):
+        return cls(*[column(value) for column, value in zip(columns, row)])
+    return parse
+
+
+def DSIo(dsobject):
+    """Return the IO columns of dsobject as diskstat dict.
+
+    Returns None if the DSM reported no IO usage for the object.
+    """
+    disk = {key: getattr(dsobject, field) for key, field in IO_FIELDS.items()}
+    if None in disk.values():
+        return None
+    return disk
+
+
+def DSLatencyPeak(dsobject, params):
+    """Check the highest read and write latency of all samples since the
+    last agent run against the `read_latency_peak` and `write_latency_peak`
+    levels."""
+    values = {op: getattr(dsobject, f'{op}LatencyMax', None) for op in ('read', 'write')}
+    if all(value is None for value in values.values()):
+        yield Result(state=State.OK, summary='No IO usage reported')
+        return
+
+    for op, value in values.items():
+        if value is None:
+            continue
+        yield from check_levels(
+            value,
+            levels_upper=params.get(f'{op}_latency_peak'),
+            metric_name=f'dell_storage_{op}_latency_peak',
+            render_func=render.timespan,
+            label=f'{op.capitalize()} latency peak',
+        )
+
+
+def DSIoTotal(section):
+    """Return the summed up IO of all rows of a DSColumns section.
+
+    Operations and throughput are summed, the latencies are the mean
+    weighted by the read and write operations. Rows without IO usage are
+    skipped. Returns the diskstat dict and the number of rows with IO.
+    """
+    columns = {key: section.column(field) for key, field in IO_FIELDS.items()}
+    valid = list(map(math.isfinite, map(math.fsum, zip(*columns.values()))))
+    columns = {key: list(compress(column, valid)) for key, column in columns.items()}
+
+    disk = {}
+    for op in ('read', 'write'):
+        ios = math.fsum(columns[f'{op}_ios'])
+        disk[f'{op}_ios'] = ios
+        disk[f'{op}_throughput'] = math.fsum(columns[f'{op}_throughput'])
+        disk[f'{op}_latency'] = math.fsum(map(mul, columns[f'{op}_ios'], columns[f'{op}_latency'])) / ios if ios else 0.0
+    return disk, sum(valid)
+
+
+def DSLatency(section, op, worst=5):
+    """Return the latency percentiles of op ('read' or 'write') over all
+    rows of a DSColumns section with op operations.
+
+    Returns a dict with the nearest rank percentiles `p50`, `p90`, `p99`
+    and `max` (empty if no row did any op) and the names and latencies of
+    the `worst` slowest rows, slowest first.
+    """
+    names = section.column('name')
+    latencies = section.column(f'{op}Latency')
+    # NaN > 0 is False, so rows without IO usage drop out as well
+    rows = [idx for idx, ios in enumerate(section.column(f'{op}Iops')) if ios > 0 and latencies[idx] == latencies[idx]]
+    if not rows:
+        return {}, []
+    rows.sort(key=latencies.__getitem__)
+
+    percentiles = {f'p{pct}': latencies[rows[max(math.ceil(pct / 100 * len(rows)) - 1, 0)]] for pct in PERCENTILES}
+    percentiles['max'] = latencies[rows[-1]]
+    return percentiles, [(names[idx], latencies[idx]) for idx in reversed(rows[-worst:])]
+
+
+def DSTop(section, count):
+    """Return the count busiest rows of a DSColumns section.
+
+    Rows are ranked by operations, throughput and latency (weighted by
+    the read and write operations), with a partial selection instead of a
+    full sort. Returns a dict of the category to its share of the total
+    (None for latency) and the names and values of the top rows.
+    """
+    names = section.column('name')
+    iops = list(map(add, section.column('readIops'), section.column('writeIops')))
+    bps = list(map(add, section.column('readBps'), section.column('writeBps')))
+    latency = [
+        (read_ios * read_latency + write_ios * write_latency) / ios if ios else 0.0
+        for read_ios, read_latency, write_ios, write_latency, ios in zip(
+            section.column('readIops'), section.column('readLatency'),
+            section.column('writeIops'), section.column('writeLatency'), iops,
+        )
+    ]
+    valid = list(map(math.isfinite, map(math.fsum, zip(iops, bps, latency))))
+    rows = list(compress(range(len(names)), valid))
+
+    top = {}
+    for category, values, total in (
+        ('iops', iops, math.fsum(compress(iops, valid))),
+        ('throughput', bps, math.fsum(compress(bps, valid))),
+        ('latency', latency, None),
+    ):
+        selected = nlargest(count, rows, key=values.__getitem__)
+        share = None
+        if total is not None:
+            share = math.fsum(values[idx] for idx in selected) / total if total else 0.0
+        top[category] = share, [(names[idx], values[idx]) for idx in selected]
+    return top
+
+
+def DSSection(cls, string_table):
+    """Parse rows into a dict of cls instances keyed by item name.
+
+    Objects sharing a name (e.g. volumes on different Storage Centers) keep
+    their own service: the first one keeps the plain name, later ones get a
+    ` #2`, ` #3` ... suffix in the order the agent wrote them.
+    """
+    parse = DSParser(cls)
+    section = {}
+    for row in string_table:
+        obj = parse(row)
+        section[DSItem(section, obj.name)] = obj
+    return section
+
+
+def DSItem(section, name):
+    """Return the first of name, `name #2`, `name #3` ... not in section."""
+    item, idx = name, 1
+    while item in section:
+        idx += 1
+        item = f'{name} #{idx}'
+    return item
+
+
+class DSRow:
+    """Read only view of one row of a DSColumns section.
+
+    Behaves like the cls instance DSSection would have built for the row.
+    """
+
+    __slots__ = ('_section', '_idx')
+
+    def __init__(self, section, idx):
+        self._section = section
+        self._idx = idx
+
+    def __getattr__(self, field):
+        return self._section.value(self._idx, field)
+
+    def __iter__(self):
+        return (self._section.value(self._idx, field) for field in self._section.fields)
+
+    def __eq__(self, other):
+        return tuple(self) == tuple(other)
+
+    def __repr__(self):
+        values = ', '.join(f'{field}={value!r}' for field, value in zip(self._section.fields, self))
+        return f'{type(self).__name__}({values})'
+
+
+class DSColumns(Mapping):
+    """Columnar alternative to DSSection for sections with many rows.
+
+    Maps the item name (with the same duplicate handling as DSSection) to
+    a DSRow view, but stores the rows column by column: str columns as
+    lists of interned strings, int and float columns in arrays. Optional
+    numeric columns are stored as double with NaN for a missing value, so
+    `column()` can be summed up without looking at the rows.
+    """
+
+    __slots__ = ('fields', '_columns', '_readers', '_index')
+
+    def __init__(self, cls, string_table):
+        hints = get_type_hints(cls)
+        self.fields = {field: pos for pos, field in enumerate(hints)}
+        self._columns = []
+        self._readers = []
+        self._index = {}
+
+        writers = []
+        for field, annotation in hints.items():
+            column, writer, reader = self._storage(annotation)
+            self._columns.append(column)
+            self._readers.append(reader)
+            writers.append((column.append, writer, DSColumn(annotation), cls._field_defaults.get(field)))
+
+        names = self._columns[self.fields['name']]
+        for row in string_table:
+            for idx, (append, writer, convert, default) in enumerate(writers):
+                append(writer(convert(row[idx]) if idx < len(row) else default))
+            self._index[DSItem(self._index, names[-1])] = len(names) - 1
+
+    @staticmethod
+    def _storage(annotation):
+        """Return the column, the value to column and the column to value function."""
+        types = [arg for arg in get_args(annotation) if arg is not type(None)]
+        optional = len(types) < len(get_args(annotation))
+        kind = types[0] if optional else annotation
+        if kind not in (int, float):
+            return [], lambda value: value if value is None else sys.intern(value), None
+        if not optional:
+            return array('q' if kind is int else 'd'), kind, None
+        return (
+            array('d'),
+            lambda value: math.nan if value is None else value,
+            lambda value: None if math.isnan(value) else kind(value),
+        )
+
+    def __getitem__(self, item):
+        return DSRow(self, self._index[item])
+
+    def __contains__(self, item):
+        return item in self._index
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def column(self, field):
+        """Return the column of field, in the order of the agent output."""
+        return self._columns[self.fields[field]]
+
+    def value(self, idx, field):
+        try:
+            pos = self.fields[field]
+        except KeyError:
+            raise AttributeError(field) from None
+        value = self._columns[pos][idx]
+        reader = self._readers[pos]
+        return value if reader is None else reader(value)
@@ -24,7 +24,10 @@ from cmk.rulesets.v1.form_specs import (
     DefaultValue,
     DictElement,
     Dictionary,
+    Integer,
     migrate_to_password,
+    MultipleChoice,
+    MultipleChoiceElement,
     Password,
     SingleChoice,
     SingleChoiceElement,
@@ -40,6 +43,20 @@ def migrate_bool_to_choice(model: object) -> str:
     return model
 
 
+SECTIONS = [
+    MultipleChoiceElement(name='center', title=Title('Storage Center')),
+    MultipleChoiceElement(name='controller', title=Title('Controllers')),
+    MultipleChoiceElement(name='port', title=Title('Controller ports')),
+    MultipleChoiceElement(name='enclosure', title=Title('Enclosures')),
+    MultipleChoiceElement(name='disk', title=Title('Disks')),
+    MultipleChoiceElement(name='volume', title=Title('Volumes')),
+    MultipleChoiceElement(name='alert', title=Title('Alerts')),
+    MultipleChoiceElement(name='fan', title=Title('Fans')),
+    MultipleChoiceElement(name='psu', title=Title('Power supplies')),
+    MultipleChoiceElement(name='temp', title=Title('Temperatures')),
+]
+
+
 def _form_special_agents_dell_storage() -> Dictionary:
     return Dictionary(
         title=Title('Dell Storage via Dell Storage API'),
@@ -80,6 +97,42 @@ def _form_special_agents_dell_storage() -> Dictionary:
                 ),
                 required=True,
             ),
+            'workers': DictElement(
+                parameter_form=Integer(
+                    title=Title('Number of parallel requests'),
+                    help_text=Help('Fetch the objects of a StorageCenter with this many parallel requests to the DSM.'),
+                    prefill=DefaultValue(4),
+                    custom_validate=(validators.NumberInRange(min_value=1, max_value=64),),
+                ),
+            ),
+            'tiered_polling': DictElement(
+                parameter_form=Integer(
+                    title=Title('Refresh interval of sensors and storage usage'),
+                    help_text=Help('Fetch fans, power supplies, temperatures and the storage usage only this often '
+                                   'and report their last known state in between. This allows to run the agent '
+                                   'every minute for the IO usage without querying everything from the DSM. '
+                                   'Without this setting, only the chassis is cached between runs. Controllers, '
+                                   'enclosures, disks and volumes are fetched on every run, because the DSM '
+                                   'returns their status in the same objects as their static fields.'),
+                    unit_symbol='s',
+                    prefill=DefaultValue(3600),
+                    custom_validate=(validators.NumberInRange(min_value=60),),
+                ),
+            ),
+            'sections': DictElement(
+                parameter_form=MultipleChoice(
+                    title=Title('Only collect these sections'),
+                    help_text=Help('Objects only needed by other sections are not fetched from the DSM.'),
+                    elements=SECTIONS,
+                    custom_validate=(validators.LengthInRange(min_value=1),),
+                ),
+            ),
+            'exclude_sections': DictElement(
+                parameter_form=MultipleChoice(
+                    title=Title('Do not collect these sections'),
+                    elements=SECTIONS,
+                ),
+            ),
         }
     )
 
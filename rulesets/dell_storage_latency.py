@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- encoding: utf-8; py-indent-offset: 4 -*-
+#
+# checkmk_dell_storage - Checkmk extension for Dell Storage API
+#
+# Copyright (C) 2021-2024  Marius Rieder <marius.rieder@durchmesser.ch>
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+from cmk.rulesets.v1 import Title, Help
+from cmk.rulesets.v1.form_specs import (
+    DefaultValue,
+    DictElement,
+    Dictionary,
+    LevelDirection,
+    SimpleLevels,
+    TimeMagnitude,
+    TimeSpan,
+)
+from cmk.rulesets.v1.rule_specs import CheckParameters, HostCondition, Topic
+
+PERCENTILES = {
+    'p50': Title('50th percentile'),
+    'p90': Title('90th percentile'),
+    'p99': Title('99th percentile'),
+    'max': Title('Maximum'),
+}
+
+
+def _levels(op: str, key: str) -> DictElement:
+    return DictElement(
+        parameter_form=SimpleLevels(
+            title=Title('%s latency, %s') % (op, PERCENTILES[key]),
+            form_spec_template=TimeSpan(displayed_magnitudes=[TimeMagnitude.MILLISECOND]),
+            level_direction=LevelDirection.UPPER,
+            prefill_fixed_levels=DefaultValue((0.02, 0.05)),
+        ),
+    )
+
+
+def _form_dell_storage_latency() -> Dictionary:
+    return Dictionary(
+        help_text=Help(
+            'Upper levels for the percentiles of the read and write latency over all volumes of a '
+            'StorageCenter. Only volumes with read resp. write operations are taken into account.'
+        ),
+        elements={
+            f'{op}_{key}': _levels(title, key)
+            for op, title in (('read', 'Read'), ('write', 'Write'))
+            for key in PERCENTILES
+        },
+    )
+
+
+rule_spec_dell_storage_latency = CheckParameters(
+    name='dell_storage_latency',
+    title=Title('Dell Storage volume latency percentiles'),
+    topic=Topic.STORAGE,
+    parameter_form=_form_dell_storage_latency,
+    condition=HostCondition(),
+)
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- encoding: utf-8; py-indent-offset: 4 -*-
+#
+# checkmk_dell_storage - Checkmk extension for Dell Storage API
+#
+# Copyright (C) 2021-2024  Marius Rieder <marius.rieder@durchmesser.ch>
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+from cmk.rulesets.v1 import Title, Help
+from cmk.rulesets.v1.form_specs import (
+    DefaultValue,
+    DictElement,
+    Dictionary,
+    LevelDirection,
+    SimpleLevels,
+    TimeMagnitude,
+    TimeSpan,
+)
+from cmk.rulesets.v1.rule_specs import CheckParameters, HostAndItemCondition, Topic
+
+
+def _levels(title: Title) -> DictElement:
+    return DictElement(
+        parameter_form=SimpleLevels(
+            title=title,
+            form_spec_template=TimeSpan(displayed_magnitudes=[TimeMagnitude.MILLISECOND]),
+            level_direction=LevelDirection.UPPER,
+            prefill_fixed_levels=DefaultValue((0.05, 0.1)),
+        ),
+    )
+
+
+def _form_dell_storage_latency_peak() -> Dictionary:
+    return Dictionary(
+        help_text=Help(
+            'Upper levels for the highest read and write latency of a volume, disk or port over all IO '
+            'usage samples since the last agent run.'
+        ),
+        elements={
+            'read_latency_peak': _levels(Title('Read latency peak')),
+            'write_latency_peak': _levels(Title('Write latency peak')),
+        },
+    )
+
+
+rule_spec_dell_storage_latency_peak = CheckParameters(
+    name='dell_storage_latency_peak',
+    title=Title('Dell Storage latency peak'),
+    topic=Topic.STORAGE,
+    parameter_form=_form_dell_storage_latency_peak,
+    condition=HostAndItemCondition(item_title=Title('Volume, disk or port')),
+)
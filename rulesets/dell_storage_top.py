@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- encoding: utf-8; py-indent-offset: 4 -*-
+#
+# checkmk_dell_storage - Checkmk extension for Dell Storage API
+#
+# Copyright (C) 2021-2024  Marius Rieder <marius.rieder@durchmesser.ch>
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+from cmk.rulesets.v1 import Title, Help
+from cmk.rulesets.v1.form_specs import (
+    DefaultValue,
+    DictElement,
+    Dictionary,
+    Integer,
+    validators,
+)
+from cmk.rulesets.v1.rule_specs import CheckParameters, HostCondition, Topic
+
+
+def _form_dell_storage_top() -> Dictionary:
+    return Dictionary(
+        elements={
+            'count': DictElement(
+                parameter_form=Integer(
+                    title=Title('Number of volumes and disks to list'),
+                    help_text=Help('List this many of the busiest volumes and disks by operations, throughput and latency.'),
+                    prefill=DefaultValue(5),
+                    custom_validate=(validators.NumberInRange(min_value=1, max_value=100),),
+                ),
+                required=True,
+            ),
+        },
+    )
+
+
+rule_spec_dell_storage_top = CheckParameters(
+    name='dell_storage_top',
+    title=Title('Dell Storage top volumes and disks'),
+    topic=Topic.STORAGE,
+    parameter_form=_form_dell_storage_top,
+    condition=HostCondition(),
+)
@@ -32,6 +32,10 @@ class Params(BaseModel):
     user: str
     password: Secret | None = None
     ignore_cert: str = 'check_cert'
+    workers: int | None = None
+    tiered_polling: int | None = None
+    sections: list[str] | None = None
+    exclude_sections: list[str] | None = None
 
 
 def commands_function(
@@ -45,6 +49,14 @@ def commands_function(
     ]
     if params.ignore_cert != 'check_cert':
         command_arguments += ['--ignore-cert']
+    if params.workers:
+        command_arguments += ['--workers', str(params.workers)]
+    if params.tiered_polling:
+        command_arguments += ['--tiered-polling', str(params.tiered_polling)]
+    if params.sections:
+        command_arguments += ['--sections', ','.join(params.sections)]
+    if params.exclude_sections:
+        command_arguments += ['--exclude-sections', ','.join(params.exclude_sections)]
     yield SpecialAgentCommand(command_arguments=command_arguments)
 
 
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- encoding: utf-8; py-indent-offset: 4 -*-
+#
+# checkmk_dell_storage - Checkmk extension for Dell Storage API
+#
+# Copyright (C) 2021-2024  Marius Rieder <marius.rieder@durchmesser.ch>
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+# Compare the CPU time of one check cycle (parse the section, check every
+# discovered volume) of the item keyed volume section with the list scan
+# it replaced.
+#
+#   python3 tests/benchmark/bench_check_lookup.py [COUNT]
+
+import sys
+import time
+
+from cmk_addons.plugins.dell_storage.agent_based import dell_storage_volume
+from cmk_addons.plugins.dell_storage.lib.dell_storage import DSParser
+
+
+def string_table(count):
+    for idx in range(count):
+        yield [f'SAN-LUN{idx}', 'Up', '', '420166500352', '2748779069440', str(idx % 100), '292864', '0.002162', '117', '1913856', '0.000857']
+
+
+def legacy_parse(string_table):
+    parse = DSParser(dell_storage_volume.ScVolume)
+    return [parse(vol) for vol in string_table]
+
+
+def legacy_check(item, params, section):
+    for vol in section:
+        if not vol.name == item:
+            continue
+        yield from dell_storage_volume.check_dell_storage_volume(item, params, {item: vol})
+        return
+
+
+def cycle(parse, check, table, items):
+    section = parse(table)
+    for item in items:
+        for _ in check(item, {}, section):
+            pass
+
+
+def main(count=5000):
+    table = list(string_table(count))
+    items = [service.item for service in dell_storage_volume.discovery_dell_storage_volume(dell_storage_volume.parse_dell_storage_volume(table))]
+    assert len(items) == count
+
+    dell_storage_volume.get_value_store = dict
+    for name, parse, check in (
+        ('list', legacy_parse, legacy_check),
+        ('dict', dell_storage_volume.parse_dell_storage_volume, dell_storage_volume.check_dell_storage_volume),
+    ):
+        runtime = float('inf')
+        for _ in range(3):
+            start = time.process_time()
+            cycle(parse, check, table, items)
+            runtime = min(runtime, time.process_time() - start)
+        print(f'{name:>4}: {count} volumes, {runtime * 1000:.1f} ms CPU per check cycle')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
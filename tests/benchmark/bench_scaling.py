@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- encoding: utf-8; py-indent-offset: 4 -*-
+#
+# checkmk_dell_storage - Checkmk extension for Dell Storage API
+#
+# Copyright (C) 2021-2024  Marius Rieder <marius.rieder@durchmesser.ch>
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+# Run AgentDellStorage.main against the synthetic DSM and report runtime,
+# request count, peak RSS and output size per number of volumes. Every size
+# runs in its own process, so the peak RSS is not shared between them.
+#
+#   python3 tests/benchmark/bench_scaling.py [--volumes 10 100 1000 10000] [--workers 8]
+
+import argparse
+import contextlib
+import json
+import resource
+import subprocess
+import sys
+import time
+
+from dsm_simulator import SimulatedDsm, Topology, serve
+
+
+class CountingWriter:
+    def __init__(self):
+        self.size = 0
+
+    def write(self, data):
+        self.size += len(data.encode('utf-8'))
+        return len(data)
+
+    def flush(self):
+        pass
+
+
+def run(volumes, workers, latency, error_rate):
+    from cmk_addons.plugins.dell_storage.lib.agent import AgentDellStorage
+
+    dsm = SimulatedDsm(Topology(volumes=volumes), latency, error_rate)
+    server, url = serve(dsm)
+
+    agent = AgentDellStorage()
+    args = agent.parse_arguments([
+        '-u', 'user', '-p', 'pass', '-U', url, '--no-cache', '--no-session-reuse',
+        '--workers', str(workers),
+    ])
+    output = CountingWriter()
+    start = time.monotonic()
+    with contextlib.redirect_stdout(output):
+        agent.main(args)
+    runtime = time.monotonic() - start
+    server.shutdown()
+
+    return dict(
+        volumes=volumes,
+        runtime=runtime,
+        requests=agent._api.reqcnt,
+        expected=dsm.expected_requests(),
+        rss=resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+        output=output.size,
+    )
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--volumes', type=int, nargs='+', default=[10, 100, 1000, 10000])
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--error-rate', dest='error_rate', type=float, default=0.0)
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_arguments(argv)
+    if args.child:
+        print(json.dumps(run(args.volumes[0], args.workers, args.latency, args.error_rate)))
+        return
+
+    print(f'{"volumes":>8} {"runtime":>10} {"requests":>9} {"peak rss":>10} {"output":>10}')
+    for volumes in args.volumes:
+        child = subprocess.run(
+            [sys.executable, __file__, '--child', '--volumes', str(volumes), '--workers', str(args.workers),
+             '--latency', str(args.latency), '--error-rate', str(args.error_rate)],
+            check=True, capture_output=True, text=True,
+        )
+        result = json.loads(child.stdout.splitlines()[-1])
+        print(f'{result["volumes"]:>8} {result["runtime"]:>9.2f}s {result["requests"]:>9} '
+              f'{result["rss"] / 2**20:>8.1f}MB {result["output"] / 2**10:>8.1f}kB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- encoding: utf-8; py-indent-offset: 4 -*-
+#
+# checkmk_dell_storage - Checkmk extension for Dell Storage API
+#
+# Copyright (C) 2021-2024  Marius Rieder <marius.rieder@durchmesser.ch>
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+# Compare the memory kept by a parsed dell_storage_volume section as dict
+# of ScVolume NamedTuples with the columnar DSColumns section.
+#
+#   python3 tests/benchmark/bench_section_memory.py [COUNT]
+
+import sys
+import time
+import tracemalloc
+
+from cmk_addons.plugins.dell_storage.agent_based.dell_storage_volume import ScVolume
+from cmk_addons.plugins.dell_storage.lib.dell_storage import DSColumns, DSSection
+
+
+def string_table(count):
+    for idx in range(count):
+        if idx % 10:
+            iousage = [str(idx % 100), str(idx * 1024), str(idx / 1e6), str(idx % 50), str(idx * 2048), str(idx / 2e6)]
+        else:
+            iousage = [''] * 6
+        yield [f'SAN-LUN{idx}', 'Up', '', str(idx * 2 ** 30), '6597069766656'] + iousage
+
+
+def measure(parse, count):
+    tracemalloc.start()
+    table = list(string_table(count))
+    start = time.process_time()
+    section = parse(ScVolume, table)
+    runtime = time.process_time() - start
+    del table
+    size, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(section) == count
+    return size, runtime
+
+
+def main(count=10000):
+    for parse in (DSSection, DSColumns):
+        size, runtime = measure(parse, count)
+        print(f'{parse.__name__:>9}: {count} rows, {size / 1024 ** 2:.2f} MiB kept, parsed in {runtime * 1000:.1f} ms')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
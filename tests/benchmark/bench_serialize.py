@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- encoding: utf-8; py-indent-offset: 4 -*-
+#
+# checkmk_dell_storage - Checkmk extension for Dell Storage API
+#
+# Copyright (C) 2021-2024  Marius Rieder <marius.rieder@durchmesser.ch>
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+# Compare the ApiObject row serialization of the agent with the generic
+# __getattribute__ based one it replaced.
+#
+#   python3 tests/benchmark/bench_serialize.py [COUNT]
+
+import sys
+import timeit
+
+from cmk_addons.plugins.dell_storage.lib.agent import DellStorageApi
+
+
+class LegacyScVolume(DellStorageApi.ScVolume):
+    def __getattribute__(self, name):
+        if '.' in name:
+            name, subpath = name.split('.', 1)
+            return getattr(object.__getattribute__(self, name), subpath)
+        return object.__getattribute__(self, name)
+
+    def __str__(self, separator=';'):
+        return separator.join([str(getattr(self, field, '')) for field in self._fields()])
+
+
+def volumes(cls, count):
+    for idx in range(count):
+        volume = cls(None, instanceId=f'123456.{idx}', instanceName=f'SAN-LUN{idx}', status='Up', statusMessage='', active=True)
+        volume.__dict__['usage'] = DellStorageApi.ScVolumeStorageUsage(
+            None,
+            activeSpace='3673669238784 Bytes',
+            configuredSpace='6597069766656 Bytes',
+        )
+        # Built like the agent does, from the aggregated historical samples.
+        volume.__dict__['iousage'] = DellStorageApi.ScVolumeIoUsage(
+            None,
+            **DellStorageApi._aggregate_historical([dict(
+                readIops=idx % 100, readKbPerSecond=str(idx), readLatency=str(idx * 10),
+                writeIops=idx % 50, writeKbPerSecond=str(idx * 2), writeLatency=str(idx * 20),
+            )]),
+        ) if idx % 10 else None
+        yield volume
+
+
+def main(count=10000):
+    legacy = list(volumes(LegacyScVolume, count))
+    compiled = list(volumes(DellStorageApi.ScVolume, count))
+    assert [str(v) for v in legacy] == [str(v) for v in compiled]
+
+    for name, objs in (('legacy', legacy), ('compiled', compiled)):
+        runtime = min(timeit.repeat(lambda: [str(v) for v in objs], number=1, repeat=5))
+        print(f'{name:>8}: {count} ScVolume rows in {runtime * 1000:.1f} ms')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
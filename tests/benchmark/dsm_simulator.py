@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- encoding: utf-8; py-indent-offset: 4 -*-
+#
+# checkmk_dell_storage - Checkmk extension for Dell Storage API
+#
+# Copyright (C) 2021-2024  Marius Rieder <marius.rieder@durchmesser.ch>
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+# A synthetic Dell Storage Manager. It serves the REST tree the special agent
+# walks for any number of storage centers, controllers, enclosures, disks and
+# volumes. The objects are cloned from the integration test fixtures.
+#
+#   python3 tests/benchmark/dsm_simulator.py --volumes 1000 --latency 0.01
+
+import argparse
+import copy
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import NamedTuple
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../integration/lib/fixtures')
+
+
+def load_templates(path=FIXTURES):
+    templates = {}
+    for root, dirs, files in os.walk(path):
+        for name in sorted(files):
+            with open(os.path.join(root, name)) as fd:
+                data = json.load(fd)
+            for obj in data if isinstance(data, list) else [data]:
+                templates.setdefault(obj['objectType'], obj)
+    return templates
+
+
+class Topology(NamedTuple):
+    storage_centers: int = 1
+    controllers: int = 2
+    ports: int = 4
+    enclosures: int = 2
+    disks: int = 24
+    volumes: int = 10
+    alerts: int = 1
+    sensors: int = 2
+
+
+class SimulatedDsm:
+    def __init__(self, topology=Topology(), latency=0.0, error_rate=0.0, seed=0):
+        self.topology = topology
+        self.latency = latency
+        self.error_rate = error_rate
+        self.requests = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._templates = load_templates()
+        self._routes = {}
+        self._build()
+
+    def _object(self, otype, instanceId, instanceName=None):
+        obj = copy.deepcopy(self._templates[otype])
+        obj['instanceId'] = instanceId
+        obj['instanceName'] = instanceName or f'{otype} {instanceId}'
+        return obj
+
+    def _sensors(self, prefix, instanceId, fan, psu, temp):
+        self._routes[f'{prefix}/{instanceId}/{fan[0]}'] = [
+            self._object(fan[1], f'{instanceId}.{i}', f'Fan {i}') for i in range(self.topology.sensors)]
+        self._routes[f'{prefix}/{instanceId}/PowerSupplyList'] = [
+            self._object(psu, f'{instanceId}.{i}', f'Power Supply {i}') for i in range(self.topology.sensors)]
+        self._routes[f'{prefix}/{instanceId}/TemperatureSensorList'] = [
+            self._object(temp, f'{instanceId}.{i}', f'Temperature {i}') for i in range(self.topology.sensors)]
+
+    def _usage(self, otype, instanceId):
+        self._routes[f'StorageCenter/{otype}/{instanceId}/StorageUsage'] = self._object(f'{otype}StorageUsage', instanceId)
+        self._routes[f'StorageCenter/{otype}/{instanceId}/GetHistoricalIoUsage'] = [self._object(f'{otype}IoUsage', instanceId)]
+
+    def _build(self):
+        t = self.topology
+        self._routes['ApiConnection/Login'] = self._object('ApiConnection', '0', 'ApiConnection')
+        self._routes['ApiConnection/ApiConnection/0/StorageCenterList'] = []
+        for sc in range(1, t.storage_centers + 1):
+            scId = str(100000 + sc)
+            self._routes['ApiConnection/ApiConnection/0/StorageCenterList'].append(self._object('StorageCenter', scId, f'SAN{sc}'))
+            prefix = f'StorageCenter/StorageCenter/{scId}'
+            self._routes[f'{prefix}/ObjectCount'] = self._object('ScObjectCount', scId)
+            self._routes[f'{prefix}/StorageUsage'] = self._object('StorageCenterStorageUsage', scId)
+            self._routes[f'{prefix}/Chassis'] = self._object('ScChassis', scId)
+            self._routes[f'{prefix}/ActiveAlertList'] = [
+                self._object('ScAlert', f'{scId}.{i}') for i in range(t.alerts)]
+            self._sensors('StorageCenter/ScChassis', scId, ('FanSensorList', 'ScControllerFanSensor'),
+                          'ScControllerPowerSupply', 'ScControllerTemperatureSensor')
+
+            self._routes[f'{prefix}/ControllerList'] = []
+            for ctrl in range(1, t.controllers + 1):
+                ctrlId = f'{scId}.{ctrl}'
+                self._routes[f'{prefix}/ControllerList'].append(self._object('ScController', ctrlId, f'Controller {ctrl}'))
+                self._routes[f'StorageCenter/ScController/{ctrlId}/PhysicalControllerPortList'] = []
+                for port in range(1, t.ports + 1):
+                    portId = f'{ctrlId}.{port}'
+                    self._routes[f'StorageCenter/ScController/{ctrlId}/PhysicalControllerPortList'].append(
+                        self._object('ScControllerPort', portId, f'Port {port}'))
+                    self._routes[f'StorageCenter/ScControllerPort/{portId}/GetHistoricalIoUsage'] = [
+                        self._object('ScControllerPortIoUsage', portId)]
+                self._sensors('StorageCenter/ScController', ctrlId, ('FanSensorList', 'ScControllerFanSensor'),
+                              'ScControllerPowerSupply', 'ScControllerTemperatureSensor')
+
+            self._routes[f'{prefix}/EnclosureList'] = []
+            for encl in range(1, t.enclosures + 1):
+                enclId = f'{scId}.{encl}'
+                enclosure = self._object('ScEnclosure', enclId, f'Enclosure - {encl}')
+                self._routes[f'{prefix}/EnclosureList'].append(enclosure)
+                if encl == 1:
+                    self._routes[f'StorageCenter/ScChassis/{scId}/Enclosure'] = enclosure
+                self._routes[f'StorageCenter/ScEnclosure/{enclId}/DiskList'] = []
+                for disk in range(1, t.disks + 1):
+                    diskId = f'{enclId}.{disk}'
+                    self._routes[f'StorageCenter/ScEnclosure/{enclId}/DiskList'].append(
+                        self._object('ScDisk', diskId, f'{encl:02d}-{disk:02d}'))
+                    self._usage('ScDisk', diskId)
+                self._sensors('StorageCenter/ScEnclosure', enclId, ('CoolingFanSensorList', 'ScEnclosureCoolingFanSensor'),
+                              'ScEnclosurePowerSupply', 'ScEnclosureTemperatureSensor')
+
+            self._routes[f'{prefix}/VolumeList'] = []
+            for vol in range(1, t.volumes + 1):
+                volId = f'{scId}.{vol}'
+                self._routes[f'{prefix}/VolumeList'].append(self._object('ScVolume', volId, f'SAN{sc}-LUN{vol}'))
+                self._usage('ScVolume', volId)
+
+    def expected_requests(self):
+        return len(self._routes)
+
+    def response(self, method, path):
+        with self._lock:
+            self.requests += 1
+            failed = path != 'ApiConnection/Login' and self._random.random() < self.error_rate
+        if self.latency:
+            time.sleep(self.latency)
+        if path == 'ApiConnection/Logout':
+            return 204, b''
+        if failed:
+            return 500, b'{"result": "simulated error"}'
+        if path not in self._routes:
+            return 404, b'404'
+        return 200, json.dumps(self._routes[path]).encode('utf-8')
+
+
+class SimulatedDsmHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    dsm = None
+
+    def _respond(self):
+        status, body = self.dsm.response(self.command, self.path.removeprefix('/api/rest/').strip('/'))
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self._respond()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self._respond()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(dsm, host='127.0.0.1', port=0):
+    handler = type('Handler', (SimulatedDsmHandler,), dict(dsm=dsm))
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f'http://{server.server_address[0]}:{server.server_address[1]}/api/rest'
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description='Synthetic Dell Storage Manager REST API')
+    for field, default in Topology._field_defaults.items():
+        parser.add_argument(f'--{field.replace("_", "-")}', dest=field, type=int, default=default)
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds to wait before each response.')
+    parser.add_argument('--error-rate', dest='error_rate', type=float, default=0.0,
+                        help='Fraction of requests answered with a 500.')
+    parser.add_argument('--port', type=int, default=3033)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_arguments(argv)
+    topology = Topology(**{field: getattr(args, field) for field in Topology._fields})
+    dsm = SimulatedDsm(topology, args.latency, args.error_rate)
+    server, url = serve(dsm, port=args.port)
+    print(f'Serving {dsm.expected_requests()} endpoints on {url}')
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -19,12 +19,18 @@
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 
+import datetime
+import json
 import re
 import os.path
+import threading
+import time
 import pytest  # type: ignore[import]
 import requests  # noqa: F401
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
-from cmk_addons.plugins.dell_storage.lib.agent import AgentDellStorage, DellStorageApi
+from cmk_addons.plugins.dell_storage.lib import agent as agent_module
+from cmk_addons.plugins.dell_storage.lib.agent import AgentDellStorage, DellStorageApi, DellStorageRecorder
 
 
 def text_callback(request, context):
@@ -46,22 +52,71 @@ def api(requests_mock):
     return DellStorageApi('http://dsa:3033/rest/api', 'user', 'pass', True)
 
 
+class FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        path = os.path.abspath(os.path.join(__file__, '../fixtures', self.path[len('/rest/api/'):]))
+        if os.path.isfile(path):
+            body = open(path, 'rb').read()
+            self.send_response(200)
+        else:
+            body = b'404'
+            self.send_response(404)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self.do_GET()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def dsm():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FixtureHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield 'http://127.0.0.1:{port}/rest/api'.format(port=server.server_address[1])
+    server.shutdown()
+    server.server_close()
+
+
 class Args:
     url = 'http://dsa:3033/rest/api'
     user = 'user'
     password = 'pass'
     verify_cert = True
     debug = True
+    workers = 1
+    historical_window = 10
+    historical_samples = None
+    historical_state = False
+    cache = False
+    cache_ttl = []
+    session_reuse = False
+    connect_timeout = 10
+    read_timeout = 60
+    storage_center_timeout = 120
+    deadline = None
+    tiered_polling = None
+    refresh_interval = []
+    sections = None
+    exclude_sections = []
+    record = None
+    replay = None
+    replay_speed = 1.0
+    plan = False
+    topology = []
+    stream_json = False
 
 
-def test_AgentDellStorage_main(capsys, api):
-    agent = AgentDellStorage()
-    agent.main(Args())
-
-    captured = capsys.readouterr()
-
-    assert captured.err == ""
-    assert captured.out.splitlines()[:-1] == '''\
+AGENT_OUTPUT = '''\
 <<<<SAN>>>>
 <<<dell_storage_center:sep(59)>>>
 SAN;Up;;Sc5000Series;7.3.20.19;ABCD123;123456;0;2;44;0;38;0;8;19;130000000000000;95000000000000;77000000000000
@@ -72,9 +127,9 @@ Top Controller;Up;;1970-01-01T01:00:00+01:00;True;Sc5020;7.3.20.19;ABCD123;123-4
 Enclosure - 1;Up;;EN-SC5020;1.05;SasEbod12g;30;ABCD123;123-456-789-00
 Enclosure - 2;Up;;EN-SC420;1.09;SasEbod12g;24;JKSRF82;123-456-789-01
 <<<dell_storage_volume:sep(59)>>>
-SAN-LUN1;Up;;420166500352;2748779069440;0;0;0.0;2;1024;5.5e-05
-SAN-LUN2;Up;;3673669238784;6597069766656;17;624640;0.00358;128;2139136;0.000768
-SAN-LUN3;Up;;3673669238784;6597069766656;;;;;;
+SAN-LUN1;Up;;420166500352;2748779069440;0.0;7168.0;0.0;2.0;1024.0;5e-05;0.0;0.0;0.0;14336.0;0.0;0.0;2.0;2.0;1024.0;1024.0;4.5e-05;5.5e-05
+SAN-LUN2;Up;;3673669238784;6597069766656;33.0;1674240.0;0.002744030303030303;153.0;3647488.0;0.001037908496732026;17.0;49.0;624640.0;2723840.0;0.002454;0.00358;128.0;178.0;2139136.0;5155840.0;0.000768;0.001232
+SAN-LUN3;Up;;3673669238784;6597069766656;;;;;;;;;;;;;;;;;;
 <<<dell_storage_alert:sep(59)>>>
 VisualIdentifierAlert;Enclosure component 01-01 in Enclosure - 1 has turned on a visual indicator.;True;http://kbredir.compellent.com/troubletree_url/default.html?EventID=012011027&Model=5000&OSVersion=07.03.20
 <<<<>>>>
@@ -93,8 +148,8 @@ Midplane One;Up;;None;21;-128;-7;3;48;53;127
 <<<dell_storage_controller:sep(59)>>>
 Bottom Controller;Up;;1970-01-01T01:00:00+01:00;False;Sc5020;7.3.20.19;ABCD123;123-456-789-00;123457
 <<<dell_storage_port:sep(59)>>>
-5555555555555526;Up;;True;Sas;5555555555555526;619;26691584;0.000336;1360;126127104;0.000118
-555555555555552C;Up;;True;Iscsi;555555555555552C;;;;;;
+5555555555555526;Up;;True;Sas;5555555555555526;619.0;26691584.0;0.000336;1360.0;126127104.0;0.000118;619.0;619.0;26691584.0;26691584.0;0.000336;0.000336;1360.0;1360.0;126127104.0;126127104.0;0.000118;0.000118
+555555555555552C;Up;;True;Iscsi;555555555555552C;;;;;;;;;;;;;;;;;;
 <<<dell_storage_fan:sep(59)>>>
 <<<dell_storage_psu:sep(59)>>>
 <<<dell_storage_temp:sep(59)>>>
@@ -105,8 +160,8 @@ CPU One;Up;;None;46;-128;3;8;92;97;127
 <<<dell_storage_controller:sep(59)>>>
 Top Controller;Up;;1970-01-01T01:00:00+01:00;True;Sc5020;7.3.20.19;ABCD123;123-456-789-00;123456
 <<<dell_storage_port:sep(59)>>>
-5555555555555518;Up;;True;Iscsi;5555555555555518;13;657408;0.002293;148;2349056;0.000584
-5555555555555516;Up;;True;Iscsi;5555555555555516;14;724992;0.002398;151;2310144;0.000549
+5555555555555518;Up;;True;Iscsi;5555555555555518;13.0;657408.0;0.002293;148.0;2349056.0;0.000584;13.0;13.0;657408.0;657408.0;0.002293;0.002293;148.0;148.0;2349056.0;2349056.0;0.000584;0.000584
+5555555555555516;Up;;True;Iscsi;5555555555555516;14.0;724992.0;0.002398;151.0;2310144.0;0.000549;14.0;14.0;724992.0;724992.0;0.002398;0.002398;151.0;151.0;2310144.0;2310144.0;0.000549;0.000549
 <<<dell_storage_fan:sep(59)>>>
 <<<dell_storage_psu:sep(59)>>>
 <<<dell_storage_temp:sep(59)>>>
@@ -118,8 +173,8 @@ BBU;Up;;None;27;-128;-7;10;55;65;127
 Enclosure - 1;Up;;EN-SC5020;1.05;SasEbod12g;30;ABCD123;123-456-789-00
 <<<dell_storage_fan:sep(59)>>>
 <<<dell_storage_disk:sep(59)>>>
-01-16;Up;;360081014784;1800360124416;2;74752;0.003753;0;0;0.0
-01-08;Up;;1661088579584;1800360124416;;;;;;
+01-16;Up;;360081014784;1800360124416;2.0;74752.0;0.003753;0.0;0.0;0.0;2.0;2.0;74752.0;74752.0;0.003753;0.003753;0.0;0.0;0.0;0.0;0.0;0.0
+01-08;Up;;1661088579584;1800360124416;;;;;;;;;;;;;;;;;;
 <<<dell_storage_psu:sep(59)>>>
 <<<dell_storage_temp:sep(59)>>>
 <<<<>>>>
@@ -130,8 +185,8 @@ Enclosure - 2;Up;;EN-SC420;1.09;SasEbod12g;24;JKSRF82;123-456-789-01
 02-01;Up;;In Power Supply - Back Left
 02-02;Up;;In Power Supply - Back Left
 <<<dell_storage_disk:sep(59)>>>
-02-06;Up;;360081014784;1800360124416;1;68608;0.004245;0;0;0.0
-02-22;Up;;1638583517184;1800360124416;3;116736;0.0041;0;1024;0.0
+02-06;Up;;360081014784;1800360124416;1.0;68608.0;0.004245;0.0;0.0;0.0;1.0;1.0;68608.0;68608.0;0.004245;0.004245;0.0;0.0;0.0;0.0;0.0;0.0
+02-22;Up;;1638583517184;1800360124416;3.0;116736.0;0.0041;0.0;1024.0;0.0;3.0;3.0;116736.0;116736.0;0.0041;0.0041;0.0;0.0;1024.0;1024.0;0.0;0.0
 <<<dell_storage_psu:sep(59)>>>
 02-01;Up;;Back Left
 02-02;Up;;Back Right
@@ -140,4 +195,423 @@ Enclosure - 2;Up;;EN-SC420;1.09;SasEbod12g;24;JKSRF82;123-456-789-01
 02-02;Up;;Midplane;26;;4;9;54;57;
 <<<<>>>>
 <<<dell_storage_agent:sep(59)>>>
-'''.splitlines()
+'''
+
+
+def split_output(output, section='dell_storage_agent'):
+    lines = output.splitlines()
+    index = lines.index('<<<dell_storage_agent:sep(59)>>>') + 1
+    start = lines.index(f'<<<{section}:sep(59)>>>') + 1
+    end = next((i for i, line in enumerate(lines[start:], start) if line.startswith('<<<')), len(lines))
+    return lines[:index], [line.split(';') for line in lines[start:end]]
+
+
+def test_AgentDellStorage_main(capsys, api):
+    agent = AgentDellStorage()
+    agent.main(Args())
+
+    captured = capsys.readouterr()
+    output, agent_section = split_output(captured.out)
+
+    assert captured.err == ""
+    assert output == AGENT_OUTPUT.splitlines()
+
+
+def test_AgentDellStorage_main_endpoints(capsys, api):
+    AgentDellStorage().main(Args())
+
+    output, endpoints = split_output(capsys.readouterr().out, 'dell_storage_agent_endpoints')
+    endpoints = dict((line[0], line[1:]) for line in endpoints)
+
+    assert sum(int(stats[0]) for stats in endpoints.values()) == 47
+    assert endpoints['ApiConnection/Login'][0] == '1'
+    assert endpoints['ScVolume/GetHistoricalIoUsage'][0] == '3'
+    assert int(endpoints['StorageCenter/VolumeList'][4]) > 0
+
+
+def test_AgentDellStorage_main_duplicates(capsys, api):
+    AgentDellStorage().main(Args())
+
+    output, agent_section = split_output(capsys.readouterr().out)
+    assert ['duplicates', '1'] in agent_section
+
+
+def test_AgentDellStorage_main_workers(capsys, api):
+    args = Args()
+    args.workers = 4
+
+    agent = AgentDellStorage()
+    agent.main(args)
+
+    captured = capsys.readouterr()
+    output, agent_section = split_output(captured.out)
+
+    assert captured.err == ""
+    assert output == AGENT_OUTPUT.splitlines()
+    assert agent_section[0][4] == '47'
+
+
+@pytest.mark.parametrize('stream_json', [False, True])
+def test_AgentDellStorage_main_stub_server(capsys, dsm, stream_json):
+    args = Args()
+    args.url = dsm
+    args.workers = 8
+    args.stream_json = stream_json
+
+    agent = AgentDellStorage()
+    agent.main(args)
+
+    captured = capsys.readouterr()
+    output, agent_section = split_output(captured.out)
+
+    assert captured.err == ""
+    assert output == AGENT_OUTPUT.splitlines()
+
+    connections = dict((line[0], line[1:]) for line in agent_section[1:])['connections']
+    assert 0 < int(connections[0]) <= 8
+    assert int(connections[0]) + int(connections[1]) == 47
+
+
+def test_AgentDellStorage_main_cache(capsys, api, tmp_path, monkeypatch):
+    monkeypatch.setattr(agent_module.paths, 'tmp_dir', str(tmp_path))
+    args = Args()
+    args.cache = True
+    args.cache_ttl = [('ScObjectCount', 3600)]
+
+    AgentDellStorage().main(args)
+    first, first_agent = split_output(capsys.readouterr().out)
+
+    AgentDellStorage().main(args)
+    second, second_agent = split_output(capsys.readouterr().out)
+
+    assert first == AGENT_OUTPUT.splitlines()
+    assert second == AGENT_OUTPUT.splitlines()
+    assert first_agent[0][4] == '47'
+    assert ['cache', '0', '2'] in first_agent
+    assert second_agent[0][4] == '45'
+    assert ['cache', '2', '0'] in second_agent
+
+
+def test_AgentDellStorage_main_session_reuse(capsys, api, tmp_path, monkeypatch, requests_mock):
+    monkeypatch.setattr(agent_module.paths, 'tmp_dir', str(tmp_path))
+    args = Args()
+    args.session_reuse = True
+
+    AgentDellStorage().main(args)
+    first, first_agent = split_output(capsys.readouterr().out)
+
+    AgentDellStorage().main(args)
+    second, second_agent = split_output(capsys.readouterr().out)
+
+    assert second == AGENT_OUTPUT.splitlines()
+    assert first_agent[0][4] == '47'
+    assert second_agent[0][4] == '46'
+    assert not any(r.path.endswith('/logout') for r in requests_mock.request_history)
+
+
+def test_AgentDellStorage_main_historical_state(capsys, api, tmp_path, monkeypatch, requests_mock):
+    monkeypatch.setattr(agent_module.paths, 'tmp_dir', str(tmp_path))
+    args = Args()
+    args.historical_state = True
+
+    start = datetime.datetime.now()
+    AgentDellStorage().main(args)
+    AgentDellStorage().main(args)
+    second, _second_agent = split_output(capsys.readouterr().out)
+
+    starts = [
+        datetime.datetime.fromisoformat(r.json()['HistoricalFilter']['StartTime'])
+        for r in requests_mock.request_history if r.path.endswith('/gethistoricaliousage')
+    ]
+    assert len(starts) == 22
+    assert all(s < start - datetime.timedelta(minutes=9) for s in starts[:11])
+    assert all(s > start - datetime.timedelta(seconds=5) for s in starts[11:])
+    assert second == AGENT_OUTPUT.splitlines()
+
+
+def test_AgentDellStorage_main_historical_state_failed(capsys, api, tmp_path, monkeypatch, requests_mock):
+    monkeypatch.setattr(agent_module.paths, 'tmp_dir', str(tmp_path))
+    requests_mock.register_uri('GET', re.compile(r'/ScDisk/[^/]+/StorageUsage$'), status_code=500)
+    args = Args()
+    args.debug = False
+    args.historical_state = True
+
+    start = datetime.datetime.now()
+    AgentDellStorage().main(args)
+    AgentDellStorage().main(args)
+
+    starts = [
+        datetime.datetime.fromisoformat(r.json()['HistoricalFilter']['StartTime'])
+        for r in requests_mock.request_history if r.path.endswith('/gethistoricaliousage')
+    ]
+    assert starts
+    assert all(s < start - datetime.timedelta(minutes=9) for s in starts)
+    assert not list(tmp_path.glob('agents/agent_dell_storage/*.historical'))
+
+
+def test_AgentDellStorage_main_historical_state_per_storage_center(capsys, api, tmp_path, monkeypatch):
+    monkeypatch.setattr(agent_module.paths, 'tmp_dir', str(tmp_path))
+    state_dir = tmp_path / 'agents' / 'agent_dell_storage'
+    state_dir.mkdir(parents=True)
+    other = time.time() - 60
+    agent = AgentDellStorage()
+    agent.args = Args()
+    agent.args.historical_state = True
+    with open(agent._historical_file(), 'w') as fd:
+        json.dump({'654321': other}, fd)
+
+    start = time.time()
+    agent.main(agent.args)
+
+    with open(agent._historical_file()) as fd:
+        state = json.load(fd)
+    assert state['654321'] == other
+    assert state['123456'] >= start
+
+
+def test_AgentDellStorage_main_logout(capsys, api, requests_mock):
+    AgentDellStorage().main(Args())
+
+    assert requests_mock.request_history[-1].path == '/rest/api/apiconnection/logout'
+
+
+def test_AgentDellStorage_main_plan(capsys, requests_mock):
+    args = Args()
+    args.plan = True
+    args.topology = [('ScController', 2), ('ScControllerPort', 2), ('ScEnclosure', 2), ('ScDisk', 2), ('ScVolume', 3)]
+
+    AgentDellStorage().main(args)
+
+    captured = capsys.readouterr()
+    assert not requests_mock.request_history
+    assert captured.out.splitlines()[-2:] == ['Total: 47 requests', 'Critical path: 5 requests']
+
+
+def test_AgentDellStorage_main_plan_sections(capsys, requests_mock):
+    args = Args()
+    args.plan = True
+    args.topology = [('ScVolume', 3)]
+    args.sections = ['dell_storage_volume']
+
+    AgentDellStorage().main(args)
+
+    captured = capsys.readouterr()
+    assert not requests_mock.request_history
+    assert captured.out.splitlines()[-2:] == ['Total: 9 requests', 'Critical path: 4 requests']
+
+
+def test_AgentDellStorage_main_storage_center_failed(capsys, api, requests_mock):
+    requests_mock.register_uri('GET', re.compile(r'/ScDisk/[^/]+/StorageUsage$'), status_code=500)
+    args = Args()
+    args.debug = False
+
+    AgentDellStorage().main(args)
+
+    output, agent_section = split_output(capsys.readouterr().out)
+    assert output == ['<<<dell_storage_agent:sep(59)>>>']
+    assert agent_section[0][0] == '0'
+    assert agent_section[-1][:2] == ['storage_center', 'SAN']
+    assert '500 Server Error' in agent_section[-1][2]
+
+
+def test_AgentDellStorage_main_storage_center_timeout(capsys, api, requests_mock):
+    def slow(request, context):
+        time.sleep(0.5)
+        return text_callback(request, context)
+
+    requests_mock.register_uri('GET', re.compile(r'/ScVolume/[^/]+/StorageUsage$'), text=slow)
+    args = Args()
+    args.debug = False
+    args.storage_center_timeout = 0.1
+
+    AgentDellStorage().main(args)
+
+    output, agent_section = split_output(capsys.readouterr().out)
+    assert output == ['<<<dell_storage_agent:sep(59)>>>']
+    assert agent_section[-1] == ['storage_center', 'SAN', 'Timeout after 0.1s']
+
+
+def test_AgentDellStorage_storage_centers_isolated(api, monkeypatch):
+    class StorageCenter:
+        def __init__(self, instanceName, delay):
+            self.instanceName = instanceName
+            self.delay = delay
+
+    def prefetch(executor, storageCenter):
+        executor.submit(time.sleep, storageCenter.delay).result()
+
+    hung, healthy = StorageCenter('hung', 1), StorageCenter('healthy', 0)
+    agent = AgentDellStorage()
+    agent.args = Args()
+    agent.args.debug = False
+    agent.args.storage_center_timeout = 0.5
+    agent._api = api
+    monkeypatch.setattr(agent, '_prefetch', prefetch)
+
+    assert agent._collect_storage_centers([hung, healthy]) == {hung: 'Timeout after 0.5s'}
+
+
+def test_AgentDellStorage_main_deadline(capsys, api, monkeypatch):
+    collect = AgentDellStorage._collect_storage_centers
+
+    def expired(self, storage_centers):
+        self._api._deadline = time.monotonic()
+        return collect(self, storage_centers)
+
+    monkeypatch.setattr(AgentDellStorage, '_collect_storage_centers', expired)
+    args = Args()
+    args.deadline = 60
+
+    AgentDellStorage().main(args)
+
+    output, agent_section = split_output(capsys.readouterr().out)
+    assert output[:3] == [
+        '<<<<SAN>>>>',
+        '<<<dell_storage_center:sep(59)>>>',
+        'SAN;Up;;Sc5000Series;7.3.20.19;ABCD123;123456;;;;;;;;;;;',
+    ]
+    assert agent_section[0][0] == '0'
+    assert agent_section[0][4] == '2'
+    assert ['partial', '7'] in agent_section
+
+
+def test_AgentDellStorage_main_deadline_chassis(capsys, api, requests_mock):
+    agent = AgentDellStorage()
+
+    def chassis(request, context):
+        agent._api._deadline = time.monotonic()
+        return text_callback(request, context)
+
+    requests_mock.get(re.compile(r'/StorageCenter/StorageCenter/[^/]+/Chassis$'), text=chassis)
+    args = Args()
+    args.deadline = 60
+
+    agent.main(args)
+
+    captured = capsys.readouterr()
+    output, agent_section = split_output(captured.out)
+    assert output[:2] == ['<<<<SAN>>>>', '<<<dell_storage_center:sep(59)>>>']
+    assert '<<<dell_storage_fan:sep(59)>>>' not in output
+    assert agent_section[0][0] == '0'
+    assert agent_section[-1][0] == 'partial'
+
+
+def test_AgentDellStorage_main_deadline_login(capsys, api):
+    args = Args()
+    args.debug = False
+    args.deadline = 1e-9
+
+    AgentDellStorage().main(args)
+
+    output, agent_section = split_output(capsys.readouterr().out)
+    assert output == ['<<<dell_storage_agent:sep(59)>>>']
+    assert agent_section[0][0] == '1'
+    assert agent_section[0][-1] == 'Deadline exceeded'
+
+
+def test_AgentDellStorage_main_tiered_polling(capsys, api, tmp_path, monkeypatch):
+    monkeypatch.setattr(agent_module.paths, 'tmp_dir', str(tmp_path))
+    args = Args()
+    args.tiered_polling = 3600
+
+    AgentDellStorage().main(args)
+    first, first_agent = split_output(capsys.readouterr().out)
+
+    AgentDellStorage().main(args)
+    second, second_agent = split_output(capsys.readouterr().out)
+
+    assert first == AGENT_OUTPUT.splitlines()
+    assert first_agent[0][4] == '47'
+    assert second_agent[0][4] == '32'
+    assert [re.sub(r'cached\(\d+,3600\):', '', line) for line in second] == AGENT_OUTPUT.splitlines()
+    assert len([line for line in second if ':cached(' in line]) == 15
+
+
+def test_AgentDellStorage_main_tiered_polling_partial(capsys, api, requests_mock, tmp_path, monkeypatch):
+    monkeypatch.setattr(agent_module.paths, 'tmp_dir', str(tmp_path))
+    agent = AgentDellStorage()
+
+    def fans(request, context):
+        agent._api._deadline = time.monotonic()
+        return text_callback(request, context)
+
+    requests_mock.get(re.compile(r'/ScController/123456.123456/FanSensorList$'), text=fans)
+    args = Args()
+    args.tiered_polling = 3600
+    args.deadline = 60
+    agent.main(args)
+    first, first_agent = split_output(capsys.readouterr().out)
+
+    args = Args()
+    args.tiered_polling = 3600
+    AgentDellStorage().main(args)
+    second, second_agent = split_output(capsys.readouterr().out)
+
+    assert first_agent[-1][0] == 'partial'
+    assert second == AGENT_OUTPUT.splitlines()
+    assert second_agent[0][4] == '47'
+
+
+@pytest.mark.parametrize('sections, exclude_sections', [
+    (['dell_storage_volume', 'dell_storage_alert'], []),
+    (None, ['dell_storage_center', 'dell_storage_controller', 'dell_storage_port', 'dell_storage_enclosure',
+            'dell_storage_disk', 'dell_storage_fan', 'dell_storage_psu', 'dell_storage_temp']),
+])
+def test_AgentDellStorage_main_sections(capsys, api, sections, exclude_sections):
+    args = Args()
+    args.sections = sections
+    args.exclude_sections = exclude_sections
+
+    AgentDellStorage().main(args)
+
+    output, agent_section = split_output(capsys.readouterr().out)
+    lines = AGENT_OUTPUT.splitlines()
+    assert output == lines[:1] + lines[lines.index('<<<dell_storage_volume:sep(59)>>>'):lines.index('<<<<>>>>') + 1] + lines[-1:]
+    assert agent_section[0][4] == '10'
+    assert agent_section[-1] == ['skipped_sections', 'dell_storage_center', 'dell_storage_controller', 'dell_storage_port',
+                                 'dell_storage_enclosure', 'dell_storage_disk', 'dell_storage_fan', 'dell_storage_psu',
+                                 'dell_storage_temp']
+
+
+def test_AgentDellStorage_main_sections_sensors(capsys, api):
+    args = Args()
+    args.sections = ['dell_storage_temp']
+
+    AgentDellStorage().main(args)
+
+    output, agent_section = split_output(capsys.readouterr().out)
+    assert '<<<dell_storage_center:sep(59)>>>' not in output
+    assert output.count('<<<dell_storage_temp:sep(59)>>>') == 5
+    assert agent_section[0][4] == '11'
+
+
+@pytest.mark.parametrize('stream_json', [False, True])
+def test_AgentDellStorage_main_record_replay(capsys, api, tmp_path, requests_mock, stream_json):
+    args = Args()
+    args.record = str(tmp_path)
+    args.stream_json = stream_json
+
+    AgentDellStorage().main(args)
+    recorded, recorded_agent = split_output(capsys.readouterr().out)
+
+    fixtures = os.path.abspath(os.path.join(__file__, '../fixtures'))
+    for root, dirs, files in os.walk(fixtures):
+        for name in files:
+            path = os.path.relpath(os.path.join(root, name), fixtures)
+            with open(os.path.join(fixtures, path)) as fixture, open(tmp_path / path) as record:
+                assert json.load(record) == DellStorageRecorder.scrub(json.load(fixture)), path
+    with open(tmp_path / '.timings.json') as fd:
+        assert len(json.load(fd)) == 47
+
+    requests_mock.stop()
+    args = Args()
+    args.url = 'https://replay.example.com:3033/api/rest'
+    args.replay = str(tmp_path)
+    args.replay_speed = 0
+
+    AgentDellStorage().main(args)
+    replayed, replayed_agent = split_output(capsys.readouterr().out)
+
+    assert recorded == AGENT_OUTPUT.splitlines()
+    assert replayed == AGENT_OUTPUT.splitlines()
+    assert replayed_agent[0][4] == '47'
@@ -42,6 +42,45 @@ def test_discovery_dell_storage_agent(string_table, result):
     ([['0', 'provider', 'version', '23', '42', '']], Metric('request', 42.0)),
     ([['0', 'provider', 'version', '23', '42', '']], Metric('time', 23)),
     ([['1', '', '', '23', '', 'Yolo']], Result(state=State.CRIT, summary='Exception: Yolo')),
+    ([['0', 'provider', 'version', '23', '42', ''], ['cache', '3', '1']], Result(state=State.OK, notice='Cache hits: 3, misses: 1')),
+    ([['0', 'provider', 'version', '23', '42', ''], ['cache', '3', '1']], Metric('dell_storage_cache_hits', 3.0)),
+    ([['0', 'provider', 'version', '23', '42', ''], ['cache', '3', '1']], Metric('dell_storage_cache_misses', 1.0)),
+    ([['0', 'provider', 'version', '23', '42', ''], ['connections', '4', '38']], Result(state=State.OK, notice='Connections new: 4, reused: 38')),
+    ([['0', 'provider', 'version', '23', '42', ''], ['connections', '4', '38']], Metric('dell_storage_connections_new', 4.0)),
+    ([['0', 'provider', 'version', '23', '42', ''], ['connections', '4', '38']], Metric('dell_storage_connections_reused', 38.0)),
+    ([['0', 'provider', 'version', '23', '42', ''], ['duplicates', '2']], Result(state=State.OK, notice='Duplicate objects: 2')),
+    ([['0', 'provider', 'version', '23', '42', ''], ['duplicates', '2']], Metric('dell_storage_duplicates', 2.0)),
+    ([['0', 'provider', 'version', '23', '42', ''], ['storage_center', 'SAN', 'Timeout after 120.0s']],
+     Result(state=State.WARN, summary='Storage Center SAN failed: Timeout after 120.0s')),
+    ([['0', 'provider', 'version', '23', '42', ''], ['skipped_sections', 'dell_storage_port', 'dell_storage_disk']],
+     Result(state=State.OK, summary='Skipped sections: port, disk')),
+    ([['0', 'provider', 'version', '23', '42', ''], ['partial', '12']],
+     Result(state=State.WARN, summary='Partial output, 12 associations skipped after the deadline')),
 ])
 def test_check_dell_storage_agent(string_table, result):
     assert result in list(dell_storage_agent.check_dell_storage_agent(string_table))
+
+
+ENDPOINTS = [
+    ['ApiConnection/Login', '1', '0.2', '0.2', '0.2', '100', '0.001'],
+    ['ScVolume/GetHistoricalIoUsage', '3', '1.5', '0.7', '0.7', '3000', '0.003'],
+] + [[f'Foo/Bar{i}', '1', '0.01', '0.01', '0.01', '10', '0.0'] for i in range(5)]
+
+
+def test_parse_dell_storage_agent_endpoints():
+    section = dell_storage_agent.parse_dell_storage_agent_endpoints(ENDPOINTS)
+    assert section['ApiConnection/Login'] == dell_storage_agent.Endpoint('ApiConnection/Login', 1, 0.2, 0.2, 0.2, 100, 0.001)
+
+
+def test_check_dell_storage_agent_endpoints():
+    endpoints = dell_storage_agent.parse_dell_storage_agent_endpoints(ENDPOINTS)
+    result = list(dell_storage_agent.check_dell_storage_agent([['0', 'provider', 'version', '23', '42', '']], endpoints))
+
+    assert Metric('dell_storage_endpoint_top1_time', 1.5) in result
+    assert Metric('dell_storage_endpoint_top2_p95', 0.2) in result
+    assert [r.name for r in result if isinstance(r, Metric) and r.name.endswith('_time')] == [
+        f'dell_storage_endpoint_top{rank}_time' for rank in range(1, 6)
+    ]
+    notices = [r.details for r in result if isinstance(r, Result)]
+    assert notices[1].startswith('#1 ScVolume/GetHistoricalIoUsage: 3 calls, total ')
+    assert notices[2].startswith('#2 ApiConnection/Login: 1 calls, total ')
@@ -32,7 +32,7 @@ from cmk_addons.plugins.dell_storage.agent_based import dell_storage_center
 @pytest.mark.parametrize('string_table, result', [
     (
         [['SAN', 'Up', '', 'Sc5000Series', '7.3.20.19', 'ABCD123', '987654', '0', '2', '4', '0', '19', '0', '8', '19', '130000000000000', '100000000000000', '30000000000000']],
-        [dell_storage_center.StorageCenter(
+        {'SAN': dell_storage_center.StorageCenter(
             name='SAN',
             status='Up',
             statusMessage='',
@@ -40,29 +40,52 @@ from cmk_addons.plugins.dell_storage.agent_based import dell_storage_center
             version='7.3.20.19',
             serviceTag='ABCD123',
             serialNumber='987654',
-            numberOfControllers= '0',
-            numberOfDevicesInUse='2',
-            numberOfDisks='4',
-            numberOfLiveVolumes='0',
-            numberOfReplays='19',
-            numberOfReplications='0',
-            numberOfServers='8',
-            numberOfVolumes='19',
-            spaceAvailable='130000000000000',
-            spaceAllocated='100000000000000',
-            spaceUsed='30000000000000',
-        )]
+            numberOfControllers=0,
+            numberOfDevicesInUse=2,
+            numberOfDisks=4,
+            numberOfLiveVolumes=0,
+            numberOfReplays=19,
+            numberOfReplications=0,
+            numberOfServers=8,
+            numberOfVolumes=19,
+            spaceAvailable=130000000000000,
+            spaceAllocated=100000000000000,
+            spaceUsed=30000000000000,
+        )}
+    ),
+    (
+        [['SAN', 'Up', '', 'Sc5000Series', '7.3.20.19', 'ABCD123', '987654', '', '', '', '', '', '', '', '', '', '', '']],
+        {'SAN': dell_storage_center.StorageCenter(
+            name='SAN',
+            status='Up',
+            statusMessage='',
+            modelSeries='Sc5000Series',
+            version='7.3.20.19',
+            serviceTag='ABCD123',
+            serialNumber='987654',
+            numberOfControllers=None,
+            numberOfDevicesInUse=None,
+            numberOfDisks=None,
+            numberOfLiveVolumes=None,
+            numberOfReplays=None,
+            numberOfReplications=None,
+            numberOfServers=None,
+            numberOfVolumes=None,
+            spaceAvailable=None,
+            spaceAllocated=None,
+            spaceUsed=None,
+        )}
     ),
 ])
 def test_parse_dell_storage_center(string_table, result):
-    assert list(dell_storage_center.parse_dell_storage_center(string_table)) == result
+    assert dell_storage_center.parse_dell_storage_center(string_table) == result
 
 
 @pytest.mark.parametrize('section, result', [
-    ([], []),
+    ({}, []),
     (
-        [
-            dell_storage_center.StorageCenter(
+        {
+            'SAN': dell_storage_center.StorageCenter(
                 name='SAN',
                 status='Up',
                 statusMessage='',
@@ -70,24 +93,24 @@ def test_parse_dell_storage_center(string_table, result):
                 version='7.3.20.19',
                 serviceTag='ABCD123',
                 serialNumber='987654',
-                numberOfControllers= '0',
-                numberOfDevicesInUse='2',
-                numberOfDisks='4',
-                numberOfLiveVolumes='0',
-                numberOfReplays='19',
-                numberOfReplications='0',
-                numberOfServers='8',
-                numberOfVolumes='19',
-                spaceAvailable='130000000000000',
-                spaceAllocated='100000000000000',
-                spaceUsed='30000000000000',
+                numberOfControllers=0,
+                numberOfDevicesInUse=2,
+                numberOfDisks=4,
+                numberOfLiveVolumes=0,
+                numberOfReplays=19,
+                numberOfReplications=0,
+                numberOfServers=8,
+                numberOfVolumes=19,
+                spaceAvailable=130000000000000,
+                spaceAllocated=100000000000000,
+                spaceUsed=30000000000000,
             )
-        ],
+        },
         [Service(item='SAN')]
     ),
     (
-        [
-            dell_storage_center.StorageCenter(
+        {
+            'SAN': dell_storage_center.StorageCenter(
                 name='SAN',
                 status='Up',
                 statusMessage='',
@@ -95,19 +118,19 @@ def test_parse_dell_storage_center(string_table, result):
                 version='7.3.20.19',
                 serviceTag='ABCD123',
                 serialNumber='987654',
-                numberOfControllers= '0',
-                numberOfDevicesInUse='2',
-                numberOfDisks='4',
-                numberOfLiveVolumes='0',
-                numberOfReplays='19',
-                numberOfReplications='0',
-                numberOfServers='8',
-                numberOfVolumes='19',
-                spaceAvailable='130000000000000',
-                spaceAllocated='100000000000000',
-                spaceUsed='30000000000000',
+                numberOfControllers=0,
+                numberOfDevicesInUse=2,
+                numberOfDisks=4,
+                numberOfLiveVolumes=0,
+                numberOfReplays=19,
+                numberOfReplications=0,
+                numberOfServers=8,
+                numberOfVolumes=19,
+                spaceAvailable=130000000000000,
+                spaceAllocated=100000000000000,
+                spaceUsed=30000000000000,
             ),
-            dell_storage_center.StorageCenter(
+            'SAN2': dell_storage_center.StorageCenter(
                 name='SAN2',
                 status='Up',
                 statusMessage='',
@@ -115,19 +138,19 @@ def test_parse_dell_storage_center(string_table, result):
                 version='7.3.20.19',
                 serviceTag='ABCD123',
                 serialNumber='987654',
-                numberOfControllers= '0',
-                numberOfDevicesInUse='2',
-                numberOfDisks='4',
-                numberOfLiveVolumes='0',
-                numberOfReplays='19',
-                numberOfReplications='0',
-                numberOfServers='8',
-                numberOfVolumes='19',
-                spaceAvailable='130000000000000',
-                spaceAllocated='100000000000000',
-                spaceUsed='30000000000000',
+                numberOfControllers=0,
+                numberOfDevicesInUse=2,
+                numberOfDisks=4,
+                numberOfLiveVolumes=0,
+                numberOfReplays=19,
+                numberOfReplications=0,
+                numberOfServers=8,
+                numberOfVolumes=19,
+                spaceAvailable=130000000000000,
+                spaceAllocated=100000000000000,
+                spaceUsed=30000000000000,
             )
-        ],
+        },
         [
             Service(item='SAN'),
             Service(item='SAN2')
@@ -139,11 +162,11 @@ def test_discovery_dell_storage_center(section, result):
 
 
 @pytest.mark.parametrize('item, section, result', [
-    ('', [], []),
+    ('', {}, []),
     (
         'SAN',
-        [
-            dell_storage_center.StorageCenter(
+        {
+            'SAN2': dell_storage_center.StorageCenter(
                 name='SAN2',
                 status='Up',
                 statusMessage='',
@@ -151,25 +174,25 @@ def test_discovery_dell_storage_center(section, result):
                 version='7.3.20.19',
                 serviceTag='ABCD123',
                 serialNumber='987654',
-                numberOfControllers= '0',
-                numberOfDevicesInUse='2',
-                numberOfDisks='4',
-                numberOfLiveVolumes='0',
-                numberOfReplays='19',
-                numberOfReplications='0',
-                numberOfServers='8',
-                numberOfVolumes='19',
-                spaceAvailable='130000000000000',
-                spaceAllocated='100000000000000',
-                spaceUsed='30000000000000',
+                numberOfControllers=0,
+                numberOfDevicesInUse=2,
+                numberOfDisks=4,
+                numberOfLiveVolumes=0,
+                numberOfReplays=19,
+                numberOfReplications=0,
+                numberOfServers=8,
+                numberOfVolumes=19,
+                spaceAvailable=130000000000000,
+                spaceAllocated=100000000000000,
+                spaceUsed=30000000000000,
             )
-        ],
+        },
         []
     ),
     (
         'SAN',
-        [
-            dell_storage_center.StorageCenter(
+        {
+            'SAN': dell_storage_center.StorageCenter(
                 name='SAN',
                 status='Up',
                 statusMessage='',
@@ -177,19 +200,19 @@ def test_discovery_dell_storage_center(section, result):
                 version='7.3.20.19',
                 serviceTag='ABCD123',
                 serialNumber='987654',
-                numberOfControllers= '0',
-                numberOfDevicesInUse='2',
-                numberOfDisks='4',
-                numberOfLiveVolumes='6',
-                numberOfReplays='8',
-                numberOfReplications='10',
-                numberOfServers='12',
-                numberOfVolumes='14',
-                spaceAvailable='130000000000000',
-                spaceAllocated='100000000000000',
-                spaceUsed='30000000000000',
+                numberOfControllers=0,
+                numberOfDevicesInUse=2,
+                numberOfDisks=4,
+                numberOfLiveVolumes=6,
+                numberOfReplays=8,
+                numberOfReplications=10,
+                numberOfServers=12,
+                numberOfVolumes=14,
+                spaceAvailable=130000000000000,
+                spaceAllocated=100000000000000,
+                spaceUsed=30000000000000,
             )
-        ],
+        },
         [
             Result(state=State.OK, summary='Up'),
             Result(state=State.OK, summary='Model: Sc5000Series v7.3.20.19'),
@@ -211,6 +234,35 @@ def test_discovery_dell_storage_center(section, result):
             Metric('volume', 14),
         ]
     ),
+    (
+        'SAN',
+        {'SAN': dell_storage_center.StorageCenter(
+            name='SAN',
+            status='Up',
+            statusMessage='',
+            modelSeries='Sc5000Series',
+            version='7.3.20.19',
+            serviceTag='ABCD123',
+            serialNumber='987654',
+            numberOfControllers=None,
+            numberOfDevicesInUse=None,
+            numberOfDisks=None,
+            numberOfLiveVolumes=None,
+            numberOfReplays=None,
+            numberOfReplications=None,
+            numberOfServers=None,
+            numberOfVolumes=None,
+            spaceAvailable=None,
+            spaceAllocated=None,
+            spaceUsed=None,
+        )},
+        [
+            Result(state=State.OK, summary='Up'),
+            Result(state=State.OK, summary='Model: Sc5000Series v7.3.20.19'),
+            Result(state=State.OK, summary='ST: ABCD123'),
+            Result(state=State.OK, summary='SN: 987654'),
+        ]
+    ),
 ])
 def test_check_dell_storage_center(item, section, result):
     assert list(dell_storage_center.check_dell_storage_center(item, section)) == result
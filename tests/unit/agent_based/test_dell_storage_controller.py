@@ -31,7 +31,7 @@ from cmk_addons.plugins.dell_storage.agent_based import dell_storage_controller
 @pytest.mark.parametrize('string_table, result', [
     (
         [['Top Controller', 'Up', '', '2020-08-21T19:38:12+02:00', 'True', 'Sc5020', '7.3.20.19', 'ABCD123', '123-456-789-00', '456789']],
-        [dell_storage_controller.ScController(
+        {'Top Controller': dell_storage_controller.ScController(
             name='Top Controller',
             status='Up',
             statusMessage='',
@@ -42,15 +42,15 @@ from cmk_addons.plugins.dell_storage.agent_based import dell_storage_controller
             serviceTag= 'ABCD123',
             expressServiceCode='123-456-789-00',
             serialNumber='456789',
-        )]
+        )}
     ),
     (
         [
             ['Top Controller', 'Up', '', '2020-08-21T19:38:12+02:00', 'True', 'Sc5020', '7.3.20.19', 'ABCD123', '123-456-789-00', '456789'],
             ['Bottom Controller', 'Up', '', '2020-08-21T19:38:12+02:00', 'False', 'Sc5020', '7.3.20.19', 'ABCD123', '123-456-789-00', '456790']
         ],
-        [
-            dell_storage_controller.ScController(
+        {
+            'Top Controller': dell_storage_controller.ScController(
                 name='Top Controller',
                 status='Up',
                 statusMessage='',
@@ -62,7 +62,7 @@ from cmk_addons.plugins.dell_storage.agent_based import dell_storage_controller
                 expressServiceCode='123-456-789-00',
                 serialNumber='456789',
             ),
-            dell_storage_controller.ScController(
+            'Bottom Controller': dell_storage_controller.ScController(
                 name='Bottom Controller',
                 status='Up',
                 statusMessage='',
@@ -74,18 +74,18 @@ from cmk_addons.plugins.dell_storage.agent_based import dell_storage_controller
                 expressServiceCode='123-456-789-00',
                 serialNumber='456790',
             )
-        ]
+        }
     ),
 ])
 def test_parse_dell_storage_controller(string_table, result):
-    assert list(dell_storage_controller.parse_dell_storage_controller(string_table)) == result
+    assert dell_storage_controller.parse_dell_storage_controller(string_table) == result
 
 
 @pytest.mark.parametrize('section, result', [
-    ([], []),
+    ({}, []),
     (
-        [
-            dell_storage_controller.ScController(
+        {
+            'Top Controller': dell_storage_controller.ScController(
                 name='Top Controller',
                 status='Up',
                 statusMessage='',
@@ -97,12 +97,12 @@ def test_parse_dell_storage_controller(string_table, result):
                 expressServiceCode='123-456-789-00',
                 serialNumber='456789',
             ),
-        ],
+        },
         [Service(item='Top Controller')]
     ),
     (
-        [
-            dell_storage_controller.ScController(
+        {
+            'Top Controller': dell_storage_controller.ScController(
                 name='Top Controller',
                 status='Up',
                 statusMessage='',
@@ -114,7 +114,7 @@ def test_parse_dell_storage_controller(string_table, result):
                 expressServiceCode='123-456-789-00',
                 serialNumber='456789',
             ),
-            dell_storage_controller.ScController(
+            'Bottom Controller': dell_storage_controller.ScController(
                 name='Bottom Controller',
                 status='Up',
                 statusMessage='',
@@ -126,7 +126,7 @@ def test_parse_dell_storage_controller(string_table, result):
                 expressServiceCode='123-456-789-00',
                 serialNumber='456790',
             )
-        ],
+        },
         [
             Service(item='Top Controller'),
             Service(item='Bottom Controller')
@@ -138,11 +138,11 @@ def test_discovery_dell_storage_controller(section, result):
 
 
 @pytest.mark.parametrize('item, section, result', [
-    ('', [], []),
+    ('', {}, []),
     (
         'Bottom Controller',
-        [
-            dell_storage_controller.ScController(
+        {
+            'Top Controller': dell_storage_controller.ScController(
                 name='Top Controller',
                 status='Up',
                 statusMessage='',
@@ -154,13 +154,13 @@ def test_discovery_dell_storage_controller(section, result):
                 expressServiceCode='123-456-789-00',
                 serialNumber='456789',
             ),
-        ],
+        },
         []
     ),
     (
         'Top Controller',
-        [
-            dell_storage_controller.ScController(
+        {
+            'Top Controller': dell_storage_controller.ScController(
                 name='Top Controller',
                 status='Up',
                 statusMessage='',
@@ -172,7 +172,7 @@ def test_discovery_dell_storage_controller(section, result):
                 expressServiceCode='123-456-789-00',
                 serialNumber='456789',
             ),
-        ],
+        },
         [
             Result(state=State.OK, summary='Up'),
             Result(state=State.OK, summary='Model: Sc5020 v7.3.20.19'),
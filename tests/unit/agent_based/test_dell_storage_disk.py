@@ -32,124 +32,124 @@ from cmk_addons.plugins.dell_storage.agent_based import dell_storage_disk
 @pytest.mark.parametrize('string_table, result', [
     (
         [['01-16', 'Up', '', '360081014784', '1800360124416', '1', '49152', '0.003444', '2', '14336', '0.0']],
-        [dell_storage_disk.ScDisk(
+        {'01-16': dell_storage_disk.ScDisk(
             name='01-16',
             status='Up',
             statusMessage='',
-            allocatedSpace='360081014784',
-            totalSpace='1800360124416',
-            readIops='1',
-            readBps='49152',
-            readLatency='0.003444',
-            writeIops='2',
-            writeBps='14336',
-            writeLatency='0.0',
-        )]
+            allocatedSpace=360081014784,
+            totalSpace=1800360124416,
+            readIops=1,
+            readBps=49152,
+            readLatency=0.003444,
+            writeIops=2,
+            writeBps=14336,
+            writeLatency=0.0,
+        )}
     ),
     (
         [
             ['01-16', 'Up', '', '360081014784', '1800360124416', '1', '49152', '0.003444', '2', '14336', '0.0'],
             ['01-08', 'Up', '', '1661088579584', '1800360124416', '4', '121856', '0.003447', '2', '22528', '0.0'],
         ],
-        [
-            dell_storage_disk.ScDisk(
+        {
+            '01-16': dell_storage_disk.ScDisk(
                 name='01-16',
                 status='Up',
                 statusMessage='',
-                allocatedSpace='360081014784',
-                totalSpace='1800360124416',
-                readIops='1',
-                readBps='49152',
-                readLatency='0.003444',
-                writeIops='2',
-                writeBps='14336',
-                writeLatency='0.0',
+                allocatedSpace=360081014784,
+                totalSpace=1800360124416,
+                readIops=1,
+                readBps=49152,
+                readLatency=0.003444,
+                writeIops=2,
+                writeBps=14336,
+                writeLatency=0.0,
             ),
-            dell_storage_disk.ScDisk(
+            '01-08': dell_storage_disk.ScDisk(
                 name='01-08',
                 status='Up',
                 statusMessage='',
-                allocatedSpace='1661088579584',
-                totalSpace='1800360124416',
-                readIops='4',
-                readBps='121856',
-                readLatency='0.003447',
-                writeIops='2',
-                writeBps='22528',
-                writeLatency='0.0',
+                allocatedSpace=1661088579584,
+                totalSpace=1800360124416,
+                readIops=4,
+                readBps=121856,
+                readLatency=0.003447,
+                writeIops=2,
+                writeBps=22528,
+                writeLatency=0.0,
             )
-        ]
+        }
     ),
     (
         [['01-16', 'Up', '', '360081014784', '1800360124416', '', '', '', '', '', '']],
-        [dell_storage_disk.ScDisk(
+        {'01-16': dell_storage_disk.ScDisk(
             name='01-16',
             status='Up',
             statusMessage='',
-            allocatedSpace='360081014784',
-            totalSpace='1800360124416',
-            readIops='',
-            readBps='',
-            readLatency='',
-            writeIops='',
-            writeBps='',
-            writeLatency='',
-        )]
+            allocatedSpace=360081014784,
+            totalSpace=1800360124416,
+            readIops=None,
+            readBps=None,
+            readLatency=None,
+            writeIops=None,
+            writeBps=None,
+            writeLatency=None,
+        )}
     ),
 ])
 def test_parse_dell_storage_disk(string_table, result):
-    assert list(dell_storage_disk.parse_dell_storage_disk(string_table)) == result
+    assert dell_storage_disk.parse_dell_storage_disk(string_table) == result
 
 
 @pytest.mark.parametrize('section, result', [
-    ([], []),
+    ({}, []),
     (
-        [
-            dell_storage_disk.ScDisk(
+        {
+            '01-16': dell_storage_disk.ScDisk(
                 name='01-16',
                 status='Up',
                 statusMessage='',
-                allocatedSpace='360081014784',
-                totalSpace='1800360124416',
-                readIops='1',
-                readBps='49152',
-                readLatency='0.003444',
-                writeIops='2',
-                writeBps='14336',
-                writeLatency='0.0',
+                allocatedSpace=360081014784,
+                totalSpace=1800360124416,
+                readIops=1,
+                readBps=49152,
+                readLatency=0.003444,
+                writeIops=2,
+                writeBps=14336,
+                writeLatency=0.0,
             ),
-        ],
+        },
         [Service(item='01-16')]
     ),
     (
-        [
-            dell_storage_disk.ScDisk(
+        {
+            '01-16': dell_storage_disk.ScDisk(
                 name='01-16',
                 status='Up',
                 statusMessage='',
-                allocatedSpace='360081014784',
-                totalSpace='1800360124416',
-                readIops='1',
-                readBps='49152',
-                readLatency='0.003444',
-                writeIops='2',
-                writeBps='14336',
-                writeLatency='0.0',
+                allocatedSpace=360081014784,
+                totalSpace=1800360124416,
+                readIops=1,
+                readBps=49152,
+                readLatency=0.003444,
+                writeIops=2,
+                writeBps=14336,
+                writeLatency=0.0,
             ),
-            dell_storage_disk.ScDisk(
+            '01-08': dell_storage_disk.ScDisk(
                 name='01-08',
                 status='Up',
                 statusMessage='',
-                allocatedSpace='1661088579584',
-                totalSpace='1800360124416',
-                readIops='4',
-                readBps='121856',
-                readLatency='0.003447',
-                writeIops='2',
-                writeBps='22528',
-                writeLatency='0.0',
+                allocatedSpace=1661088579584,
+                totalSpace=1800360124416,
+                readIops=4,
+                readBps=121856,
+                readLatency=0.003447,
+                writeIops=2,
+                writeBps=22528,
+                writeLatency=0.0,
             ),
-        ],
+        },
         [
             Service(item='01-16'),
             Service(item='01-08')
@@ -161,43 +161,43 @@ def test_discovery_dell_storage_disk(section, result):
 
 
 @pytest.mark.parametrize('item, section, result', [
-    ('', [], []),
+    ('', {}, []),
     (
         '01-08',
-        [
-            dell_storage_disk.ScDisk(
+        {
+            '01-16': dell_storage_disk.ScDisk(
                 name='01-16',
                 status='Up',
                 statusMessage='',
-                allocatedSpace='360081014784',
-                totalSpace='1800360124416',
-                readIops='1',
-                readBps='49152',
-                readLatency='0.003444',
-                writeIops='2',
-                writeBps='14336',
-                writeLatency='0.0',
+                allocatedSpace=360081014784,
+                totalSpace=1800360124416,
+                readIops=1,
+                readBps=49152,
+                readLatency=0.003444,
+                writeIops=2,
+                writeBps=14336,
+                writeLatency=0.0,
             ),
-        ],
+        },
         []
     ),
     (
         '01-16',
-        [
-            dell_storage_disk.ScDisk(
+        {
+            '01-16': dell_storage_disk.ScDisk(
                 name='01-16',
                 status='Up',
                 statusMessage='',
-                allocatedSpace='360081014784',
-                totalSpace='1800360124416',
-                readIops='1',
-                readBps='49152',
-                readLatency='0.003444',
-                writeIops='2',
-                writeBps='14336',
-                writeLatency='0.0',
+                allocatedSpace=360081014784,
+                totalSpace=1800360124416,
+                readIops=1,
+                readBps=49152,
+                readLatency=0.003444,
+                writeIops=2,
+                writeBps=14336,
+                writeLatency=0.0,
             ),
-        ],
+        },
         [
             Result(state=State.OK, summary='Up'),
             Metric('usage', 360081014784, boundaries=(0, 1800360124416)),
@@ -217,21 +217,21 @@ def test_discovery_dell_storage_disk(section, result):
     ),
     (
         '01-16',
-        [
-            dell_storage_disk.ScDisk(
+        {
+            '01-16': dell_storage_disk.ScDisk(
                 name='01-16',
                 status='Up',
                 statusMessage='',
-                allocatedSpace='360081014784',
-                totalSpace='1800360124416',
-                readIops='',
-                readBps='',
-                readLatency='',
-                writeIops='',
-                writeBps='',
-                writeLatency='',
+                allocatedSpace=360081014784,
+                totalSpace=1800360124416,
+                readIops=None,
+                readBps=None,
+                readLatency=None,
+                writeIops=None,
+                writeBps=None,
+                writeLatency=None,
             ),
-        ],
+        },
         [
             Result(state=State.OK, summary='Up'),
             Metric('usage', 360081014784, boundaries=(0, 1800360124416)),
@@ -248,14 +248,14 @@ SAMPLE_DISK = dell_storage_disk.ScDisk(
     name='01-16',
     status='Up',
     statusMessage='',
-    allocatedSpace='360081014784',
-    totalSpace='1800360124416',
-    readIops='1',
-    readBps='49152',
-    readLatency='0.003444',
-    writeIops='2',
-    writeBps='14336',
-    writeLatency='0.002333',
+    allocatedSpace=360081014784,
+    totalSpace=1800360124416,
+    readIops=1,
+    readBps=49152,
+    readLatency=0.003444,
+    writeIops=2,
+    writeBps=14336,
+    writeLatency=0.002333,
 )
 
 
@@ -336,4 +336,30 @@ SAMPLE_DISK = dell_storage_disk.ScDisk(
 def test_check_dell_storage_disk_w_param(params, result, monkeypatch):
     monkeypatch.setattr(dell_storage_disk, 'get_value_store', lambda: {})
 
-    assert result in list(dell_storage_disk.check_dell_storage_disk(SAMPLE_DISK.name, params, [SAMPLE_DISK]))
+    assert result in list(dell_storage_disk.check_dell_storage_disk(SAMPLE_DISK.name, params, {SAMPLE_DISK.name: SAMPLE_DISK}))
+
+
+def test_check_dell_storage_disk_no_usage(monkeypatch):
+    monkeypatch.setattr(dell_storage_disk, 'get_value_store', lambda: {})
+    section = dell_storage_disk.parse_dell_storage_disk([['01-17', 'Up', '', '', '', '', '', '', '', '', '']])
+    assert section['01-17'].allocatedSpace is None
+
+    assert list(dell_storage_disk.check_dell_storage_disk('01-17', {}, section)) == [
+        Result(state=State.OK, summary='Up'),
+    ]
+
+
+def test_dell_storage_disk_latency_peak():
+    section = dell_storage_disk.parse_dell_storage_disk([
+        ['01-18', 'Up', '', '360081014784', '1800360124416', '1.0', '49152.0', '0.003444', '2.0', '14336.0', '0.0',
+         '0.0', '2.0', '0.0', '98304.0', '0.0', '0.0052', '1.0', '3.0', '4096.0', '24576.0', '0.0', '0.0004'],
+        ['01-19', 'Up', '', '360081014784', '1800360124416', '', '', '', '', '', ''],
+    ])
+
+    assert list(dell_storage_disk.discovery_dell_storage_disk_latency_peak(section)) == [Service(item='01-18')]
+    assert list(dell_storage_disk.check_dell_storage_disk_latency_peak('01-18', {'write_latency_peak': ('fixed', (0.02, 0.05))}, section)) == [
+        Result(state=State.OK, summary='Read latency peak: 5 milliseconds'),
+        Metric('dell_storage_read_latency_peak', 0.0052),
+        Result(state=State.OK, summary='Write latency peak: 400 microseconds'),
+        Metric('dell_storage_write_latency_peak', 0.0004, levels=(0.02, 0.05)),
+    ]
@@ -32,7 +32,7 @@ SAMPLE_STRING_TABLE = [
     ['Enclosure - 2', 'Degraded', 'FooBar', 'EN-SC420', '1.09', 'SasEbod12g', '24', 'ABCD456', '123-456-789-02'],
 ]
 
-SAMPLE_SECTION = [
+SAMPLE_OBJECTS = [
     dell_storage_enclosure.ScEnclosure(
         name='Enclosure - 1',
         status='Up',
@@ -56,12 +56,13 @@ SAMPLE_SECTION = [
         expressServiceCode='123-456-789-02',
     ),
 ]
+SAMPLE_SECTION = {obj.name: obj for obj in SAMPLE_OBJECTS}
 
 
 @pytest.mark.parametrize('string_table, result', [
     (
         [SAMPLE_STRING_TABLE[0]],
-        [SAMPLE_SECTION[0]]
+        {SAMPLE_OBJECTS[0].name: SAMPLE_OBJECTS[0]}
     ),
     (
         SAMPLE_STRING_TABLE,
@@ -69,20 +70,20 @@ SAMPLE_SECTION = [
     ),
 ])
 def test_parse_dell_storage_enclosure(string_table, result):
-    assert list(dell_storage_enclosure.parse_dell_storage_enclosure(string_table)) == result
+    assert dell_storage_enclosure.parse_dell_storage_enclosure(string_table) == result
 
 
 @pytest.mark.parametrize('section, result', [
-    ([], []),
+    ({}, []),
     (
-        [SAMPLE_SECTION[0]],
-        [Service(item=SAMPLE_SECTION[0].name)]
+        {SAMPLE_OBJECTS[0].name: SAMPLE_OBJECTS[0]},
+        [Service(item=SAMPLE_OBJECTS[0].name)]
     ),
     (
         SAMPLE_SECTION,
         [
-            Service(item=SAMPLE_SECTION[0].name),
-            Service(item=SAMPLE_SECTION[1].name),
+            Service(item=SAMPLE_OBJECTS[0].name),
+            Service(item=SAMPLE_OBJECTS[1].name),
         ]
     ),
 ])
@@ -91,10 +92,10 @@ def test_discovery_dell_storage_enclosure(section, result):
 
 
 @pytest.mark.parametrize('item, section, result', [
-    ('', [], []),
+    ('', {}, []),
     ('01-08', SAMPLE_SECTION, []),
     (
-        SAMPLE_SECTION[0].name,
+        SAMPLE_OBJECTS[0].name,
         SAMPLE_SECTION,
         [
             Result(state=State.OK, summary='Up'),
@@ -105,7 +106,7 @@ def test_discovery_dell_storage_enclosure(section, result):
         ]
     ),
     (
-        SAMPLE_SECTION[1].name,
+        SAMPLE_OBJECTS[1].name,
         SAMPLE_SECTION,
         [
             Result(state=State.WARN, summary='Degraded: FooBar'),
@@ -33,19 +33,19 @@ SAMPLE_STRING_TABLE = [
     ['02-03', 'Up', '', 'In Power Supply - Back Right']
 ]
 
-SAMPLE_SECTION = [
+SAMPLE_OBJECTS = [
     dell_storage_fan.ScFan(
         name='Fan 1',
         status='Up',
         statusMessage='',
         location='Fan 1 Single rotor, Power Supply 1',
-        currentRpm='5880',
-        lowerCriticalThreshold='0',
-        lowerWarningThreshold='1800',
-        lowerNormalThreshold='2040',
-        upperNormalThreshold='18000',
-        upperWarningThreshold='20000',
-        upperCriticalThreshold='30600',
+        currentRpm=5880,
+        lowerCriticalThreshold=0,
+        lowerWarningThreshold=1800,
+        lowerNormalThreshold=2040,
+        upperNormalThreshold=18000,
+        upperWarningThreshold=20000,
+        upperCriticalThreshold=30600,
     ),
     dell_storage_fan.ScFan(
         name='02-03',
@@ -54,12 +54,13 @@ SAMPLE_SECTION = [
         location='In Power Supply - Back Right',
     ),
 ]
+SAMPLE_SECTION = {obj.name: obj for obj in SAMPLE_OBJECTS}
 
 
 @pytest.mark.parametrize('string_table, result', [
     (
         [SAMPLE_STRING_TABLE[0]],
-        [SAMPLE_SECTION[0]]
+        {SAMPLE_OBJECTS[0].name: SAMPLE_OBJECTS[0]}
     ),
     (
         SAMPLE_STRING_TABLE,
@@ -67,20 +68,20 @@ SAMPLE_SECTION = [
     ),
 ])
 def test_parse_dell_storage_fan(string_table, result):
-    assert list(dell_storage_fan.parse_dell_storage_fan(string_table)) == result
+    assert dell_storage_fan.parse_dell_storage_fan(string_table) == result
 
 
 @pytest.mark.parametrize('section, result', [
-    ([], []),
+    ({}, []),
     (
-        [SAMPLE_SECTION[0]],
-        [Service(item=SAMPLE_SECTION[0].name)]
+        {SAMPLE_OBJECTS[0].name: SAMPLE_OBJECTS[0]},
+        [Service(item=SAMPLE_OBJECTS[0].name)]
     ),
     (
         SAMPLE_SECTION,
         [
-            Service(item=SAMPLE_SECTION[0].name),
-            Service(item=SAMPLE_SECTION[1].name),
+            Service(item=SAMPLE_OBJECTS[0].name),
+            Service(item=SAMPLE_OBJECTS[1].name),
         ]
     ),
 ])
@@ -89,10 +90,10 @@ def test_discovery_dell_storage_fan(section, result):
 
 
 @pytest.mark.parametrize('item, section, result', [
-    ('', [], []),
+    ('', {}, []),
     ('01-08', SAMPLE_SECTION, []),
     (
-        SAMPLE_SECTION[0].name,
+        SAMPLE_OBJECTS[0].name,
         SAMPLE_SECTION,
         [
             Result(state=State.OK, summary='Up'),
@@ -102,7 +103,7 @@ def test_discovery_dell_storage_fan(section, result):
         ]
     ),
     (
-        SAMPLE_SECTION[1].name,
+        SAMPLE_OBJECTS[1].name,
         SAMPLE_SECTION,
         [
             Result(state=State.OK, summary='Up'),
@@ -141,4 +142,4 @@ def test_check_dell_storage_fan(item, section, result):
     ),
 ])
 def test_check_dell_storage_fan_w_param(params, result):
-    assert result in list(dell_storage_fan.check_dell_storage_fan(SAMPLE_SECTION[0].name, params, [SAMPLE_SECTION[0]]))
+    assert result in list(dell_storage_fan.check_dell_storage_fan(SAMPLE_OBJECTS[0].name, params, {SAMPLE_OBJECTS[0].name: SAMPLE_OBJECTS[0]}))
@@ -34,7 +34,7 @@ SAMPLE_STRING_TABLE = [
     ['5000D310055E9014', 'Up', '', 'True', 'Iscsi', '5000D310055E9014', '', '', '', '', '', ''],
 ]
 
-SAMPLE_SECTION = [
+SAMPLE_OBJECTS = [
     dell_storage_port.ScPort(
         name='5000D310055E9018',
         status='Up',
@@ -42,12 +42,12 @@ SAMPLE_SECTION = [
         cabled='True',
         type='Iscsi',
         wwn='5000D310055E9018',
-        readIops='18',
-        readBps='945152',
-        readLatency='0.002458',
-        writeIops='147',
-        writeBps='2330624',
-        writeLatency='0.000434',
+        readIops=18,
+        readBps=945152,
+        readLatency=0.002458,
+        writeIops=147,
+        writeBps=2330624,
+        writeLatency=0.000434,
     ),
     dell_storage_port.ScPort(
         name='5000D310055E9016',
@@ -56,12 +56,12 @@ SAMPLE_SECTION = [
         cabled='True',
         type='Iscsi',
         wwn='5000D310055E9016',
-        readIops='16',
-        readBps='899072',
-        readLatency='0.002574',
-        writeIops='159',
-        writeBps='2462720',
-        writeLatency='0.000459',
+        readIops=16,
+        readBps=899072,
+        readLatency=0.002574,
+        writeIops=159,
+        writeBps=2462720,
+        writeLatency=0.000459,
     ),
     dell_storage_port.ScPort(
         name='5000D310055E9014',
@@ -70,20 +70,21 @@ SAMPLE_SECTION = [
         cabled='True',
         type='Iscsi',
         wwn='5000D310055E9014',
-        readIops='',
-        readBps='',
-        readLatency='',
-        writeIops='',
-        writeBps='',
-        writeLatency='',
+        readIops=None,
+        readBps=None,
+        readLatency=None,
+        writeIops=None,
+        writeBps=None,
+        writeLatency=None,
     ),
 ]
+SAMPLE_SECTION = {obj.name: obj for obj in SAMPLE_OBJECTS}
 
 
 @pytest.mark.parametrize('string_table, result', [
     (
         [SAMPLE_STRING_TABLE[0]],
-        [SAMPLE_SECTION[0]]
+        {SAMPLE_OBJECTS[0].name: SAMPLE_OBJECTS[0]}
     ),
     (
         SAMPLE_STRING_TABLE,
@@ -91,21 +92,21 @@ SAMPLE_SECTION = [
     ),
 ])
 def test_parse_dell_storage_port(string_table, result):
-    assert list(dell_storage_port.parse_dell_storage_port(string_table)) == result
+    assert dell_storage_port.parse_dell_storage_port(string_table) == result
 
 
 @pytest.mark.parametrize('section, result', [
-    ([], []),
+    ({}, []),
     (
-        [SAMPLE_SECTION[0]],
-        [Service(item=SAMPLE_SECTION[0].name)]
+        {SAMPLE_OBJECTS[0].name: SAMPLE_OBJECTS[0]},
+        [Service(item=SAMPLE_OBJECTS[0].name)]
     ),
     (
         SAMPLE_SECTION,
         [
-            Service(item=SAMPLE_SECTION[0].name),
-            Service(item=SAMPLE_SECTION[1].name),
-            Service(item=SAMPLE_SECTION[2].name),
+            Service(item=SAMPLE_OBJECTS[0].name),
+            Service(item=SAMPLE_OBJECTS[1].name),
+            Service(item=SAMPLE_OBJECTS[2].name),
         ]
     ),
 ])
@@ -114,10 +115,10 @@ def test_discovery_dell_storage_port(section, result):
 
 
 @pytest.mark.parametrize('item, section, result', [
-    ('', [], []),
+    ('', {}, []),
     ('01-08', SAMPLE_SECTION, []),
     (
-        SAMPLE_SECTION[0].name,
+        SAMPLE_OBJECTS[0].name,
         SAMPLE_SECTION,
         [
             Result(state=State.OK, summary='Up'),
@@ -139,7 +140,7 @@ def test_discovery_dell_storage_port(section, result):
         ]
     ),
     (
-        SAMPLE_SECTION[2].name,
+        SAMPLE_OBJECTS[2].name,
         SAMPLE_SECTION,
         [
             Result(state=State.OK, summary='Up'),
@@ -232,7 +233,23 @@ def test_check_dell_storage_port(item, section, result, monkeypatch):
 def test_check_dell_storage_port_w_param(params, result, monkeypatch):
     monkeypatch.setattr(dell_storage_port, 'get_value_store', lambda: {})
 
-    for i in dell_storage_port.check_dell_storage_port(SAMPLE_SECTION[1].name, params, [SAMPLE_SECTION[1]]):
+    for i in dell_storage_port.check_dell_storage_port(SAMPLE_OBJECTS[1].name, params, {SAMPLE_OBJECTS[1].name: SAMPLE_OBJECTS[1]}):
         print(i)
 
-    assert result in list(dell_storage_port.check_dell_storage_port(SAMPLE_SECTION[1].name, params, [SAMPLE_SECTION[1]]))
+    assert result in list(dell_storage_port.check_dell_storage_port(SAMPLE_OBJECTS[1].name, params, {SAMPLE_OBJECTS[1].name: SAMPLE_OBJECTS[1]}))
+
+
+def test_dell_storage_port_latency_peak():
+    section = dell_storage_port.parse_dell_storage_port([
+        ['5000D310055E9012', 'Up', '', 'True', 'Iscsi', '5000D310055E9012', '18.0', '945152.0', '0.002458', '147.0', '2330624.0', '0.000434',
+         '10.0', '26.0', '512000.0', '1378304.0', '0.0012', '0.0071', '120.0', '174.0', '1900544.0', '2760704.0', '0.0002', '0.0009'],
+        SAMPLE_STRING_TABLE[0],
+    ])
+
+    assert list(dell_storage_port.discovery_dell_storage_port_latency_peak(section)) == [Service(item='5000D310055E9012')]
+    assert list(dell_storage_port.check_dell_storage_port_latency_peak('5000D310055E9012', {}, section)) == [
+        Result(state=State.OK, summary='Read latency peak: 7 milliseconds'),
+        Metric('dell_storage_read_latency_peak', 0.0071),
+        Result(state=State.OK, summary='Write latency peak: 900 microseconds'),
+        Metric('dell_storage_write_latency_peak', 0.0009),
+    ]
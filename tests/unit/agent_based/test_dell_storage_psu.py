@@ -32,7 +32,7 @@ SAMPLE_STRING_TABLE = [
     ['02-04', 'Degraded', 'FooBar', 'In Power Supply - Back Right']
 ]
 
-SAMPLE_SECTION = [
+SAMPLE_OBJECTS = [
     dell_storage_psu.ScPSU(
         name='PowerSupply1',
         status='Up',
@@ -46,12 +46,13 @@ SAMPLE_SECTION = [
         location='In Power Supply - Back Right',
     ),
 ]
+SAMPLE_SECTION = {obj.name: obj for obj in SAMPLE_OBJECTS}
 
 
 @pytest.mark.parametrize('string_table, result', [
     (
         [SAMPLE_STRING_TABLE[0]],
-        [SAMPLE_SECTION[0]]
+        {SAMPLE_OBJECTS[0].name: SAMPLE_OBJECTS[0]}
     ),
     (
         SAMPLE_STRING_TABLE,
@@ -59,20 +60,20 @@ SAMPLE_SECTION = [
     ),
 ])
 def test_parse_dell_storage_psu(string_table, result):
-    assert list(dell_storage_psu.parse_dell_storage_psu(string_table)) == result
+    assert dell_storage_psu.parse_dell_storage_psu(string_table) == result
 
 
 @pytest.mark.parametrize('section, result', [
-    ([], []),
+    ({}, []),
     (
-        [SAMPLE_SECTION[0]],
-        [Service(item=SAMPLE_SECTION[0].name)]
+        {SAMPLE_OBJECTS[0].name: SAMPLE_OBJECTS[0]},
+        [Service(item=SAMPLE_OBJECTS[0].name)]
     ),
     (
         SAMPLE_SECTION,
         [
-            Service(item=SAMPLE_SECTION[0].name),
-            Service(item=SAMPLE_SECTION[1].name),
+            Service(item=SAMPLE_OBJECTS[0].name),
+            Service(item=SAMPLE_OBJECTS[1].name),
         ]
     ),
 ])
@@ -81,17 +82,17 @@ def test_discovery_dell_storage_psu(section, result):
 
 
 @pytest.mark.parametrize('item, section, result', [
-    ('', [], []),
+    ('', {}, []),
     ('01-08', SAMPLE_SECTION, []),
     (
-        SAMPLE_SECTION[0].name,
+        SAMPLE_OBJECTS[0].name,
         SAMPLE_SECTION,
         [
             Result(state=State.OK, summary='Up'),
         ]
     ),
     (
-        SAMPLE_SECTION[1].name,
+        SAMPLE_OBJECTS[1].name,
         SAMPLE_SECTION,
         [
             Result(state=State.WARN, summary='Degraded: FooBar'),
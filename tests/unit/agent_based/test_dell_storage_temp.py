@@ -38,40 +38,41 @@ SAMPLE_STRING_TABLE = [
     ['02-02', 'Up', '', 'Midplane', '27', 'None', '4', '9', '54', '57', 'None']
 ]
 
-SAMPLE_SECTION = [
+SAMPLE_OBJECTS = [
     dell_storage_temp.ScTemp(
         name='Ambient',
         status='Up',
         statusMessage='',
         location='None',
-        currentTemp='22',
-        lowerCriticalThreshold='-128',
-        lowerWarningThreshold='-7',
-        lowerNormalThreshold='3',
-        upperNormalThreshold='42',
-        upperWarningThreshold='47',
-        upperCriticalThreshold='127',
+        currentTemp=22,
+        lowerCriticalThreshold=-128,
+        lowerWarningThreshold=-7,
+        lowerNormalThreshold=3,
+        upperNormalThreshold=42,
+        upperWarningThreshold=47,
+        upperCriticalThreshold=127,
     ),
     dell_storage_temp.ScTemp(
         name='02-02',
         status='Up',
         statusMessage='',
         location='Midplane',
-        currentTemp='27',
-        lowerCriticalThreshold='None',
-        lowerWarningThreshold='4',
-        lowerNormalThreshold='9',
-        upperNormalThreshold='54',
-        upperWarningThreshold='57',
-        upperCriticalThreshold='None',
+        currentTemp=27,
+        lowerCriticalThreshold=None,
+        lowerWarningThreshold=4,
+        lowerNormalThreshold=9,
+        upperNormalThreshold=54,
+        upperWarningThreshold=57,
+        upperCriticalThreshold=None,
     ),
 ]
+SAMPLE_SECTION = {obj.name: obj for obj in SAMPLE_OBJECTS}
 
 
 @pytest.mark.parametrize('string_table, result', [
     (
         [SAMPLE_STRING_TABLE[0]],
-        [SAMPLE_SECTION[0]]
+        {SAMPLE_OBJECTS[0].name: SAMPLE_OBJECTS[0]}
     ),
     (
         SAMPLE_STRING_TABLE,
@@ -79,20 +80,20 @@ SAMPLE_SECTION = [
     ),
 ])
 def test_parse_dell_storage_temp(string_table, result):
-    assert list(dell_storage_temp.parse_dell_storage_temp(string_table)) == result
+    assert dell_storage_temp.parse_dell_storage_temp(string_table) == result
 
 
 @pytest.mark.parametrize('section, result', [
-    ([], []),
+    ({}, []),
     (
-        [SAMPLE_SECTION[0]],
-        [Service(item=SAMPLE_SECTION[0].name)]
+        {SAMPLE_OBJECTS[0].name: SAMPLE_OBJECTS[0]},
+        [Service(item=SAMPLE_OBJECTS[0].name)]
     ),
     (
         SAMPLE_SECTION,
         [
-            Service(item=SAMPLE_SECTION[0].name),
-            Service(item=SAMPLE_SECTION[1].name),
+            Service(item=SAMPLE_OBJECTS[0].name),
+            Service(item=SAMPLE_OBJECTS[1].name),
         ]
     ),
 ])
@@ -101,10 +102,10 @@ def test_discovery_dell_storage_temp(section, result):
 
 
 @pytest.mark.parametrize('item, section, result', [
-    ('', [], []),
+    ('', {}, []),
     ('01-08', SAMPLE_SECTION, []),
     (
-        SAMPLE_SECTION[0].name,
+        SAMPLE_OBJECTS[0].name,
         SAMPLE_SECTION,
         [
             Result(state=State.OK, summary='Up'),
@@ -114,7 +115,7 @@ def test_discovery_dell_storage_temp(section, result):
         ]
     ),
     (
-        SAMPLE_SECTION[1].name,
+        SAMPLE_OBJECTS[1].name,
         SAMPLE_SECTION,
         [
             Result(state=State.OK, summary='Up'),
@@ -172,4 +173,4 @@ def test_check_dell_storage_temp(item, section, result, monkeypatch):
 def test_check_dell_storage_temp_w_param(params, result, monkeypatch):
     monkeypatch.setattr(dell_storage_temp, 'get_value_store', get_value_store)
 
-    assert result in list(dell_storage_temp.check_dell_storage_temp(SAMPLE_SECTION[0].name, params, [SAMPLE_SECTION[0]]))
+    assert result in list(dell_storage_temp.check_dell_storage_temp(SAMPLE_OBJECTS[0].name, params, {SAMPLE_OBJECTS[0].name: SAMPLE_OBJECTS[0]}))
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- encoding: utf-8; py-indent-offset: 4 -*-
+#
+# checkmk_dell_storage - Checkmk extension for Dell Storage API
+#
+# Copyright (C) 2021-2024  Marius Rieder <marius.rieder@durchmesser.ch>
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+import pytest  # type: ignore[import]
+from cmk.agent_based.v2 import (
+    Metric,
+    Result,
+    Service,
+    State,
+)
+from cmk_addons.plugins.dell_storage.agent_based import (
+    dell_storage_disk,
+    dell_storage_top,
+    dell_storage_volume,
+)
+
+VOLUME_SECTION = dell_storage_volume.parse_dell_storage_volume([
+    ['SAN-LUN01', 'Up', '', '420166500352', '2748779069440', '0', '0', '0.0', '1', '1024', '5.6e-05'],
+    ['SAN-LUN02(6)', 'Up', '', '3607283892224', '6597069766656', '14', '292864', '0.002162', '117', '1913856', '0.000857'],
+    ['SAN-LUN03', 'Up', '', '3607283892224', '6597069766656', '', '', '', '', '', ''],
+])
+
+DISK_SECTION = dell_storage_disk.parse_dell_storage_disk([
+    ['01-16', 'Up', '', '360081014784', '1800360124416', '1', '49152', '0.003444', '2', '14336', '0.0'],
+    ['01-08', 'Up', '', '1661088579584', '1800360124416', '4', '121856', '0.003447', '2', '22528', '0.0'],
+])
+
+
+@pytest.mark.parametrize('volumes, disks, result', [
+    (None, None, []),
+    (dell_storage_volume.parse_dell_storage_volume([]), None, []),
+    (VOLUME_SECTION, None, [Service()]),
+    (None, DISK_SECTION, [Service()]),
+])
+def test_discovery_dell_storage_top(volumes, disks, result):
+    assert list(dell_storage_top.discovery_dell_storage_top(volumes, disks)) == result
+
+
+def test_check_dell_storage_top_volume():
+    assert list(dell_storage_top.check_dell_storage_top({'count': 1}, VOLUME_SECTION, None)) == [
+        Result(state=State.OK, summary='Top 1 volumes: 99.24% of operations'),
+        Metric('dell_storage_top_volume_iops_share', 131 / 132 * 100, boundaries=(0, 100)),
+        Result(state=State.OK, notice='Top volumes by operations: SAN-LUN02(6) 131.00/s'),
+        Result(state=State.OK, summary='Top 1 volumes: 99.95% of throughput'),
+        Metric('dell_storage_top_volume_throughput_share', 2206720 / 2207744 * 100, boundaries=(0, 100)),
+        Result(state=State.OK, notice='Top volumes by throughput: SAN-LUN02(6) 2.21 MB/s'),
+        Result(state=State.OK, notice='Top volumes by latency: SAN-LUN02(6) 996 microseconds'),
+    ]
+
+
+def test_check_dell_storage_top_disk():
+    result = list(dell_storage_top.check_dell_storage_top({'count': 5}, None, DISK_SECTION))
+
+    assert Result(state=State.OK, summary='Top 2 disks: 100.00% of operations') in result
+    assert Result(state=State.OK, notice='Top disks by operations: 01-08 6.00/s, 01-16 3.00/s') in result
+    assert [m.name for m in result if isinstance(m, Metric)] == [
+        'dell_storage_top_disk_iops_share',
+        'dell_storage_top_disk_throughput_share',
+    ]
@@ -39,53 +39,54 @@ SAMPLE_STRING_TABLE = [
     ['SAN-LUN03', 'Up', '', '3607283892224', '6597069766656', '', '', '', '', '', ''],
 ]
 
-SAMPLE_SECTION = [
+SAMPLE_OBJECTS = [
     dell_storage_volume.ScVolume(
         name='SAN-LUN01',
         status='Up',
         statusMessage='',
-        activeSpace='420166500352',
-        configuredSpace='2748779069440',
-        readIops='0',
-        readBps='0',
-        readLatency='0.0',
-        writeIops='1',
-        writeBps='1024',
-        writeLatency='5.6e-05',
+        activeSpace=420166500352,
+        configuredSpace=2748779069440,
+        readIops=0,
+        readBps=0,
+        readLatency=0.0,
+        writeIops=1,
+        writeBps=1024,
+        writeLatency=5.6e-05,
     ),
     dell_storage_volume.ScVolume(
         name='SAN-LUN02(6)',
         status='Up',
         statusMessage='',
-        activeSpace='3607283892224',
-        configuredSpace='6597069766656',
-        readIops='14',
-        readBps='292864',
-        readLatency='0.002162',
-        writeIops='117',
-        writeBps='1913856',
-        writeLatency='0.000857',
+        activeSpace=3607283892224,
+        configuredSpace=6597069766656,
+        readIops=14,
+        readBps=292864,
+        readLatency=0.002162,
+        writeIops=117,
+        writeBps=1913856,
+        writeLatency=0.000857,
     ),
     dell_storage_volume.ScVolume(
         name='SAN-LUN03',
         status='Up',
         statusMessage='',
-        activeSpace='3607283892224',
-        configuredSpace='6597069766656',
-        readIops='',
-        readBps='',
-        readLatency='',
-        writeIops='',
-        writeBps='',
-        writeLatency='',
+        activeSpace=3607283892224,
+        configuredSpace=6597069766656,
+        readIops=None,
+        readBps=None,
+        readLatency=None,
+        writeIops=None,
+        writeBps=None,
+        writeLatency=None,
     ),
 ]
+SAMPLE_SECTION = {obj.name: obj for obj in SAMPLE_OBJECTS}
 
 
 @pytest.mark.parametrize('string_table, result', [
     (
         [SAMPLE_STRING_TABLE[0]],
-        [SAMPLE_SECTION[0]]
+        {SAMPLE_OBJECTS[0].name: SAMPLE_OBJECTS[0]}
     ),
     (
         SAMPLE_STRING_TABLE,
@@ -93,21 +94,21 @@ SAMPLE_SECTION = [
     ),
 ])
 def test_parse_dell_storage_volume(string_table, result):
-    assert list(dell_storage_volume.parse_dell_storage_volume(string_table)) == result
+    assert dell_storage_volume.parse_dell_storage_volume(string_table) == result
 
 
 @pytest.mark.parametrize('section, result', [
-    ([], []),
+    ({}, []),
     (
-        [SAMPLE_SECTION[0]],
-        [Service(item=SAMPLE_SECTION[0].name)]
+        {SAMPLE_OBJECTS[0].name: SAMPLE_OBJECTS[0]},
+        [Service(item=SAMPLE_OBJECTS[0].name)]
     ),
     (
         SAMPLE_SECTION,
         [
-            Service(item=SAMPLE_SECTION[0].name),
-            Service(item=SAMPLE_SECTION[1].name),
-            Service(item=SAMPLE_SECTION[2].name),
+            Service(item=SAMPLE_OBJECTS[0].name),
+            Service(item=SAMPLE_OBJECTS[1].name),
+            Service(item=SAMPLE_OBJECTS[2].name),
         ]
     ),
 ])
@@ -116,10 +117,10 @@ def test_discovery_dell_storage_volume(section, result):
 
 
 @pytest.mark.parametrize('item, section, result', [
-    ('', [], []),
+    ('', {}, []),
     ('01-08', SAMPLE_SECTION, []),
     (
-        SAMPLE_SECTION[1].name,
+        SAMPLE_OBJECTS[1].name,
         SAMPLE_SECTION,
         [
             Result(state=State.OK, summary='Up'),
@@ -139,7 +140,7 @@ def test_discovery_dell_storage_volume(section, result):
         ]
     ),
     (
-        SAMPLE_SECTION[2].name,
+        SAMPLE_OBJECTS[2].name,
         SAMPLE_SECTION,
         [
             Result(state=State.OK, summary='Up'),
@@ -153,6 +154,14 @@ def test_check_dell_storage_volume(item, section, result, monkeypatch):
     assert list(dell_storage_volume.check_dell_storage_volume(item, {}, section)) == result
 
 
+@pytest.mark.parametrize('item', [SAMPLE_OBJECTS[1].name, SAMPLE_OBJECTS[2].name])
+def test_check_dell_storage_volume_parsed(item, monkeypatch):
+    monkeypatch.setattr(dell_storage_volume, 'get_value_store', get_value_store)
+    parsed = dell_storage_volume.parse_dell_storage_volume(SAMPLE_STRING_TABLE)
+
+    assert list(dell_storage_volume.check_dell_storage_volume(item, {}, parsed)) == list(dell_storage_volume.check_dell_storage_volume(item, {}, SAMPLE_SECTION))
+
+
 @pytest.mark.parametrize('params, result', [
     (
         {'read_throughput': (1_000_000, 2_000_000)},
@@ -230,4 +239,137 @@ def test_check_dell_storage_volume(item, section, result, monkeypatch):
 def test_check_dell_storage_volume_w_param(params, result, monkeypatch):
     monkeypatch.setattr(dell_storage_volume, 'get_value_store', get_value_store)
 
-    assert result in list(dell_storage_volume.check_dell_storage_volume(SAMPLE_SECTION[1].name, params, [SAMPLE_SECTION[1]]))
+    assert result in list(dell_storage_volume.check_dell_storage_volume(SAMPLE_OBJECTS[1].name, params, {SAMPLE_OBJECTS[1].name: SAMPLE_OBJECTS[1]}))
+
+
+@pytest.mark.parametrize('string_table, result', [
+    ([], []),
+    (SAMPLE_STRING_TABLE, [Service(item='SUMMARY')]),
+])
+def test_discovery_dell_storage_center_io(string_table, result):
+    section = dell_storage_volume.parse_dell_storage_volume(string_table)
+    assert list(dell_storage_volume.discovery_dell_storage_center_io(section)) == result
+
+
+def test_check_dell_storage_center_io(monkeypatch):
+    monkeypatch.setattr(dell_storage_volume, 'get_value_store', get_value_store)
+    section = dell_storage_volume.parse_dell_storage_volume(SAMPLE_STRING_TABLE)
+
+    result = list(dell_storage_volume.check_dell_storage_center_io('SUMMARY', {}, section))
+    assert result[0] == Result(state=State.OK, notice='Volumes with IO usage: 2 of 3')
+    assert Result(state=State.OK, summary='Read: 293 kB/s') in result
+    assert Result(state=State.OK, notice='Write operations: 118.00/s') in result
+    assert [m.name for m in result if isinstance(m, Metric)] == [
+        'disk_read_throughput',
+        'disk_write_throughput',
+        'disk_read_ios',
+        'disk_write_ios',
+        'disk_read_latency',
+        'disk_write_latency',
+    ]
+
+
+def test_check_dell_storage_center_io_no_io(monkeypatch):
+    monkeypatch.setattr(dell_storage_volume, 'get_value_store', get_value_store)
+    section = dell_storage_volume.parse_dell_storage_volume(SAMPLE_STRING_TABLE[2:])
+
+    assert list(dell_storage_volume.check_dell_storage_center_io('SUMMARY', {}, section)) == [
+        Result(state=State.OK, notice='Volumes with IO usage: 0 of 1'),
+    ]
+
+
+@pytest.mark.parametrize('string_table, result', [
+    ([], []),
+    (SAMPLE_STRING_TABLE, [Service()]),
+])
+def test_discovery_dell_storage_center_latency(string_table, result):
+    section = dell_storage_volume.parse_dell_storage_volume(string_table)
+    assert list(dell_storage_volume.discovery_dell_storage_center_latency(section)) == result
+
+
+def test_check_dell_storage_center_latency():
+    section = dell_storage_volume.parse_dell_storage_volume(SAMPLE_STRING_TABLE)
+
+    assert list(dell_storage_volume.check_dell_storage_center_latency({}, section)) == [
+        Result(state=State.OK, notice='Read latency p50: 2 milliseconds'),
+        Metric('dell_storage_read_latency_p50', 0.002162),
+        Result(state=State.OK, notice='Read latency p90: 2 milliseconds'),
+        Metric('dell_storage_read_latency_p90', 0.002162),
+        Result(state=State.OK, summary='Read latency p99: 2 milliseconds'),
+        Metric('dell_storage_read_latency_p99', 0.002162),
+        Result(state=State.OK, notice='Read latency max: 2 milliseconds'),
+        Metric('dell_storage_read_latency_max', 0.002162),
+        Result(state=State.OK, notice='Slowest read volumes: SAN-LUN02(6) 2 milliseconds'),
+        Result(state=State.OK, notice='Write latency p50: 56 microseconds'),
+        Metric('dell_storage_write_latency_p50', 5.6e-05),
+        Result(state=State.OK, notice='Write latency p90: 857 microseconds'),
+        Metric('dell_storage_write_latency_p90', 0.000857),
+        Result(state=State.OK, summary='Write latency p99: 857 microseconds'),
+        Metric('dell_storage_write_latency_p99', 0.000857),
+        Result(state=State.OK, notice='Write latency max: 857 microseconds'),
+        Metric('dell_storage_write_latency_max', 0.000857),
+        Result(state=State.OK, notice='Slowest write volumes: SAN-LUN02(6) 857 microseconds, SAN-LUN01 56 microseconds'),
+    ]
+
+
+def test_check_dell_storage_center_latency_w_param():
+    section = dell_storage_volume.parse_dell_storage_volume(SAMPLE_STRING_TABLE)
+    params = {'read_p99': ('fixed', (0.001, 0.002))}
+
+    assert Result(
+        state=State.CRIT,
+        summary='Read latency p99: 2 milliseconds (warn/crit at 1 millisecond/2 milliseconds)',
+    ) in list(dell_storage_volume.check_dell_storage_center_latency(params, section))
+
+
+def test_check_dell_storage_center_latency_no_io():
+    section = dell_storage_volume.parse_dell_storage_volume(SAMPLE_STRING_TABLE[2:])
+
+    assert list(dell_storage_volume.check_dell_storage_center_latency({}, section)) == [
+        Result(state=State.OK, notice='No volume with read operations'),
+        Result(state=State.OK, notice='No volume with write operations'),
+    ]
+
+
+PEAK_STRING_TABLE = [
+    ['SAN-LUN2', 'Up', '', '3673669238784', '6597069766656', '33.0', '1674240.0', '0.003017', '153.0', '3647488.0', '0.001',
+     '17.0', '49.0', '624640.0', '2723840.0', '0.002454', '0.00358', '128.0', '178.0', '2139136.0', '5155840.0', '0.000768', '0.001232'],
+    SAMPLE_STRING_TABLE[0],
+]
+
+
+def test_discovery_dell_storage_volume_latency_peak():
+    section = dell_storage_volume.parse_dell_storage_volume(PEAK_STRING_TABLE)
+    assert section['SAN-LUN2'].readLatencyMax == 0.00358
+
+    assert list(dell_storage_volume.discovery_dell_storage_volume_latency_peak(section)) == [Service(item='SAN-LUN2')]
+
+
+@pytest.mark.parametrize('item, params, result', [
+    ('SAN-LUN4', {}, []),
+    (
+        'SAN-LUN2',
+        {'read_latency_peak': ('fixed', (0.003, 0.005))},
+        [
+            Result(state=State.WARN, summary='Read latency peak: 4 milliseconds (warn/crit at 3 milliseconds/5 milliseconds)'),
+            Metric('dell_storage_read_latency_peak', 0.00358, levels=(0.003, 0.005)),
+            Result(state=State.OK, summary='Write latency peak: 1 millisecond'),
+            Metric('dell_storage_write_latency_peak', 0.001232),
+        ]
+    ),
+    ('SAN-LUN01', {}, [Result(state=State.OK, summary='No IO usage reported')]),
+])
+def test_check_dell_storage_volume_latency_peak(item, params, result):
+    section = dell_storage_volume.parse_dell_storage_volume(PEAK_STRING_TABLE)
+
+    assert list(dell_storage_volume.check_dell_storage_volume_latency_peak(item, params, section)) == result
+
+
+def test_check_dell_storage_volume_no_usage(monkeypatch):
+    monkeypatch.setattr(dell_storage_volume, 'get_value_store', get_value_store)
+    section = dell_storage_volume.parse_dell_storage_volume([['SAN-LUN04', 'Up', '', '', '', '', '', '', '', '', '']])
+    assert section['SAN-LUN04'].activeSpace is None
+
+    assert list(dell_storage_volume.check_dell_storage_volume('SAN-LUN04', {}, section)) == [
+        Result(state=State.OK, summary='Up'),
+    ]
@@ -19,12 +19,27 @@
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 
+import datetime
+import json
+import time
 import pytest  # type: ignore[import]
-import requests  # noqa: F401
+import os
+import re
+import requests
+from concurrent.futures import ThreadPoolExecutor
 
 from cmk_addons.plugins.dell_storage.lib.agent import (
+    AgentDellStorage,
     DellStorageApi,
-    DellStorageApiParser
+    DellStorageCache,
+    DellStorageRecorder,
+    DellStorageReplayAdapter,
+    DellStorageApiParser,
+    EndpointStats,
+    PollingScheduler,
+    PrefetchPlanner,
+    SECTIONS,
+    iter_json_array,
 )
 
 
@@ -59,10 +74,183 @@ class TestDellStorageApiParser:
         assert DellStorageApiParser.space(value) == result
 
 
+class TestIterJsonArray:
+    DATA = [dict(name='Ambient', currentTemperature='19 °C / 66 °F'), dict(name='Midplane', values=[1, {'a': None}]), 42, 'x']
+
+    @pytest.mark.parametrize('chunk_size', [1, 2, 7, 4096])
+    def test_chunks(self, chunk_size):
+        body = json.dumps(self.DATA, indent=4, ensure_ascii=False).encode('utf-8')
+        chunks = [body[i:i + chunk_size] for i in range(0, len(body), chunk_size)]
+        assert list(iter_json_array(chunks)) == self.DATA
+
+    @pytest.mark.parametrize('body', [b'[]', b' [ ] ', b'\n[\n]\n'])
+    def test_empty(self, body):
+        assert list(iter_json_array([body])) == []
+
+    @pytest.mark.parametrize('body', [b'', b'{}', b'[1 2]', b'[{"a": 1}', b'[{"a": 1},'])
+    def test_invalid(self, body):
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_json_array([body]))
+
+
+class TestDellStorageCache:
+    CHASSIS = dict(objectType='ScChassis', instanceId='1')
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return DellStorageCache(str(tmp_path / 'cache' / 'dsm.json'), dict(ScChassis=60))
+
+    def test_miss(self, cache):
+        assert cache.get('/Chassis') is None
+        assert cache.hits == 0
+
+    def test_hit(self, cache):
+        cache.set('/Chassis', self.CHASSIS)
+        assert cache.get('/Chassis') == self.CHASSIS
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_uncached_type(self, cache):
+        cache.set('/Volumes', [dict(objectType='ScVolume')])
+        assert cache.get('/Volumes') is None
+        assert cache.misses == 0
+
+    def test_expired(self, cache, monkeypatch):
+        cache.set('/Chassis', self.CHASSIS)
+        now = time.time()
+        monkeypatch.setattr(time, 'time', lambda: now + 120)
+        assert cache.get('/Chassis') is None
+
+    def test_set_stream(self, cache):
+        objs = cache.set('/Chassis', iter([self.CHASSIS]))
+        assert cache.get('/Chassis') is None
+        assert list(objs) == [self.CHASSIS]
+        assert cache.get('/Chassis') == [self.CHASSIS]
+
+    def test_save(self, cache, tmp_path):
+        cache.set('/Chassis', self.CHASSIS)
+        cache.save()
+
+        cache = DellStorageCache(str(tmp_path / 'cache' / 'dsm.json'), dict(ScChassis=60))
+        assert cache.get('/Chassis') == self.CHASSIS
+
+
 LOGIN_RESP = dict(provider='PRO', providerVersion='VERS', instanceId='123')
 STORAGE_CENTERS = [dict(a=1)]
 
 
+class TestPollingScheduler:
+    @pytest.fixture
+    def path(self, tmp_path):
+        return str(tmp_path / 'schedule')
+
+    def test_due(self, path):
+        scheduler = PollingScheduler(path, {'ScControllerFanSensor': 3600})
+        assert scheduler.due('ScControllerFanSensor')
+        assert scheduler.due('ScVolumeIoUsage')
+        assert scheduler.interval('ScControllerFanSensor') == 3600
+        assert scheduler.interval('ScVolumeIoUsage') is None
+
+    def test_replay(self, path):
+        scheduler = PollingScheduler(path, {'ScControllerFanSensor': 3600})
+        scheduler.store('SAN/dell_storage_fan', 'ScControllerFanSensor', ['Fan;Up;'])
+        scheduler.save()
+
+        scheduler = PollingScheduler(path, {'ScControllerFanSensor': 3600})
+        assert not scheduler.due('ScControllerFanSensor')
+        assert scheduler.replay('SAN/dell_storage_fan')['rows'] == ['Fan;Up;']
+        assert scheduler.replay('SAN/dell_storage_psu') is None
+
+    def test_save_only_stored(self, path):
+        scheduler = PollingScheduler(path, {'ScControllerFanSensor': 3600, 'ScControllerPowerSupply': 3600})
+        scheduler.store('SAN/dell_storage_fan', 'ScControllerFanSensor', ['Fan;Up;'])
+        scheduler.save()
+
+        scheduler = PollingScheduler(path, {'ScControllerFanSensor': 3600, 'ScControllerPowerSupply': 3600})
+        assert not scheduler.due('ScControllerFanSensor')
+        assert scheduler.due('ScControllerPowerSupply')
+
+    def test_save_failed_refresh(self, path):
+        scheduler = PollingScheduler(path, {'ScControllerFanSensor': 3600})
+        scheduler.store('SAN/dell_storage_fan', 'ScControllerFanSensor', ['Fan;Up;'])
+        scheduler.save(complete=False)
+
+        scheduler = PollingScheduler(path, {'ScControllerFanSensor': 3600})
+        assert scheduler.due('ScControllerFanSensor')
+        assert scheduler.replay('SAN/dell_storage_fan')['rows'] == ['Fan;Up;']
+
+    def test_interval_elapsed(self, path):
+        with open(path, 'w') as fd:
+            json.dump(dict(refreshed={'ScControllerFanSensor': time.time() - 3600}, sections={}), fd)
+
+        assert PollingScheduler(path, {'ScControllerFanSensor': 3600}).due('ScControllerFanSensor')
+
+    def test_save_expires_sections(self, path):
+        with open(path, 'w') as fd:
+            json.dump(dict(refreshed={}, sections={'old': dict(time=time.time() - 7200, rows=[])}), fd)
+
+        PollingScheduler(path, {'ScControllerFanSensor': 3600}).save()
+        with open(path) as fd:
+            assert json.load(fd)['sections'] == {}
+
+
+class TestDellStorageRecorder:
+    def test_scrub(self):
+        data = [{'userName': 'admin', 'sessionKey': 42, 'nested': {'secureString': 'secret'}, 'foo': 'bar'}]
+        assert DellStorageRecorder.scrub(data) == [{'userName': 'user', 'sessionKey': 0, 'nested': {'secureString': ''}, 'foo': 'bar'}]
+
+    def test_record(self, tmp_path):
+        recorder = DellStorageRecorder(str(tmp_path))
+        recorder.record('/StorageCenter/ScVolume/1/StorageUsage', b'{"foo": "bar"}', 0.5)
+        recorder.record('/ApiConnection/Logout', b'', 0.1)
+        recorder.save()
+
+        with open(tmp_path / 'StorageCenter/ScVolume/1/StorageUsage') as fd:
+            assert json.load(fd) == {'foo': 'bar'}
+        with open(tmp_path / '.timings.json') as fd:
+            assert json.load(fd) == {'StorageCenter/ScVolume/1/StorageUsage': 0.5, 'ApiConnection/Logout': 0.1}
+
+    def test_record_outside(self, tmp_path):
+        with pytest.raises(ValueError):
+            DellStorageRecorder(str(tmp_path / 'record')).record('/../escape', b'{}', 0.1)
+
+    def test_replay(self, tmp_path):
+        recorder = DellStorageRecorder(str(tmp_path))
+        recorder.record('/StorageCenter/ScVolume/1/StorageUsage', b'{"foo": "bar"}', 0.2)
+        recorder.save()
+
+        session = requests.Session()
+        session.mount('http://', DellStorageReplayAdapter(str(tmp_path), 'http://dsa:3033/rest/api', 0.5))
+        start = time.monotonic()
+        resp = session.get('http://dsa:3033/rest/api/StorageCenter/ScVolume/1/StorageUsage')
+        assert time.monotonic() - start >= 0.1
+        assert resp.json() == {'foo': 'bar'}
+        assert session.get('http://dsa:3033/rest/api/StorageCenter/ScVolume/2/StorageUsage').status_code == 404
+
+
+class TestEndpointStats:
+    @pytest.mark.parametrize('call, endpoint', [
+        ('/ApiConnection/Login', 'ApiConnection/Login'),
+        ('/ApiConnection/ApiConnection/0/StorageCenterList', 'ApiConnection/StorageCenterList'),
+        ('/StorageCenter/StorageCenter/123/VolumeList', 'StorageCenter/VolumeList'),
+        ('/StorageCenter/ScVolume/123.45/GetHistoricalIoUsage', 'ScVolume/GetHistoricalIoUsage'),
+    ])
+    def test_endpoint(self, call, endpoint):
+        assert EndpointStats.endpoint(call) == endpoint
+
+    def test_stats(self):
+        stats = EndpointStats()
+        for duration in range(1, 21):
+            stats.add(duration / 10, 100, 0.5)
+        assert stats.count == 20
+        assert stats.total == pytest.approx(21.0)
+        assert stats.max == 2.0
+        assert stats.p95 == 1.9
+        assert str(stats) == '20;21.000000;2.000000;1.900000;2000;10.000000'
+
+    def test_empty(self):
+        assert str(EndpointStats()) == '0;0.000000;0.000000;0.000000;0;0.000000'
+
+
 class TestDellStorageApi:
     @pytest.fixture
     def api(self, requests_mock):
@@ -81,6 +269,66 @@ class TestDellStorageApi:
     def test_url(self, api, call, result):
         assert api.url(call) == result
 
+    def test_session_restore(self, requests_mock, tmp_path):
+        requests_mock.post('http://dsa:3033/rest/api/ApiConnection/Login', json=LOGIN_RESP)
+        session_file = str(tmp_path / 'dsm.session')
+
+        api = DellStorageApi('http://dsa:3033/rest/api', 'user', 'pass', True, session_file=session_file)
+        api._connection.cookies.set('JSESSIONID', 'abc')
+        api._save_session()
+        api = DellStorageApi('http://dsa:3033/rest/api', 'user', 'pass', True, session_file=session_file)
+
+        assert requests_mock.call_count == 1
+        assert api._connection.cookies['JSESSIONID'] == 'abc'
+        assert api.provider == 'PRO'
+        assert os.stat(session_file).st_mode & 0o777 == 0o600
+
+    @pytest.mark.parametrize('content', [
+        'not json',
+        '[]',
+        '{"api": {"provider": "PRO", "providerVersion": "1"}}',
+        '{"cookies": {"JSESSIONID": "abc"}}',
+        '{"cookies": ["JSESSIONID"], "api": {"provider": "PRO", "providerVersion": "1"}}',
+        '{"cookies": {}, "api": {"provider": "PRO"}}',
+        '{"cookies": {}, "api": null}',
+    ])
+    def test_session_restore_broken(self, requests_mock, tmp_path, content):
+        requests_mock.post('http://dsa:3033/rest/api/ApiConnection/Login', json=LOGIN_RESP)
+        session_file = tmp_path / 'dsm.session'
+        session_file.write_text(content)
+
+        api = DellStorageApi('http://dsa:3033/rest/api', 'user', 'pass', True, session_file=str(session_file))
+
+        assert requests_mock.call_count == 1
+        assert api._session_restored is False
+        assert api.provider == 'PRO'
+
+    def test_session_relogin(self, requests_mock, tmp_path):
+        requests_mock.post('http://dsa:3033/rest/api/ApiConnection/Login', json=LOGIN_RESP)
+        requests_mock.get('http://dsa:3033/rest/api/PyTest', [dict(status_code=401), dict(json=dict(foo='bar'))])
+        session_file = str(tmp_path / 'dsm.session')
+
+        DellStorageApi('http://dsa:3033/rest/api', 'user', 'pass', True, session_file=session_file)
+        api = DellStorageApi('http://dsa:3033/rest/api', 'user', 'pass', True, session_file=session_file)
+
+        assert api.get('PyTest') == dict(foo='bar')
+        assert [r.path for r in requests_mock.request_history] == [
+            '/rest/api/apiconnection/login', '/rest/api/pytest', '/rest/api/apiconnection/login', '/rest/api/pytest'
+        ]
+
+    def test_no_relogin_without_session(self, api, requests_mock):
+        requests_mock.get('http://dsa:3033/rest/api/PyTest', status_code=401)
+
+        with pytest.raises(requests.HTTPError):
+            api.get('PyTest')
+
+    def test_login_bad_credentials(self, requests_mock):
+        requests_mock.post('http://dsa:3033/rest/api/ApiConnection/Login', status_code=401)
+
+        with pytest.raises(requests.HTTPError, match='401'):
+            DellStorageApi('http://dsa:3033/rest/api', 'user', 'wrong', True)
+        assert requests_mock.call_count == 1
+
     def test_storage_centers(self, api, requests_mock):
         assert isinstance(api.storage_centers[0], DellStorageApi.StorageCenter)
 
@@ -95,12 +343,189 @@ class TestDellStorageApi:
         requests_mock.get('http://dsa:3033/rest/api/PyTest', json=dict(foo='bar'))
 
         assert api.get('PyTest') == dict(foo='bar')
+        assert requests_mock.last_request.timeout == (10, 60)
+
+    def test_adapter(self, api):
+        assert api._connection.get_adapter('https://dsa:3033/') is api._adapter
+        assert api._adapter._pool_maxsize == 10
+        assert api._adapter._pool_block is True
+
+    def test_resize_pool(self, api):
+        api.resize_pool(5)
+        assert api._adapter.poolmanager.connection_pool_kw['maxsize'] == 10
+        api.resize_pool(30)
+        assert api._adapter.poolmanager.connection_pool_kw['maxsize'] == 30
+        assert api._adapter.poolmanager.connection_pool_kw['block'] is True
+
+    def test_get_stream(self, api, requests_mock):
+        requests_mock.get('http://dsa:3033/rest/api/PyTest', json=[dict(foo='bar'), dict(foo='baz')])
+
+        assert list(api.get('PyTest', stream=True)) == [dict(foo='bar'), dict(foo='baz')]
+
+    def test_get_associations_stream(self, api, requests_mock):
+        requests_mock.get('http://dsa:3033/rest/api/PyTest', json=[dict(objectType='ScChassis', instanceId='1', instanceName='SAN')])
+        api._stream = True
+
+        chassis, = api._get_associations('PyTest')
+        assert isinstance(chassis, DellStorageApi.ScChassis)
+        assert chassis.instanceName == 'SAN'
+
+    def test_endpoints(self, api, requests_mock):
+        requests_mock.get('http://dsa:3033/rest/api/StorageCenter/ScVolume/1/StorageUsage', text='{"foo": "bar"}')
+        requests_mock.get('http://dsa:3033/rest/api/StorageCenter/ScVolume/2/StorageUsage', text='[1, 2]')
+        api.get('/StorageCenter/ScVolume/1/StorageUsage')
+        list(api.get('/StorageCenter/ScVolume/2/StorageUsage', stream=True))
+
+        stats = api.endpoints['ScVolume/StorageUsage']
+        assert stats.count == 2
+        assert stats.size == 20
+        assert api.endpoints['ApiConnection/Login'].count == 1
+
+    def test_instanciate_identity(self, api):
+        first = api._instanciate(dict(objectType='ScEnclosure', instanceId='1', instanceName='Enclosure - 1'))
+        second = api._instanciate(dict(objectType='ScEnclosure', instanceId='1', instanceName='Enclosure - 1'))
+        other = api._instanciate(dict(objectType='ScEnclosure', instanceId='2', instanceName='Enclosure - 2'))
+
+        assert first is second
+        assert first is not other
+        assert api.duplicates == 1
+
+    def test_instanciate_without_associations(self, api):
+        first = api._instanciate(dict(objectType='ScAlert', instanceId='1', message='foo'))
+        second = api._instanciate(dict(objectType='ScAlert', instanceId='1', message='bar'))
+
+        assert first is not second
+        assert api.duplicates == 0
+
+    def test_skip_without_deadline(self, api):
+        assert not api.skip(DellStorageApi.ScDisk, 'iousage')
+
+    @pytest.mark.parametrize('remaining, association, skipped', [
+        (50, 'iousage', False),
+        (20, 'usage', False),
+        (20, 'iousage', True),
+        (-1, 'usage', True),
+    ])
+    def test_skip(self, requests_mock, remaining, association, skipped):
+        requests_mock.post('http://dsa:3033/rest/api/ApiConnection/Login', json=LOGIN_RESP)
+        api = DellStorageApi('http://dsa:3033/rest/api', 'user', 'pass', True, deadline=100)
+        api._deadline = time.monotonic() + remaining
+
+        assert api.skip(DellStorageApi.ScDisk, association) == skipped
+        assert api.skipped == int(skipped)
+
+    def test_skipped_association(self, requests_mock):
+        requests_mock.post('http://dsa:3033/rest/api/ApiConnection/Login', json=LOGIN_RESP)
+        api = DellStorageApi('http://dsa:3033/rest/api', 'user', 'pass', True, deadline=100)
+        api._deadline = time.monotonic()
+
+        storageCenter = DellStorageApi.StorageCenter(api, instanceId='1', chassisPresent=True)
+        assert storageCenter.controllers == []
+        assert storageCenter.chassi is None
+        assert DellStorageApi.StorageCenter.association_type('controllers') == (DellStorageApi.ScController, True)
+
+    def test_request_timeout_deadline(self, requests_mock):
+        requests_mock.post('http://dsa:3033/rest/api/ApiConnection/Login', json=LOGIN_RESP)
+        requests_mock.get('http://dsa:3033/rest/api/PyTest', json=dict(foo='bar'))
+        api = DellStorageApi('http://dsa:3033/rest/api', 'user', 'pass', True, deadline=100)
+        assert requests_mock.last_request.timeout[1] <= 60
+
+        api._deadline = time.monotonic() + 5
+        api.get('PyTest')
+        connect, read = requests_mock.last_request.timeout
+        assert 0 < connect <= 5 and 0 < read <= 5
+
+        api._deadline = time.monotonic()
+        with pytest.raises(requests.Timeout):
+            api.get('PyTest')
+
+    def test_association_timeout_after_deadline(self, requests_mock):
+        requests_mock.post('http://dsa:3033/rest/api/ApiConnection/Login', json=LOGIN_RESP)
+        requests_mock.get('http://dsa:3033/rest/api/StorageCenter/StorageCenter/1/ControllerList', exc=requests.ReadTimeout)
+        api = DellStorageApi('http://dsa:3033/rest/api', 'user', 'pass', True, deadline=100)
+        storageCenter = DellStorageApi.StorageCenter(api, instanceId='1')
+
+        with pytest.raises(requests.ReadTimeout):
+            storageCenter.controllers
+
+        def expire(request, context):
+            api._deadline = time.monotonic()
+            raise requests.ReadTimeout()
+
+        requests_mock.get('http://dsa:3033/rest/api/StorageCenter/StorageCenter/1/ControllerList', json=expire)
+        assert storageCenter.controllers == []
+        assert api.skipped == 1
 
     def test_post(self, api, requests_mock):
         requests_mock.post('http://dsa:3033/rest/api/PyTest', json=dict(foo='bar'))
 
         assert api.post('PyTest', payload=None) == dict(foo='bar')
 
+    def test_historical_filter(self, api):
+        historical_filter = api.historical_filter()['HistoricalFilter']
+        start = datetime.datetime.fromisoformat(historical_filter['StartTime'])
+
+        assert 'MaxCountReturn' not in historical_filter
+        assert datetime.timedelta(minutes=9) < datetime.datetime.now() - start < datetime.timedelta(minutes=11)
+
+    def test_historical_filter_samples(self, api):
+        api._historical_samples = 3
+
+        assert api.historical_filter()['HistoricalFilter']['MaxCountReturn'] == 3
+
+    @pytest.mark.parametrize('serial_number, since, minutes', [
+        ('123456', datetime.timedelta(minutes=2), 2),
+        ('123456', datetime.timedelta(minutes=60), 10),
+        ('654321', datetime.timedelta(minutes=2), 10),
+        (None, datetime.timedelta(minutes=2), 10),
+    ])
+    def test_historical_filter_since(self, api, serial_number, since, minutes):
+        api._historical_since = {'123456': datetime.datetime.now() - since}
+        start = datetime.datetime.fromisoformat(api.historical_filter(serial_number)['HistoricalFilter']['StartTime'])
+
+        assert datetime.timedelta(minutes=minutes - 1) < datetime.datetime.now() - start < datetime.timedelta(minutes=minutes + 1)
+
+    def test_historical_association(self, api, requests_mock):
+        requests_mock.post('http://dsa:3033/rest/api/PyTest', json=[
+            dict(objectType='ScVolumeIoUsage', instanceId='1', readIops=10, readKbPerSecond=1, readLatency=1000,
+                 writeIops=1, writeKbPerSecond=2, writeLatency=500),
+            dict(objectType='ScVolumeIoUsage', instanceId='1', readIops=20, readKbPerSecond=3, readLatency=3000,
+                 writeIops=2, writeKbPerSecond=2, writeLatency=100),
+            dict(objectType='ScVolumeIoUsage', instanceId='1', readIops=0, readKbPerSecond=2, readLatency=2000,
+                 writeIops=0, writeKbPerSecond=2, writeLatency=0),
+        ])
+
+        usage = api._get_historical_association('PyTest')
+        assert (usage.readIops, usage.readIopsMin, usage.readIopsMax) == (10, 0, 20)
+        assert (usage.readKbPerSecond, usage.readKbPerSecondMin, usage.readKbPerSecondMax) == (2048, 1024, 3072)
+        assert (usage.readLatencyMin, usage.readLatencyMax) == (0.001, 0.003)
+        assert (usage.writeLatencyMin, usage.writeLatencyMax) == (0.0, 0.0005)
+        assert usage.readLatency == pytest.approx((10 * 0.001 + 20 * 0.003) / 30)
+        assert usage.writeLatency == pytest.approx((1 * 0.0005 + 2 * 0.0001) / 3)
+
+    def test_historical_association_idle(self, api, requests_mock):
+        requests_mock.post('http://dsa:3033/rest/api/PyTest', json=[
+            dict(objectType='ScVolumeIoUsage', instanceId='1', readIops=0, readLatency=0, writeIops=0, writeLatency=0),
+        ])
+
+        usage = api._get_historical_association('PyTest')
+        assert (usage.readLatency, usage.writeLatency) == (0, 0)
+
+    def test_historical_association_empty(self, api, requests_mock):
+        requests_mock.post('http://dsa:3033/rest/api/PyTest', json=[])
+
+        assert api._get_historical_association('PyTest') is None
+
+    def test_historical_filter_per_call(self, api, requests_mock):
+        requests_mock.post('http://dsa:3033/rest/api/PyTest', json=[])
+
+        api._get_historical_association('PyTest')
+        api._historical_window = datetime.timedelta(minutes=5)
+        api._get_historical_association('PyTest')
+
+        first, second = [datetime.datetime.fromisoformat(r.json()['HistoricalFilter']['StartTime']) for r in requests_mock.request_history[-2:]]
+        assert second - first > datetime.timedelta(minutes=4)
+
     def test_provider(self, api):
         assert api.provider == 'PRO'
 
@@ -135,3 +560,110 @@ class TestDellStorageApi:
 
         def test_str_sep(self, apiObject):
             assert apiObject.__str__('-') == 'name-Up--123'
+
+        def test_slots(self, apiObject):
+            assert self.MockApiObject.__slots__ == ('instanceId', 'instanceName', 'status', 'foo', 'bar')
+            assert not hasattr(apiObject, '__dict__')
+
+        def test_slots_cached_property(self, api):
+            assert '__dict__' in DellStorageApi.ScVolume.__slots__
+            assert '__dict__' not in DellStorageApi.ScVolumeIoUsage.__slots__
+
+        def test_str_association(self, api):
+            volume = DellStorageApi.ScVolume(api, instanceName='LUN', status='Up', statusMessage='')
+            volume.__dict__['usage'] = DellStorageApi.ScVolumeStorageUsage(api, activeSpace='1 Bytes', configuredSpace='2 Bytes')
+            volume.__dict__['iousage'] = None
+            assert str(volume) == 'LUN;Up;;1;2' + ';' * 18
+
+        def test_field_type(self):
+            assert DellStorageApi.ScVolume.field_type('instanceName') is str
+            assert DellStorageApi.ScVolume.field_type('iousage.readIops') is float
+            assert DellStorageApi.StorageCenter.field_type('controllers.name') is None
+
+        def test_association_type(self):
+            assert DellStorageApi.ScVolume.association_type('usage') == (DellStorageApi.ScVolumeStorageUsage, False)
+            assert DellStorageApi.StorageCenter.association_type('controllers') == (DellStorageApi.ScController, True)
+            assert DellStorageApi.ScVolume.association_type('instanceName') == (None, False)
+
+        @pytest.mark.parametrize('cls, sections, needed', [
+            (DellStorageApi.StorageCenter, {'dell_storage_temp'}, True),
+            (DellStorageApi.ScVolume, {'dell_storage_temp'}, False),
+            (DellStorageApi.ScChassis, {'dell_storage_center'}, False),
+            (DellStorageApi.ScController, {'dell_storage_port'}, True),
+            (DellStorageApi.ScVolumeIoUsage, {'dell_storage_volume'}, False),
+        ])
+        def test_needed(self, cls, sections, needed):
+            assert cls.needed(sections) == needed
+
+        def test_serializer_compiled_once(self, apiObject):
+            assert self.MockApiObject._serializer is self.MockApiObject._serializer
+            assert '_serialize' not in DellStorageApi.ApiObject.__dict__
+
+
+class TestPrefetchPlanner:
+    @pytest.fixture
+    def api(self, requests_mock):
+        requests_mock.post('http://dsa:3033/rest/api/ApiConnection/Login', json=LOGIN_RESP)
+        return DellStorageApi('http://dsa:3033/rest/api', 'user', 'pass', True)
+
+    def test_plan(self):
+        assert PrefetchPlanner.plan({}) == [1, 7, 14, 3]
+
+    def test_plan_topology(self):
+        assert PrefetchPlanner.plan({'ScController': 2, 'ScVolume': 0}) == [1, 7, 16, 4]
+
+    @pytest.mark.parametrize('sections, result', [
+        ({'dell_storage_volume'}, [1, 1, 2]),
+        (set(SECTIONS) - {'dell_storage_disk', 'dell_storage_volume'}, [1, 6, 11, 1]),
+    ])
+    def test_plan_sections(self, sections, result):
+        assert PrefetchPlanner.plan({}, sections=sections) == result
+
+    def test_run(self, api, requests_mock):
+        controller = DellStorageApi.ScController(api, instanceId='1', instanceName='SN 1')
+        requests_mock.get(re.compile(r'/StorageCenter/ScController/1/\w+List$'), json=[])
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            planner = PrefetchPlanner(executor)
+            planner.run([controller])
+
+        assert planner.requests == 4
+        assert planner.depth == 1
+        assert controller.__dict__['ports'] == []
+
+
+class TestAgentDellStorage:
+    ARGV = ['-u', 'user', '-p', 'pass', '-U', 'http://dsa:3033/rest/api']
+
+    def test_parse_arguments(self):
+        args = AgentDellStorage().parse_arguments(self.ARGV)
+        assert args.workers == 1
+        assert args.cache is True
+        assert args.session_reuse is True
+        assert (args.connect_timeout, args.read_timeout) == (10, 60)
+
+    def test_parse_arguments_workers(self):
+        args = AgentDellStorage().parse_arguments(self.ARGV + ['--workers', '8'])
+        assert args.workers == 8
+
+    def test_parse_arguments_cache_ttl(self):
+        args = AgentDellStorage().parse_arguments(self.ARGV + ['--cache-ttl', 'ScController=3600', '--no-cache'])
+        assert args.cache_ttl == [('ScController', 3600)]
+        assert args.cache is False
+
+    @pytest.mark.parametrize('argv, interval', [
+        ([], None),
+        (['--tiered-polling'], 3600),
+        (['--tiered-polling', '900'], 900),
+    ])
+    def test_parse_arguments_tiered_polling(self, argv, interval):
+        assert AgentDellStorage().parse_arguments(self.ARGV + argv).tiered_polling == interval
+
+    def test_parse_arguments_sections(self):
+        args = AgentDellStorage().parse_arguments(self.ARGV + ['--sections', 'volume,dell_storage_alert', '--exclude-sections', 'disk'])
+        assert args.sections == ['dell_storage_volume', 'dell_storage_alert']
+        assert args.exclude_sections == ['dell_storage_disk']
+
+    def test_parse_arguments_sections_unknown(self):
+        with pytest.raises(SystemExit):
+            AgentDellStorage().parse_arguments(self.ARGV + ['--sections', 'foo'])
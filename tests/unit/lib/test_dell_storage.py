@@ -20,8 +20,9 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 
 import pytest  # type: ignore[import]
-from typing import NamedTuple
+from typing import NamedTuple, Optional
 from cmk.agent_based.v2 import (
+    Metric,
     Result,
     State,
 )
@@ -55,3 +56,238 @@ class MockDsObject(NamedTuple):
 ])
 def test_dsresult(dsobject, result):
     assert list(dell_storage.DSResult(dsobject)) == [result]
+
+
+class MockNamedObject(NamedTuple):
+    name: str
+    status: str = None
+
+
+@pytest.mark.parametrize('string_table, result', [
+    ([], {}),
+    (
+        [['LUN1', 'Up'], ['LUN2', 'Down']],
+        {'LUN1': MockNamedObject('LUN1', 'Up'), 'LUN2': MockNamedObject('LUN2', 'Down')},
+    ),
+    (
+        [['LUN1', 'Up'], ['LUN1', 'Down'], ['LUN1']],
+        {
+            'LUN1': MockNamedObject('LUN1', 'Up'),
+            'LUN1 #2': MockNamedObject('LUN1', 'Down'),
+            'LUN1 #3': MockNamedObject('LUN1'),
+        },
+    ),
+    (
+        [['LUN1 #2', 'Up'], ['LUN1', 'Up'], ['LUN1', 'Down']],
+        {
+            'LUN1 #2': MockNamedObject('LUN1 #2', 'Up'),
+            'LUN1': MockNamedObject('LUN1', 'Up'),
+            'LUN1 #3': MockNamedObject('LUN1', 'Down'),
+        },
+    ),
+])
+def test_dssection(string_table, result):
+    section = dell_storage.DSSection(MockNamedObject, string_table)
+    assert section == result
+    assert list(section) == list(result)
+
+
+@pytest.mark.parametrize('annotation, value, result', [
+    (str, 'None', 'None'),
+    (int, '42', 42),
+    (float, '5.6e-05', 5.6e-05),
+    (Optional[int], '42', 42),
+    (Optional[int], '', None),
+    (Optional[float], 'None', None),
+    (Optional[str], '', ''),
+])
+def test_dscolumn(annotation, value, result):
+    assert dell_storage.DSColumn(annotation)(value) == result
+
+
+@pytest.mark.parametrize('annotation, value', [
+    (int, ''),
+    (int, 'None'),
+    (Optional[int], 'foo'),
+    (Optional[float], '1,5'),
+])
+def test_dscolumn_invalid(annotation, value):
+    with pytest.raises(ValueError):
+        dell_storage.DSColumn(annotation)(value)
+
+
+class MockIoObject(NamedTuple):
+    name: str
+    readIops: Optional[int] = None
+    readBps: Optional[int] = None
+    readLatency: Optional[float] = None
+    writeIops: Optional[int] = None
+    writeBps: Optional[int] = None
+    writeLatency: Optional[float] = None
+
+
+@pytest.mark.parametrize('row, result', [
+    (['LUN1'], MockIoObject('LUN1')),
+    (['LUN1', '', '', '', '', '', ''], MockIoObject('LUN1')),
+    (['LUN1', '14', '292864', '0.002162', '117', '1913856', '0.000857'], MockIoObject('LUN1', 14, 292864, 0.002162, 117, 1913856, 0.000857)),
+])
+def test_dsparser(row, result):
+    assert dell_storage.DSParser(MockIoObject)(row) == result
+
+
+@pytest.mark.parametrize('dsobject, result', [
+    (MockIoObject('LUN1'), None),
+    (MockIoObject('LUN1', 14, 292864, 0.002162, 117, 1913856, None), None),
+    (
+        MockIoObject('LUN1', 14, 292864, 0.002162, 117, 1913856, 0.000857),
+        {
+            'read_ios': 14,
+            'read_throughput': 292864,
+            'read_latency': 0.002162,
+            'write_ios': 117,
+            'write_throughput': 1913856,
+            'write_latency': 0.000857,
+        },
+    ),
+])
+def test_dsio(dsobject, result):
+    assert dell_storage.DSIo(dsobject) == result
+
+
+IO_STRING_TABLE = [
+    ['LUN1', '14', '292864', '0.002162', '117', '1913856', '0.000857'],
+    ['LUN2', '', '', '', '', '', ''],
+    ['LUN1', '0', '0', '0.0', '1', '1024', '5.6e-05'],
+    ['LUN3'],
+]
+
+
+def test_dscolumns():
+    section = dell_storage.DSColumns(MockIoObject, IO_STRING_TABLE)
+
+    assert list(section) == ['LUN1', 'LUN2', 'LUN1 #2', 'LUN3']
+    assert section == {
+        'LUN1': MockIoObject('LUN1', 14, 292864, 0.002162, 117, 1913856, 0.000857),
+        'LUN2': MockIoObject('LUN2'),
+        'LUN1 #2': MockIoObject('LUN1', 0, 0, 0.0, 1, 1024, 5.6e-05),
+        'LUN3': MockIoObject('LUN3'),
+    }
+    assert 'LUN1 #2' in section
+    assert section.get('LUN4') is None
+    assert section['LUN1 #2'].writeBps == 1024
+    assert dell_storage.DSIo(section['LUN1']) == dell_storage.DSIo(section.get('LUN1'))
+    assert dell_storage.DSIo(section['LUN2']) is None
+    with pytest.raises(AttributeError):
+        section['LUN1'].status
+
+
+def test_dscolumns_column():
+    section = dell_storage.DSColumns(MockIoObject, IO_STRING_TABLE)
+
+    assert section.column('name') == ['LUN1', 'LUN2', 'LUN1', 'LUN3']
+    assert section.column('name')[0] is section.column('name')[2]
+    reads = section.column('readIops')
+    assert reads.typecode == 'd'
+    assert [value for value in reads if value == value] == [14, 0]
+
+
+def test_dscolumns_invalid():
+    with pytest.raises(ValueError):
+        dell_storage.DSColumns(MockIoObject, [['LUN1', 'foo']])
+
+
+def test_dsiototal():
+    disk, count = dell_storage.DSIoTotal(dell_storage.DSColumns(MockIoObject, IO_STRING_TABLE))
+
+    assert count == 2
+    assert disk == {
+        'read_ios': 14,
+        'read_throughput': 292864,
+        'read_latency': pytest.approx(0.002162),
+        'write_ios': 118,
+        'write_throughput': 1914880,
+        'write_latency': pytest.approx((117 * 0.000857 + 5.6e-05) / 118),
+    }
+
+
+def test_dsiototal_empty():
+    disk, count = dell_storage.DSIoTotal(dell_storage.DSColumns(MockIoObject, [['LUN2', '', '', '', '', '', '']]))
+
+    assert count == 0
+    assert disk['read_ios'] == 0
+    assert disk['write_latency'] == 0
+
+
+class MockLatencyObject(NamedTuple):
+    name: str
+    readIops: Optional[int] = None
+    readLatency: Optional[float] = None
+
+
+def test_dslatency():
+    section = dell_storage.DSColumns(MockLatencyObject, [
+        [f'LUN{idx}', str(idx % 2), str(idx / 1000)] for idx in range(200)
+    ] + [['LUN-NOIO', '', '']])
+
+    percentiles, worst = dell_storage.DSLatency(section, 'read', worst=3)
+    assert percentiles == {'p50': 0.099, 'p90': 0.179, 'p99': 0.197, 'max': 0.199}
+    assert worst == [('LUN199', 0.199), ('LUN197', 0.197), ('LUN195', 0.195)]
+
+
+def test_dslatency_no_io():
+    section = dell_storage.DSColumns(MockLatencyObject, [['LUN1', '0', '0.0'], ['LUN2', '', '']])
+
+    assert dell_storage.DSLatency(section, 'read') == ({}, [])
+
+
+def test_dstop():
+    section = dell_storage.DSColumns(MockIoObject, IO_STRING_TABLE + [
+        ['LUN4', '1', '512', '0.5', '0', '0', '0.0'],
+    ])
+
+    assert dell_storage.DSTop(section, 2) == {
+        'iops': (pytest.approx(132 / 133), [('LUN1', 131), ('LUN1', 1)]),
+        'throughput': (pytest.approx(2207744 / 2208256), [('LUN1', 2206720), ('LUN1', 1024)]),
+        'latency': (None, [('LUN4', 0.5), ('LUN1', pytest.approx((14 * 0.002162 + 117 * 0.000857) / 131))]),
+    }
+    assert dell_storage.DSTop(section, 10)['iops'] == (1.0, [('LUN1', 131), ('LUN1', 1), ('LUN4', 1)])
+
+
+def test_dstop_no_io():
+    section = dell_storage.DSColumns(MockIoObject, [['LUN2', '', '', '', '', '', '']])
+
+    assert dell_storage.DSTop(section, 5) == {
+        'iops': (0.0, []),
+        'throughput': (0.0, []),
+        'latency': (None, []),
+    }
+
+
+class MockPeakObject(NamedTuple):
+    readLatencyMax: Optional[float] = None
+    writeLatencyMax: Optional[float] = None
+
+
+@pytest.mark.parametrize('dsobject, params, result', [
+    (MockPeakObject(), {}, [Result(state=State.OK, summary='No IO usage reported')]),
+    (
+        MockPeakObject(0.002, 0.0005),
+        {},
+        [
+            Result(state=State.OK, summary='Read latency peak: 2 milliseconds'),
+            Metric('dell_storage_read_latency_peak', 0.002),
+            Result(state=State.OK, summary='Write latency peak: 500 microseconds'),
+            Metric('dell_storage_write_latency_peak', 0.0005),
+        ],
+    ),
+    (
+        MockPeakObject(0.002),
+        {'read_latency_peak': ('fixed', (0.001, 0.005))},
+        [
+            Result(state=State.WARN, summary='Read latency peak: 2 milliseconds (warn/crit at 1 millisecond/5 milliseconds)'),
+            Metric('dell_storage_read_latency_peak', 0.002, levels=(0.001, 0.005)),
+        ],
+    ),
+])
+def test_dslatencypeak(dsobject, params, result):
+    assert list(dell_storage.DSLatencyPeak(dsobject, params)) == result